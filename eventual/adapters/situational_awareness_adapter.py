@@ -34,13 +34,32 @@ context_string = adapter.generate_context(query, recent_time_window=recent_time_
 print("Generated Context for LLM:")
 print(context_string)
 ```
+
+## Caching
+
+Agent loops frequently re-inject the same context every turn, so `generate_context`
+keeps a small LRU cache of generated strings keyed by
+`(query, recent_time_window, hypergraph._version)`. Any mutation made through the
+`Hypergraph` API bumps `_version`, which implicitly invalidates stale entries.
+Results that include recent events additionally expire as soon as the oldest of
+those events falls out of the time window. Call `clear_cache()` after mutating
+concepts or events directly (bypassing the `Hypergraph` API).
 """
+import heapq
+from collections import OrderedDict
+from operator import attrgetter
 from typing import List, Tuple, Optional
-from datetime import timedelta
+from datetime import datetime, timedelta
 from eventual.core.hypergraph import Hypergraph
 from eventual.core.concept import Concept
 from eventual.core.event import Event
 
+_by_timestamp = attrgetter("timestamp")
+
+# The hypergraph methods the adapter calls. Any object providing them (a Hypergraph, a subclass
+# or a test double) is accepted, which is also cheaper than an isinstance check per construction
+_REQUIRED_HYPERGRAPH_METHODS = ("retrieve_knowledge", "retrieve_knowledge_names", "get_recent_events")
+
 class SituationalAwarenessAdapter:
     """
     Adapts hypergraph knowledge into a format suitable for LLM context.
@@ -51,18 +70,41 @@ class SituationalAwarenessAdapter:
 
     Attributes:
         _hypergraph (Hypergraph): The Hypergraph instance to retrieve knowledge from.
+        _cache (OrderedDict[tuple, Tuple[str, Optional[datetime]]]): LRU cache mapping
+            `(query, recent_time_window, hypergraph version)` to the generated context and
+            the time at which it expires (None if it never expires on its own).
+        _cache_max (int): Maximum number of cached contexts.
     """
 
-    def __init__(self, hypergraph: Hypergraph):
+    def __init__(self, hypergraph: Hypergraph, cache_size: int = 128):
         """
         Initialize the SituationalAwarenessAdapter.
 
         Args:
-            hypergraph (Hypergraph): The Hypergraph instance containing the knowledge graph.
+            hypergraph (Hypergraph): The Hypergraph instance containing the knowledge graph. Any object
+                                     with the same `retrieve_knowledge`, `retrieve_knowledge_names` and
+                                     `get_recent_events` methods is accepted.
+            cache_size (int): Maximum number of generated contexts to keep in the LRU cache.
+                              Use 0 to disable caching.
+
+        Raises:
+            TypeError: If `hypergraph` does not provide the methods of a Hypergraph.
         """
-        if not isinstance(hypergraph, Hypergraph):
-            raise TypeError("hypergraph must be an instance of Hypergraph")
+        for method in _REQUIRED_HYPERGRAPH_METHODS:
+            if not hasattr(hypergraph, method):
+                raise TypeError(f"hypergraph must be a Hypergraph (or provide Hypergraph.{method})")
         self._hypergraph = hypergraph
+        self._cache: "OrderedDict[tuple, Tuple[str, Optional[datetime]]]" = OrderedDict()
+        self._cache_max = cache_size
+
+    def clear_cache(self):
+        """
+        Drop all cached contexts.
+
+        Only needed when the hypergraph was mutated without going through its API
+        (which would otherwise bump the hypergraph version).
+        """
+        self._cache.clear()
 
     def generate_context(self, query: str, recent_time_window: Optional[timedelta] = None) -> str:
         """
@@ -79,61 +121,120 @@ class SituationalAwarenessAdapter:
         Returns:
             str: A formatted string containing relevant concepts and events (short and long term).
                  Returns an empty string if no relevant knowledge is found.
-        """\
+        """
+        key = (query, recent_time_window, getattr(self._hypergraph, "_version", 0))
+        cached = self._cache.get(key)
+        if cached is not None:
+            context, expires_at = cached
+            if expires_at is None or datetime.now() <= expires_at:
+                self._cache.move_to_end(key)
+                return context
+            # A recent event has aged out of the window since this entry was stored
+            del self._cache[key]
+
+        context, expires_at = self._build_context(query, recent_time_window)
+        if self._cache_max > 0:
+            self._cache[key] = (context, expires_at)
+            if len(self._cache) > self._cache_max:
+                self._cache.popitem(last=False)
+        return context
+
+    def _build_context(self, query: str, recent_time_window: Optional[timedelta]) -> Tuple[str, Optional[datetime]]:
+        """
+        Builds the context string for `generate_context`, bypassing the cache.
+
+        Args:
+            query (str): The query string used to retrieve relevant information from the hypergraph.
+            recent_time_window (Optional[timedelta]): The window for recent events, or None.
+
+        Returns:
+            Tuple[str, Optional[datetime]]: The context string and the time after which it becomes
+                                            stale because its oldest recent event leaves the window
+                                            (None if the result does not depend on the current time).
+        """
+        if recent_time_window is None:
+            # Query-only retrieval never depends on the current time, so the result does not expire
+            return self._generate_query_context(query), None
+
         # Retrieve knowledge based on the query (represents potentially long-term relevant info)
         query_relevant_concepts, query_relevant_events = self._hypergraph.retrieve_knowledge(query)
 
         # Retrieve recent events (represents short-term memory)
-        recent_events: List[Event] = []
-        if recent_time_window is not None:
-            recent_events = self._hypergraph.get_recent_events(recent_time_window)
+        expires_at: Optional[datetime] = None
+        recent_events: List[Event] = self._hypergraph.get_recent_events(recent_time_window)
+        if recent_events:
+            # Events are returned most recent first, so the last one leaves the window first
+            expires_at = recent_events[-1].timestamp + recent_time_window
 
         # Combine the retrieved knowledge
-        # Use sets to avoid duplicates when combining
-        combined_concepts = set(query_relevant_concepts)
+        # Deduplicate by ID: the (interned) ID strings cache their hashes, so a dict merge avoids
+        # going through Concept.__hash__/Event.__hash__ for every member as set unions would
+        concepts_by_id = {c.concept_id: c for c in query_relevant_concepts}
         for event in recent_events:
-             combined_concepts.update(event.concepts)
-
-        combined_events = set(query_relevant_events).union(set(recent_events))
+             concepts_by_id.update((c.concept_id, c) for c in event.concepts)
+        combined_concepts = concepts_by_id.values()
+
+        # Recent events already come back most recent first; sort the query-relevant ones the same way
+        # and merge the two ordered streams in O(n), dropping events that appear in both
+        query_relevant_events = sorted(query_relevant_events, key=_by_timestamp, reverse=True)
+        seen_event_ids = set()
+        combined_events: List[Event] = []
+        for event in heapq.merge(query_relevant_events, recent_events, key=_by_timestamp, reverse=True):
+            if event.event_id not in seen_event_ids:
+                seen_event_ids.add(event.event_id)
+                combined_events.append(event)
 
         context_parts: List[str] = []
 
         if combined_concepts:
-            # Sort concepts by name for consistent output
-            sorted_concepts = sorted(list(combined_concepts), key=lambda c: c.name)
-            concept_names = ", ".join([c.name for c in sorted_concepts])
-            # Adjust header based on whether query matched any concepts and if recent events were considered
-            if query and recent_time_window is not None:
+            # Sort concept names for consistent output
+            concept_names = ", ".join(sorted(c.name for c in combined_concepts))
+            # Adjust header based on whether query matched any concepts (recent events are always considered here)
+            if query:
                  header = "Concepts related to the query and recent activity:"
-            elif query:
-                 header = "Concepts related to the query:"
-            elif recent_time_window is not None:
-                 header = "Concepts related to recent activity:"
             else:
-                 header = "Concepts:" # Fallback
+                 header = "Concepts related to recent activity:"
 
             context_parts.append(f"{header} {concept_names}.")
 
         if combined_events:
             context_parts.append("Relevant Events:")
-            # Sort events by timestamp (most recent first) for consistent output
-            sorted_events = sorted(list(combined_events), key=lambda e: e.timestamp, reverse=True)
-            event_descriptions: List[str] = []
-            for event in sorted_events:
-                # Simple representation: Event ID, Concepts involved, Delta, and Metadata
-                # This can be made more sophisticated depending on desired context detail
-                concept_names_in_event = ", ".join(sorted([c.name for c in event.concepts]))
-                description = f"Event {event.event_id}: Concepts [{concept_names_in_event}], Delta {event.delta:.2f}, Metadata {event.metadata}"
-                event_descriptions.append(description)
-            context_parts.append("""
-""".join(event_descriptions))
+            # combined_events is already ordered by timestamp (most recent first) for consistent output.
+            # Event descriptions go straight into context_parts so the whole context is assembled
+            # by a single join, rather than joining the events block first and copying it again
+            context_parts.extend(event.description_cached for event in combined_events)
 
         if not context_parts:
-            return ""
+            return "", expires_at
 
         # Join with a separator (e.g., newline) between different parts of the context
-        return """
-""".join(context_parts)
+        return "\n".join(context_parts), expires_at
+
+    def _generate_query_context(self, query: str) -> str:
+        """
+        Builds the context string for a query alone, without a recent time window.
+
+        This is the common case of `generate_context`. `Hypergraph.retrieve_knowledge_names`
+        returns the sorted concept names and ordered event descriptions directly, so no
+        deduplication, merging or object traversal is needed here.
+
+        Args:
+            query (str): The query string used to retrieve relevant information from the hypergraph.
+
+        Returns:
+            str: A formatted string containing the query-relevant concepts and events, or an empty
+                 string if nothing relevant was found.
+        """
+        concept_names, event_descriptions = self._hypergraph.retrieve_knowledge_names(query)
+
+        context_parts: List[str] = []
+        if concept_names:
+            header = "Concepts related to the query:" if query else "Concepts:"
+            context_parts.append(f"{header} {', '.join(concept_names)}.")
+        if event_descriptions:
+            context_parts.append("Relevant Events:")
+            context_parts.extend(event_descriptions)
+        return "\n".join(context_parts)
 
     # You might add other methods here for different context generation strategies,
     # e.g., generating context based on specific concepts, or integrating summarization.
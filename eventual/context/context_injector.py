@@ -33,19 +33,37 @@ full_context_for_llm = injector.inject_context(knowledge_context, user_query)
 
 print("Full Context for LLM:")
 print(full_context_for_llm)
+
+# Reuse the injector with a different prompt format; the template receives the
+# knowledge context as {ctx} and the user query as {q}
+custom_injector = ContextInjector(template="Background:\n{ctx}\n\nQuestion: {q}")
 ```
 """
-from typing import List
+from typing import Callable
+
+DEFAULT_TEMPLATE = "{ctx}\n\nUser Query: {q}"
 
 class ContextInjector:
     """
     Prepares the final context string for an LLM by combining knowledge context and the user query.
+
+    Attributes:
+        _with_ctx (Callable[..., str]): Bound `str.format` of the template used when knowledge
+                                        context is present.
     """
-    def __init__(self):
+    def __init__(self, template: str = DEFAULT_TEMPLATE):
         """
         Initialize the ContextInjector.
+
+        The template is compiled into a bound `format` method once here, so that
+        `inject_context` does no per-call template handling.
+
+        Args:
+            template (str): Format string used when knowledge context is present. It receives the
+                            knowledge context as `{ctx}` and the user query as `{q}`.
+                            Defaults to `DEFAULT_TEMPLATE`.
         """
-        pass # No specific initialization needed for this basic version
+        self._with_ctx: Callable[..., str] = template.format
 
     def inject_context(self, knowledge_context: str, user_query: str) -> str:
         """
@@ -57,15 +75,7 @@ class ContextInjector:
 
         Returns:
             str: A single string containing both the knowledge context and the user query,
-                 formatted for LLM input.
+                 formatted for LLM input. If there is no knowledge context, the user query is
+                 returned as-is.
         """
-        # Simple concatenation for now. More sophisticated formatting can be added later,
-        # e.g., using specific tokens or structures to delineate context sections.
-        if knowledge_context:
-            # Add a separator if there is knowledge context to distinguish it from the query
-            return f"""{knowledge_context}
-
-User Query: {user_query}"""
-        else:
-            # If no knowledge context, just return the user query
-            return user_query
+        return self._with_ctx(ctx=knowledge_context, q=user_query) if knowledge_context else user_query
@@ -1,5 +1,5 @@
 from .concept import Concept
 from .event import Event
 from .sensor import Sensor
-from .hypergraph import Hypergraph
+from .hypergraph import Hypergraph, FrozenHypergraph
 from .temporal_boundary import TemporalBoundary, TemporalBoundaryConfig
@@ -0,0 +1,63 @@
+"""
+Array kernels behind `TemporalBoundary`'s dynamic thresholds.
+
+Numba is optional. When it is installed, `update_thresholds` is compiled to a native loop on first
+use (and cached on disk); otherwise it runs as vectorized numpy code. Both give the same results.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _update_thresholds_loop(decayed_sum, count, rows, deltas, decay_factor, threshold, thresholds, event_numbers):
+    """
+    Record one change per entry of `rows`, in order, and write out the updated thresholds.
+
+    Each row's decayed sum follows `sum_t = delta_t + decay_factor * sum_{t-1}` and its dynamic
+    threshold is `threshold * (1 + sum_t / count_t)`. A row listed more than once sees its own
+    earlier changes, exactly as if the changes were recorded one call at a time.
+
+    Args:
+        decayed_sum (np.ndarray): Per-row decayed sums of past changes (float64, updated in place).
+        count (np.ndarray): Per-row numbers of changes seen (int64, updated in place).
+        rows (np.ndarray): The row of each change (intp).
+        deltas (np.ndarray): The size of each change (float64).
+        decay_factor (float): The decay applied to older changes.
+        threshold (float): The base threshold.
+        thresholds (np.ndarray): Output; the updated threshold for each change (float64).
+        event_numbers (np.ndarray): Output; the row's change count after each change (int64).
+    """
+    for i in range(rows.shape[0]):
+        row = rows[i]
+        total = deltas[i] + decay_factor * decayed_sum[row]
+        decayed_sum[row] = total
+        n = count[row] + 1
+        count[row] = n
+        thresholds[i] = threshold * (1.0 + total / n)
+        event_numbers[i] = n
+
+
+def _update_thresholds_numpy(decayed_sum, count, rows, deltas, decay_factor, threshold, thresholds, event_numbers):
+    """
+    Numpy implementation of `_update_thresholds_loop`, used when Numba is not installed.
+
+    Rows listed once are updated with whole-array operations; a batch that repeats a row falls
+    back to the loop, which runs as plain Python.
+    """
+    if np.unique(rows).size != rows.size:
+        _update_thresholds_loop(decayed_sum, count, rows, deltas, decay_factor, threshold, thresholds, event_numbers)
+        return
+    totals = deltas + decay_factor * decayed_sum[rows]
+    decayed_sum[rows] = totals
+    counts = count[rows] + 1
+    count[rows] = counts
+    np.multiply(threshold, 1.0 + totals / counts, out=thresholds)
+    event_numbers[:] = counts
+
+
+# No fastmath: it may replace the division with a reciprocal multiply, and the thresholds must match
+# the numpy path bit for bit so both decide the same changes are events
+update_thresholds = njit(cache=True)(_update_thresholds_loop) if njit is not None else _update_thresholds_numpy
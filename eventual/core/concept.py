@@ -20,12 +20,155 @@ light_concept.add_metadata("source", "sensor_1")
 # Retrieve history
 for entry in light_concept.get_history():
     print(entry)
+
+# Update many concepts at once (one new state per concept)
+from eventual.core.concept import bulk_update_states
+deltas = bulk_update_states([light_concept], [0.75], reasons=["sensor batch"])
 ```
 
 """
-from typing import Optional, List, Dict, Any
-from datetime import datetime
-from uuid import uuid4
+from typing import Optional, List, Dict, Any, Tuple, Sequence, Iterator
+import sys
+import time
+from array import array
+from itertools import chain
+from collections.abc import Set as AbstractSet
+from datetime import datetime, timedelta, timezone
+import numpy as np
+from eventual.core.identifiers import generate_id
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+def _ns_to_datetime(timestamp_ns: int, tz: Optional[timezone] = None) -> datetime:
+    """
+    Convert an epoch timestamp in nanoseconds to a datetime (naive local time if `tz` is None).
+    """
+    seconds, remainder = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds, tz=tz).replace(microsecond=remainder // 1_000)
+
+def _datetime_to_ns(value: datetime) -> int:
+    """
+    Convert a datetime to an epoch timestamp in nanoseconds. Naive datetimes are taken as local time.
+    """
+    if value.tzinfo is None:
+        value = value.astimezone()
+    return (value - _EPOCH) // timedelta(microseconds=1) * 1_000
+
+class _EventRefs(AbstractSet):
+    """
+    Read-only set view of the events a concept is part of.
+
+    Each hypergraph keeps, per concept, an array of compact integer indices into its event registry
+    (see `Hypergraph._register_event`). The concept holds one `(indices, registry, positions)` link per
+    hypergraph it has events in, and this view resolves the indices to Event objects on iteration.
+    Set operations (`|`, `&`, `==`, ...) are inherited from `collections.abc.Set` and return plain sets.
+    """
+    __slots__ = ("_concept_id", "_links")
+
+    def __init__(self, concept_id: str, links: Tuple[Tuple[array, Sequence[Any], Dict[str, int]], ...]):
+        self._concept_id = concept_id
+        self._links = links
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        return set(iterable)
+
+    def __len__(self) -> int:
+        return sum(len(indices) for indices, _, _ in self._links)
+
+    def __iter__(self) -> Iterator[Any]:
+        return chain.from_iterable(map(registry.__getitem__, indices) for indices, registry, _ in self._links)
+
+    def __contains__(self, event: Any) -> bool:
+        # Events compare by ID. A hypergraph links an event to exactly the concepts in its `concept_ids`,
+        # so membership is one position lookup and one frozenset probe per hypergraph, not a scan
+        event_id = getattr(event, "event_id", None)
+        for _, registry, positions in self._links:
+            index = positions.get(event_id)
+            if index is not None and self._concept_id in registry[index].concept_ids:
+                return True
+        return False
+
+    def __repr__(self) -> str:
+        return f"{{{', '.join(map(repr, self))}}}"
+
+class _StateHistory:
+    """
+    Append-only struct-of-arrays buffer of state changes.
+
+    Timestamps (epoch nanoseconds), states and deltas live in parallel numpy arrays that double
+    in capacity when full, so appends are amortized O(1) and the numeric columns can be analysed
+    without touching Python objects. A `None` delta is stored as NaN. Reasons are kept in a list.
+    """
+    __slots__ = ("timestamps_ns", "states", "deltas", "reasons", "size")
+
+    def __init__(self, capacity: int = 4):
+        self.timestamps_ns = np.empty(capacity, dtype=np.int64)
+        self.states = np.empty(capacity, dtype=np.float64)
+        self.deltas = np.empty(capacity, dtype=np.float64)
+        self.reasons: list[Optional[str]] = []
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _grow(self, min_capacity: int):
+        # Copy into new buffers instead of resizing in place, so views handed out by arrays() stay valid
+        capacity = max(min_capacity, 2 * len(self.states))
+        for name in ("timestamps_ns", "states", "deltas"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+
+    def append(self, timestamp_ns: int, state: float, delta: Optional[float], reason: Optional[str]):
+        i = self.size
+        if i == len(self.states):
+            self._grow(i + 1)
+        self.timestamps_ns[i] = timestamp_ns
+        self.states[i] = state
+        self.deltas[i] = np.nan if delta is None else delta
+        self.reasons.append(reason)
+        self.size = i + 1
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Read-only views of the filled part of the timestamp, state and delta buffers.
+        """
+        views = (self.timestamps_ns[:self.size], self.states[:self.size], self.deltas[:self.size])
+        for view in views:
+            view.flags.writeable = False
+        return views
+
+    def records(self):
+        """
+        Iterate over the history as `(timestamp_ns, state, delta, reason)` tuples of Python scalars.
+        """
+        n = self.size
+        deltas = [None if d != d else d for d in self.deltas[:n].tolist()]  # NaN -> None
+        return zip(self.timestamps_ns[:n].tolist(), self.states[:n].tolist(), deltas, self.reasons)
+
+    def iso_timestamps_utc(self) -> List[str]:
+        """
+        Format every timestamp as a UTC ISO 8601 string with microsecond precision ("...+00:00"),
+        in one vectorized pass instead of a datetime per entry.
+        """
+        microseconds = (self.timestamps_ns[:self.size] // 1_000).astype("datetime64[us]")
+        return np.char.add(np.datetime_as_string(microseconds, unit="us"), "+00:00").tolist()
+
+    @classmethod
+    def from_records(cls, timestamps_ns: List[int], states: List[float], deltas: List[Optional[float]], reasons: List[Optional[str]]) -> "_StateHistory":
+        """
+        Build a history from parallel lists, allocating the buffers at their final size.
+        """
+        history = cls(capacity=max(len(states), 1))
+        n = len(states)
+        history.timestamps_ns[:n] = timestamps_ns
+        history.states[:n] = states
+        history.deltas[:n] = [np.nan if d is None else d for d in deltas]
+        history.reasons = list(reasons)
+        history.size = n
+        return history
 
 # Forward declaration for type hinting if Event is in a separate file and imported
 # This avoids circular import issues if Concept and Event reference each other.
@@ -46,30 +189,67 @@ class Concept:
         concept_id (str): A unique identifier for the concept.
         name (str): The name of the concept (e.g., "light", "darkness").
         state (float): The current state of the concept (numerical value).
-        history (List[dict[str, any]]): A history of state changes, including timestamps and deltas.
+        history (Tuple[dict[str, any], ...]): A history of state changes, including timestamps and deltas
+            (read-only view built by `get_history`).
         metadata (dict[str, any]): Additional metadata about the concept (e.g., source, context).
-        events (set[Event]): A set of events this concept is part of.
+        events (Set[Event]): A read-only set view of the events this concept is part of, across every
+            hypergraph it belongs to. Each hypergraph stores the links as integer indices into its own
+            event registry (see `_link_hypergraph`).
     """
 
-    def __init__(self, concept_id: Optional[str] = None, name: str = "", initial_state: float = 0.0, metadata: Optional[dict[str, any]] = None):
+    # Hypergraphs hold very many concepts; slots drop the per-instance __dict__ and make attribute
+    # access on hot traversal paths a direct slot read
+    __slots__ = ("concept_id", "name", "state", "_history", "_pending_initial", "_history_snapshot", "metadata",
+                 "_event_links")
+
+    def __init__(self, concept_id: Optional[str] = None, name: str = "", initial_state: float = 0.0, metadata: Optional[dict[str, any]] = None, _skip_initial_history: bool = False):
         """
         Initialize a Concept instance.
 
         Args:
-            concept_id (Optional[str]): A unique identifier for the concept. If not provided, a UUID will be generated.
+            concept_id (Optional[str]): A unique identifier for the concept. If not provided, a unique ID will be generated
+                (see `eventual.core.identifiers`).
             name (str): The name of the concept (e.g., "light", "darkness").
             initial_state (float): The initial state of the concept (default: 0.0).
             metadata (Optional[dict[str, any]]): Additional metadata about the concept (e.g., source, context).
+            _skip_initial_history (bool): Internal. Do not record the "Initial state" entry, for callers
+                that install a history of their own (e.g. `from_dict`).
         """
-        self.concept_id = concept_id if concept_id else f"concept_{uuid4().hex}"
-        self.name = name
+        # IDs are used as dict keys and dedup keys throughout; interning shares one string object
+        # (with its cached hash) between every structure that references the concept
+        self.concept_id = sys.intern(concept_id if concept_id else generate_id("concept"))
+        # Names are sort keys and are joined into every context string; a vocabulary of names repeats
+        # heavily, so interning stores each distinct name once and turns comparisons into identity checks.
+        # Some CPython versions keep interned strings alive for the life of the process, which is fine
+        # for the bounded vocabularies concept names come from
+        self.name = sys.intern(name) if name else name
         self.state = initial_state
-        self.history = []  # Tracks state changes over time
+        # Tracks state changes over time as parallel arrays. Timestamps are kept as `time.time_ns()` integers,
+        # which are far cheaper to take than `datetime.now()`; datetimes are only materialized by get_history/to_dict.
+        # The buffers are allocated on first use (see _materialized_history), since most concepts built in bulk
+        # never change state.
+        self._history: Optional[_StateHistory] = None
+        # Cached result of get_history; the history is append-only, so it stays valid while its length matches
+        self._history_snapshot: Optional[Tuple[dict[str, any], ...]] = None
         self.metadata = metadata if metadata else {}
-        self.events: set[Any] = set() # set of Event objects this concept is part of; Use Any to break circular dependency for now, or forward reference
+        # One (indices, registry, positions) link per hypergraph this concept has events in; the arrays of
+        # event indices are owned by the hypergraphs. Exposed as Event objects by the `events` property
+        self._event_links: Tuple[Tuple[array, Sequence[Any], Dict[str, int]], ...] = ()
 
-        # Record the initial state in history
-        self._record_state_change(initial_state, "Initial state")
+        # Remember the initial state; it becomes the first history entry once the history is used
+        self._pending_initial: Optional[Tuple[int, float]] = None if _skip_initial_history else (time.time_ns(), initial_state)
+
+    def _materialized_history(self) -> _StateHistory:
+        """
+        Return the history buffer, allocating it and recording the pending initial state if needed.
+        """
+        if self._history is None:
+            self._history = _StateHistory()
+        if self._pending_initial is not None:
+            timestamp_ns, initial_state = self._pending_initial
+            self._pending_initial = None
+            self._history.append(timestamp_ns, initial_state, None, "Initial state")
+        return self._history
 
     def update_state(self, new_state: float, reason: Optional[str] = None):
         """
@@ -93,25 +273,71 @@ class Concept:
             reason (Optional[str]): A description of why the state changed.
             delta (Optional[float]): The change in state (new_state - previous_state).
         """
-        self.history.append({
-            "timestamp": datetime.now(),
-            "state": new_state,
-            "delta": delta,
-            "reason": reason
-        })
+        self._materialized_history().append(time.time_ns(), new_state, delta, reason)
 
-    def get_history(self) -> list[dict[str, any]]:
+    def get_history(self) -> Tuple[dict[str, any], ...]:
         """
         Get the history of state changes for the concept.
 
+        The snapshot is built once and reused until the next state change, so repeated calls are
+        cheap and callers need no defensive copy. The records are shared between calls and should
+        be treated as read-only.
+
         Returns:
-            List[dict[str, any]]: A list of state change records, each containing:
-                - timestamp: The time of the state change.
+            Tuple[dict[str, any], ...]: An immutable sequence of state change records, each containing:
+                - timestamp: The time of the state change (naive local datetime).
                 - state: The new state.
                 - delta: The change in state.
                 - reason: The reason for the state change.
         """
-        return self.history
+        history = self._materialized_history()
+        snapshot = self._history_snapshot
+        if snapshot is None or len(snapshot) != len(history):
+            snapshot = self._history_snapshot = tuple({
+                "timestamp": _ns_to_datetime(timestamp_ns),
+                "state": state,
+                "delta": delta,
+                "reason": reason
+            } for timestamp_ns, state, delta, reason in history.records())
+        return snapshot
+
+    def history_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the raw history columns for vectorized analysis.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Read-only views of the timestamps (int64 epoch
+                nanoseconds), states (float64) and deltas (float64, NaN where no delta was recorded).
+        """
+        return self._materialized_history().arrays()
+
+    @property
+    def history(self) -> Tuple[dict[str, any], ...]:
+        """
+        The history of state changes, as returned by `get_history`.
+        """
+        return self.get_history()
+
+    @property
+    def events(self) -> _EventRefs:
+        """
+        The events this concept is part of, as a read-only set view of Event objects.
+        """
+        return _EventRefs(self.concept_id, self._event_links)
+
+    def _link_hypergraph(self, indices: array, registry: Sequence[Any], positions: Dict[str, int]):
+        """
+        Record that a hypergraph lists this concept's events in `indices`.
+
+        Called by the Hypergraph when it registers the concept's first event. The hypergraph keeps
+        appending to `indices`; a concept shared by several hypergraphs gets one link per hypergraph.
+
+        Args:
+            indices (array): The concept's event indices, owned by the hypergraph.
+            registry (Sequence[Event]): The hypergraph's event registry.
+            positions (Dict[str, int]): The hypergraph's registry index of each event ID.
+        """
+        self._event_links = (*self._event_links, (indices, registry, positions))
 
     def add_metadata(self, key: str, value: any):
         """
@@ -139,17 +365,18 @@ class Concept:
         """
         Convert the Concept object to a dictionary for serialization.
         """
+        history = self._materialized_history()
         return {
             "concept_id": self.concept_id,
             "name": self.name,
             "state": self.state,
-            # Convert datetime objects to ISO format strings for serialization
+            # Nanosecond timestamps are converted to UTC ISO format strings for serialization in one pass
             "history": [{
-                "timestamp": entry["timestamp"].isoformat(),
-                "state": entry["state"],
-                "delta": entry["delta"],
-                "reason": entry["reason"]
-            } for entry in self.history],
+                "timestamp": timestamp,
+                "state": state,
+                "delta": delta,
+                "reason": reason
+            } for timestamp, (_, state, delta, reason) in zip(history.iso_timestamps_utc(), history.records())],
             "metadata": self.metadata,
             "event_ids": [event.event_id for event in self.events] # Store event IDs
         }
@@ -165,21 +392,29 @@ class Concept:
             concept_id=data["concept_id"],
             name=data["name"],
             initial_state=data["state"], # Use the state from the dictionary as the current state
-            metadata=data.get("metadata", {})
+            metadata=data.get("metadata", {}),
+            _skip_initial_history=True
+        )
+        # Directly set the history, converting ISO strings back to nanosecond timestamps
+        # (timestamps without an offset, as written by older versions, are local time)
+        entries = data.get("history", [])
+        concept._history = _StateHistory.from_records(
+            [_datetime_to_ns(datetime.fromisoformat(entry["timestamp"])) for entry in entries],
+            [entry["state"] for entry in entries],
+            [entry["delta"] for entry in entries],
+            # Reasons repeat across entries and concepts; interned, each distinct reason is stored once
+            [sys.intern(entry["reason"]) if isinstance(entry["reason"], str) else entry["reason"] for entry in entries],
         )
-        # Directly set the history, converting ISO strings back to datetime objects
-        concept.history = []
-        for entry in data.get("history", []):
-             concept.history.append({
-                "timestamp": datetime.fromisoformat(entry["timestamp"]),
-                "state": entry["state"],
-                "delta": entry["delta"],
-                "reason": entry["reason"]
-            })
 
         # event_ids are stored but not used here; they are used in Hypergraph.from_dict
         return concept
 
+    def _history_length(self) -> int:
+        """
+        Number of history entries, counting a pending initial state, without allocating buffers.
+        """
+        return (len(self._history) if self._history is not None else 0) + (self._pending_initial is not None)
+
     def __repr__(self):
         """
         Return a string representation of the Concept instance.
@@ -187,7 +422,7 @@ class Concept:
         Returns:
             str: A string representation of the concept.
         """
-        return f"Concept(concept_id={self.concept_id}, name={self.name}, state={self.state}, history_length={len(self.history)}, events_count={len(self.events)})"
+        return f"Concept(concept_id={self.concept_id}, name={self.name}, state={self.state}, history_length={self._history_length()}, events_count={len(self.events)})"
 
     def __eq__(self, other: any) -> bool:
         if not isinstance(other, Concept):
@@ -196,3 +431,55 @@ class Concept:
 
     def __hash__(self) -> int:
         return hash(self.concept_id)
+
+
+def bulk_update_states(
+    concepts: Sequence[Concept],
+    new_states: Sequence[float],
+    timestamps_ns: Optional[Sequence[int]] = None,
+    reasons: Optional[Sequence[Optional[str]]] = None,
+) -> np.ndarray:
+    """
+    Update the states of many concepts in one call.
+
+    Equivalent to calling `concept.update_state(new_state, reason)` for each pair, but the deltas
+    and change detection are computed as one vectorized numpy operation and, unless timestamps are
+    given, the whole batch shares a single clock read. Only the history appends for concepts whose
+    state actually changed run in Python.
+
+    Args:
+        concepts (Sequence[Concept]): The concepts to update. Each concept may appear only once.
+        new_states (Sequence[float]): The new state for each concept.
+        timestamps_ns (Optional[Sequence[int]]): Epoch nanosecond timestamps for each update.
+            Defaults to the current time for the whole batch.
+        reasons (Optional[Sequence[Optional[str]]]): The reason recorded for each update.
+
+    Returns:
+        np.ndarray: The delta applied to each concept (0.0 where the state did not change).
+
+    Raises:
+        ValueError: If the inputs have different lengths or a concept appears more than once.
+    """
+    n = len(concepts)
+    new_states = np.asarray(new_states, dtype=np.float64)
+    if len(new_states) != n or (timestamps_ns is not None and len(timestamps_ns) != n) or (reasons is not None and len(reasons) != n):
+        raise ValueError("concepts, new_states, timestamps_ns and reasons must have the same length.")
+    if len({concept.concept_id for concept in concepts}) != n:
+        raise ValueError("Each concept may appear only once in a bulk update.")
+
+    current_states = np.fromiter((concept.state for concept in concepts), dtype=np.float64, count=n)
+    changed = new_states != current_states
+    deltas = np.where(changed, new_states - current_states, 0.0)
+
+    batch_timestamp_ns = time.time_ns() if timestamps_ns is None else None
+    for i in np.flatnonzero(changed).tolist():
+        concept = concepts[i]
+        new_state = float(new_states[i])
+        concept.state = new_state
+        concept._materialized_history().append(
+            batch_timestamp_ns if timestamps_ns is None else timestamps_ns[i],
+            new_state,
+            float(deltas[i]),
+            None if reasons is None else reasons[i],
+        )
+    return deltas
@@ -1,13 +1,161 @@
 
-import litellm
+import asyncio
 import os
+import re
+import sys
 import json
-import yaml
-from typing import Optional
+import hashlib
+import logging
+import random
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, List, Iterator, Union, Tuple, Any, Mapping, MutableMapping
 from eventual.processors.processor_output import ProcessorOutput, ExtractedConcept, ExtractedEvent
 from datetime import datetime
 from uuid import uuid4 # Assuming we might need a temp ID if the ExtractedConcept doesn't provide one
 
+# Get the logger for this module
+logger = logging.getLogger(__name__)
+
+try:
+    # orjson parses LLM answers several times faster than the json module. It is optional; its
+    # JSONDecodeError subclasses json.JSONDecodeError, so error handling is the same either way
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+def _litellm():
+    """
+    Returns the litellm module, importing it on first use.
+
+    Importing litellm loads many provider SDKs and takes hundreds of milliseconds, which detectors
+    that are constructed but never call the LLM (tests, graph-only workflows) should not pay.
+    """
+    import litellm
+    return litellm
+
+@lru_cache(maxsize=8)
+def _cached_load_config(config_path: str, mtime_ns: int) -> Mapping[str, Any]:
+    """
+    Parses a YAML config file, memoized on its path and modification time.
+
+    Detectors created per request or per worker share one parsed config; editing the file
+    changes its mtime and therefore the cache key. Parse errors are not cached.
+
+    Args:
+        config_path: The path to the configuration file.
+        mtime_ns: The file's modification time in nanoseconds (part of the cache key only).
+
+    Returns:
+        Mapping[str, Any]: A read-only view of the parsed top-level config (empty for an empty file).
+    """
+    import yaml
+    # libyaml's C loader parses the same documents much faster than the pure-Python SafeLoader
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(config_path, 'r') as f:
+        return MappingProxyType(yaml.load(f, Loader=loader) or {})
+
+def _intern_name(name: Any) -> Any:
+    """
+    Interns a concept name parsed from an LLM answer.
+
+    The same names recur across concepts and relationships (and across texts), so interning keeps
+    one string object per distinct name and lets the Integrator's dict/set lookups compare by
+    identity. Non-string values are returned unchanged.
+    """
+    return sys.intern(name) if isinstance(name, str) else name
+
+class _LRUCache(OrderedDict):
+    """
+    Minimal bounded LRU mapping used as the default ConceptDetector result cache.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        return self[key]
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+# JSON schema of the answer requested from the LLM (see ConceptDetector._SYSTEM_MSG)
+_RESULTS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "results": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "concepts": {"type": "array", "items": {"type": "string"}},
+                    "relationships": {"type": "array", "items": {"type": "array", "items": {"type": "string"}}},
+                },
+                "required": ["concepts", "relationships"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["results"],
+    "additionalProperties": False,
+}
+
+# Texts without a single word character (punctuation, emoji, whitespace) hold no concepts
+_WORD_CHAR = re.compile(r"\w")
+
+# Retry policy for transient LLM errors; overridden per key by `llm_settings.retry` in the config.
+# Waits grow as initial * 2**attempt plus up to `jitter` seconds, capped at `max` seconds
+_DEFAULT_RETRY = {"attempts": 5, "initial": 1.0, "max": 30.0, "jitter": 1.0}
+
+def _retryable_errors() -> Tuple[type, ...]:
+    """
+    Returns the litellm exceptions worth retrying: rate limits, connection errors and timeouts.
+
+    Other errors (authentication, bad requests) would fail again, and unparsable answers need
+    a different prompt rather than the same request repeated.
+    """
+    litellm = _litellm()
+    return (litellm.RateLimitError, litellm.APIConnectionError, litellm.Timeout)
+
+# response_format types under which the provider guarantees a bare JSON answer
+_JSON_RESPONSE_FORMATS = ("json_object", "json_schema")
+
+def _response_format_for(model: Optional[str]) -> Optional[dict]:
+    """
+    Chooses the strictest structured-output mode litellm knows `model` to support.
+
+    Args:
+        model: The configured litellm model name.
+
+    Returns:
+        Optional[dict]: A `json_schema` response format for models with structured outputs, a
+        `json_object` format for models with plain JSON mode, or None if neither is supported or
+        the model is unknown.
+    """
+    litellm = _litellm()
+    try:
+        if litellm.supports_response_schema(model=model):
+            return {
+                "type": "json_schema",
+                "json_schema": {"name": "concept_extraction", "schema": _RESULTS_SCHEMA, "strict": True},
+            }
+        if "response_format" in (litellm.get_supported_openai_params(model=model) or ()):
+            return {"type": "json_object"}
+    except Exception:
+        # Depending on the version, litellm raises a bare Exception for models it does not know, so
+        # the error cannot be narrowed; it is logged rather than hidden
+        logger.debug("Could not determine structured-output support for model %r; not requesting it.", model, exc_info=True)
+    return None
+
 class ConceptDetector:
     """
     Detects concepts and relationships in text using an LLM.
@@ -15,133 +163,721 @@ class ConceptDetector:
     Following refactoring, it now returns structured data (`ProcessorOutput`)
     for integration into a Hypergraph or other data store by a separate component.
     """
-    def __init__(self, config_path="eventual/config.yaml"):
+    # The instructions live in the system message, identical for every request, so providers with
+    # prompt-prefix caching reuse them across calls; the user message only holds the numbered texts.
+    # The answer shape is stated compactly here and enforced through response_format where supported
+    _SYSTEM_MSG = {"role": "system", "content": (
+        "Extract key concepts and their relationships from each numbered text. "
+        "Reply with JSON only: {\"results\": [{\"concepts\": [string], \"relationships\": [[string, string]]}]}, "
+        "one object per text, in text order. "
+        "Include only concepts and relationships directly mentioned or strongly implied."
+    )}
+    # Part of every result cache key; bump it whenever the prompt or the answer format changes so that
+    # persistent cache backends do not serve results produced by an older prompt
+    _PROMPT_VERSION = 2
+
+    def __init__(self, config_path="eventual/config.yaml", cache: Optional[MutableMapping[str, dict]] = None):
         """
         Initializes the ConceptDetector with configuration from a YAML file.
 
         Args:
             config_path: The path to the configuration file.
+            cache: Optional store for per-text LLM results (e.g. a disk- or Redis-backed mapping); only
+                `get` and item assignment are used. Defaults to an in-memory LRU holding the config's
+                `cache_size` entries (1024 if unset; 0 disables caching).
         """
         self.config = self._load_config(config_path)
-        self.llm_settings = self.config.get("llm_settings", {})
+        # Copied, since the loaded config is shared with other detectors
+        self.llm_settings = dict(self.config.get("llm_settings") or {})
         if not self.llm_settings:
-            print("Warning: 'llm_settings' not found in config. Using default LLM settings.")
+            logger.warning("'llm_settings' not found in config. Using default LLM settings.")
             self.llm_settings = {
                 "model": "gpt-4o", # Default model
                 "temperature": 0.7,
                 "top_p": 1.0,
             }
+        # Retry limits live with the LLM settings in the config but are not litellm parameters
+        self.retry_settings = {**_DEFAULT_RETRY, **(self.llm_settings.pop("retry", None) or {})}
+        # The response format depends on litellm's model metadata, so it is chosen on first use
+        # (see _resolve_response_format) rather than importing litellm here. The request kwargs and
+        # the cache key prefix derived from the settings are built at the same time; change the
+        # settings through set_llm_settings afterwards so they are rebuilt
+        self._response_format_resolved = False
+        self._json_mode = False
+        self._completion_kwargs: dict = {}
+        self._settings_digest = None
+        detector_config = self.config.get("concept_detector") or {}
+        # Shorter texts (after stripping whitespace) cannot hold a relationship and are not sent to the LLM
+        self.min_text_len = detector_config.get("min_text_len", 8)
+        # Longer texts are split into overlapping chunks of this many tokens (0 or None disables chunking)
+        self.chunk_tokens = detector_config.get("chunk_tokens", 4000)
+        self.chunk_overlap = detector_config.get("chunk_overlap", 200)
+        # Upper bound on concurrent LLM calls made by adetect_many
+        self.max_concurrency = self.config.get("max_concurrency", 10)
+        # Identical texts are extracted once: results are cached per text, keyed on the LLM settings,
+        # the prompt version and a digest of the text
+        self._cache: Optional[MutableMapping[str, dict]] = cache
+        if cache is None and self.config.get("cache_size", 1024) > 0:
+            self._cache = _LRUCache(self.config.get("cache_size", 1024))
 
         # Ensure API keys are set up as environment variables
         # litellm picks these up automatically based on the model used.
         # e.g., export OPENAI_API_KEY='YOUR_API_KEY'
 
     def _load_config(self, config_path):
-        """Loads configuration from a YAML file."""
+        """
+        Loads configuration from a YAML file.
+
+        Parsed configs are shared between detectors through `_cached_load_config` until the file
+        changes, so the returned mapping is read-only.
+        """
         try:
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+            mtime_ns = os.stat(config_path).st_mtime_ns
         except FileNotFoundError:
-            print(f"Error: Config file not found at {config_path}. Using default settings.")
+            logger.warning("Config file not found at %s. Using default settings.", config_path)
             return {}
+        # Only imported once there is a config file to parse
+        import yaml
+        try:
+            return _cached_load_config(config_path, mtime_ns)
         except yaml.YAMLError as e:
-            print(f"Error parsing config file {config_path}: {e}. Using default settings.")
+            logger.warning("Error parsing config file %s: %s. Using default settings.", config_path, e)
             return {}
 
+    def _resolve_response_format(self):
+        """
+        Asks for schema-conforming (or at least bare) JSON where the provider supports it.
+
+        Runs once, before the LLM settings are first hashed into a cache key or sent with a request,
+        so that constructing a detector does not import litellm. A `response_format` set in the
+        config is kept as is. The final settings are then cached as the keyword arguments of every
+        request and as the settings part of the result cache keys.
+        """
+        if self._response_format_resolved:
+            return
+        self._response_format_resolved = True
+        if "response_format" not in self.llm_settings:
+            response_format = _response_format_for(self.llm_settings.get("model"))
+            if response_format is not None:
+                self.llm_settings["response_format"] = response_format
+        # In JSON mode answers are never wrapped in markdown, so fence stripping is skipped
+        self._json_mode = (self.llm_settings.get("response_format") or {}).get("type") in _JSON_RESPONSE_FORMATS
+        self._completion_kwargs = dict(self.llm_settings)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps(self.llm_settings, sort_keys=True, default=str).encode())
+        digest.update(b"\0%d\0" % self._PROMPT_VERSION)
+        self._settings_digest = digest
+
+    def set_llm_settings(self, llm_settings: Mapping[str, Any]):
+        """
+        Replaces the LLM settings used for subsequent requests.
+
+        Request kwargs, the response format and cache keys are derived from the settings once, so
+        settings must be changed through this method rather than by mutating `llm_settings`.
+
+        Args:
+            llm_settings: litellm parameters (model, temperature, ...), optionally with a `retry` entry.
+        """
+        self.llm_settings = dict(llm_settings)
+        if "retry" in self.llm_settings:
+            self.retry_settings = {**_DEFAULT_RETRY, **(self.llm_settings.pop("retry") or {})}
+        self._response_format_resolved = False
+
     def detect_concepts_and_build_graph(self, text: str) -> ProcessorOutput:
         """
         Detects concepts and relationships in text using an LLM based on configured settings.
         Returns structured data representing the extracted information.
 
+        This is a single-text batch; see `detect_concepts_and_build_graph_batch`.
+
         Args:
             text: The input text to process.
 
         Returns:
             ProcessorOutput: An object containing the extracted concepts and events/relationships.
-            Returns an empty ProcessorOutput if detection fails or text is empty.
+            Returns an empty ProcessorOutput if detection fails or text is empty or too short.
+        """
+        return self.detect_concepts_and_build_graph_batch([text])[0]
+
+    def detect_concepts_and_build_graph_batch(self, texts: List[str], batch_size: int = 16) -> List[ProcessorOutput]:
+        """
+        Detects concepts and relationships in many texts, sending up to `batch_size` texts per LLM call.
+
+        The texts of a batch are numbered in one prompt and the LLM is asked for one result per text,
+        so the instructions and the network round-trip are shared by the whole batch. Texts longer
+        than `chunk_tokens` tokens are instead sent as several overlapping chunks, one per call, and
+        their results are merged.
+
+        Args:
+            texts: The input texts to process.
+            batch_size: Maximum number of texts sent in a single LLM call.
+
+        Returns:
+            List[ProcessorOutput]: One output per input text, in input order. Empty or too short texts, and texts
+            whose batch failed or for which the LLM returned no result, get an empty ProcessorOutput.
+        """
+        outputs = [ProcessorOutput() for _ in texts]
+        extracted_at = datetime.now()
+        # Empty or too short texts are never sent to the LLM, and neither are texts with a cached result.
+        # Batches hold (text index, text or chunk, whether it is the text's last chunk); the chunks of a
+        # long text are sent one per request, as several of them would not fit in one prompt
+        pending = []
+        chunked_batches = []
+        chunk_counts = {}
+        for i, text in enumerate(texts):
+            if not self._is_extractable(text):
+                continue
+            cached = self._cached_result(text)
+            if cached is not None:
+                outputs[i] = self._build_output(cached, extracted_at)
+                continue
+            chunks = self._split_text(text)
+            chunk_counts[i] = len(chunks)
+            if len(chunks) == 1:
+                pending.append((i, text, True))
+            else:
+                chunked_batches.extend([(i, chunk, n == len(chunks))] for n, chunk in enumerate(chunks, start=1))
+        batches = [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+        batches.extend(chunked_batches)
+
+        chunk_results = {}
+        unaligned = set()
+        for batch in batches:
+            results = self._request_batch([chunk for _, chunk, _ in batch])
+            if len(results) != len(batch):
+                unaligned.update(i for i, _, _ in batch)
+            for (i, _, _), result in zip(batch, results):
+                chunk_results.setdefault(i, []).append(result)
+            # All events extracted from one LLM answer share a single clock read
+            extracted_at = datetime.now()
+            for i, _, last in batch:
+                results_of_text = chunk_results.pop(i, None) if last else None
+                if not results_of_text:
+                    continue
+                result = self._merge_results(results_of_text)
+                # Like whole batches, texts whose chunks may be misaligned with their results are not cached
+                if i not in unaligned and len(results_of_text) == chunk_counts[i]:
+                    self._store_results([texts[i]], [result])
+                outputs[i] = self._build_output(result, extracted_at)
+        return outputs
+
+    def _is_extractable(self, text: str) -> bool:
+        """
+        Cheap pre-check deciding whether a text is worth an LLM call.
+
+        Streaming ingestors produce many empty, whitespace-only or very short fragments; answering
+        those locally skips a network round-trip that could only return nothing.
+
+        Args:
+            text: The input text.
+
+        Returns:
+            bool: False for empty texts, texts shorter than `min_text_len` once stripped, and texts
+            without any word character.
+        """
+        return bool(text) and len(text.strip()) >= self.min_text_len and _WORD_CHAR.search(text) is not None
+
+    def _split_text(self, text: str) -> List[str]:
+        """
+        Splits a text longer than `chunk_tokens` tokens into overlapping token windows.
+
+        Oversized prompts are rejected or silently truncated by providers and dominate the latency
+        of their batch; chunks of bounded size keep every request within the model's context.
+
+        Args:
+            text: The input text.
+
+        Returns:
+            List[str]: The text itself if it fits (or chunking is disabled), otherwise windows of
+            `chunk_tokens` tokens, each starting `chunk_tokens - chunk_overlap` tokens after the previous.
+        """
+        # A token spans at least one character, so short texts are never tokenized
+        if not self.chunk_tokens or len(text) <= self.chunk_tokens:
+            return [text]
+        litellm, model = _litellm(), self.llm_settings.get("model")
+        tokens = litellm.encode(model=model, text=text)
+        if len(tokens) <= self.chunk_tokens:
+            return [text]
+        step = max(self.chunk_tokens - self.chunk_overlap, 1)
+        return [litellm.decode(model=model, tokens=tokens[start:start + self.chunk_tokens])
+                for start in range(0, max(len(tokens) - self.chunk_overlap, 1), step)]
+
+    @staticmethod
+    def _merge_results(results: List[dict]) -> dict:
+        """
+        Combines the result objects of a text's chunks; duplicates are removed by `_build_output`.
+        """
+        if len(results) == 1:
+            return results[0]
+        return {
+            "concepts": [name for result in results for name in result.get("concepts", [])],
+            "relationships": [relation for result in results for relation in result.get("relationships", [])],
+        }
+
+    def _cache_key(self, text: str) -> str:
+        """
+        Builds the result cache key for a text.
+
+        Args:
+            text: The input text.
+
+        Returns:
+            str: A digest of the LLM settings (model, temperature, ...), the prompt version and the text.
+        """
+        self._resolve_response_format()
+        # The settings and prompt version are hashed once; only the text is added per key
+        digest = self._settings_digest.copy()
+        digest.update(text.encode())
+        return digest.hexdigest()
+
+    def _cached_result(self, text: str) -> Optional[dict]:
+        """
+        Returns the cached LLM result for a text, or None if it is not cached (or caching is disabled).
+        """
+        if self._cache is None:
+            return None
+        return self._cache.get(self._cache_key(text))
+
+    def _store_results(self, texts: List[str], results: List[dict]):
+        """
+        Caches the per-text results of one LLM answer.
+
+        Results are only cached when the LLM returned exactly one per text; otherwise their
+        alignment with the texts is uncertain.
+        """
+        if self._cache is None or len(results) != len(texts):
+            return
+        for text, result in zip(texts, results):
+            self._cache[self._cache_key(text)] = result
+
+    def _retry_delay(self, attempt: int) -> float:
+        """
+        Returns the seconds to wait before retry number `attempt` (0-based), with random jitter so
+        that concurrent callers hitting the same rate limit do not retry in lockstep.
+        """
+        retry = self.retry_settings
+        return min(retry["max"], retry["initial"] * 2 ** attempt + random.uniform(0, retry["jitter"]))
+
+    def _completion(self, messages: List[dict], **kwargs):
+        """
+        Calls `litellm.completion` with the configured LLM settings, retrying transient errors.
+
+        Rate-limit, connection and timeout errors are retried with exponential backoff up to
+        `retry_settings["attempts"]` attempts in total; the last error, and any other error, is raised.
+
+        Args:
+            messages: The chat messages.
+            **kwargs: Extra request arguments (e.g. stream), passed to litellm with the LLM settings.
+
+        Returns:
+            The litellm response.
         """
-        if not text:
+        litellm, retryable = _litellm(), _retryable_errors()
+        attempts = self.retry_settings["attempts"]
+        for attempt in range(attempts):
+            try:
+                return litellm.completion(messages=messages, **self._completion_kwargs, **kwargs)
+            except retryable as e:
+                if attempt + 1 >= attempts:
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.warning("LLM call failed (%s). Retrying in %.1fs.", e, delay)
+                time.sleep(delay)
+
+    async def _acompletion(self, messages: List[dict], **kwargs):
+        """
+        Async counterpart of `_completion`, using `litellm.acompletion` and non-blocking waits.
+        """
+        litellm, retryable = _litellm(), _retryable_errors()
+        attempts = self.retry_settings["attempts"]
+        for attempt in range(attempts):
+            try:
+                return await litellm.acompletion(messages=messages, **self._completion_kwargs, **kwargs)
+            except retryable as e:
+                if attempt + 1 >= attempts:
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.warning("LLM call failed (%s). Retrying in %.1fs.", e, delay)
+                await asyncio.sleep(delay)
+
+    def _request_batch(self, texts: List[str]) -> List[dict]:
+        """
+        Sends one LLM request for a batch of texts and returns the parsed per-text results.
+
+        Args:
+            texts: The non-empty texts of the batch.
+
+        Returns:
+            List[dict]: The result objects returned by the LLM, in text order; may be shorter than
+            `texts` if the LLM omitted results, and is empty if the call (after retries) or JSON parsing failed.
+        """
+        self._resolve_response_format()
+        try:
+            # Call the LLM using litellm with configured parameters, retrying transient errors
+            response = self._completion(self._build_messages(texts))
+            return self._parse_llm_response(response.choices[0].message.content, len(texts), strip_fences=not self._json_mode)
+        except Exception as e:
+            logger.warning("Error during LLM call or concept extraction: %s", e)
+            return []
+
+    async def _arequest_batch(self, texts: List[str]) -> List[dict]:
+        """
+        Async counterpart of `_request_batch`, using `litellm.acompletion`.
+
+        Args:
+            texts: The non-empty texts of the batch.
+
+        Returns:
+            List[dict]: The parsed per-text results (see `_request_batch`).
+        """
+        self._resolve_response_format()
+        try:
+            response = await self._acompletion(self._build_messages(texts))
+            return self._parse_llm_response(response.choices[0].message.content, len(texts), strip_fences=not self._json_mode)
+        except Exception as e:
+            logger.warning("Error during LLM call or concept extraction: %s", e)
+            return []
+
+    @classmethod
+    def _build_messages(cls, texts: List[str]) -> List[dict]:
+        """
+        Builds the chat messages asking the LLM to extract concepts and relationships from numbered texts.
+
+        Only the numbered texts vary between calls, and they are the whole user message; the
+        instructions are the prebuilt system message.
+
+        Args:
+            texts: The texts of the batch.
+
+        Returns:
+            List[dict]: The system and user messages.
+        """
+        numbered_texts = "\n\n".join(f"Text {number}:\n{text}" for number, text in enumerate(texts, start=1))
+        return [cls._SYSTEM_MSG, {"role": "user", "content": numbered_texts}]
+
+    @staticmethod
+    def _parse_llm_response(response_content: str, expected_results: int, strip_fences: bool = True) -> List[dict]:
+        """
+        Parses the LLM's JSON answer into per-text result objects.
+
+        Shared by the sync and async request paths; performs no I/O.
+
+        Args:
+            response_content: The raw message content returned by the LLM.
+            expected_results: Number of texts in the batch, used to warn about missing results.
+            strip_fences: Whether to remove a markdown code fence around the JSON. Not needed when
+                the request used a JSON response format.
+
+        Returns:
+            List[dict]: The result objects, or an empty list if the content is not valid JSON.
+        """
+        # Extract the JSON string from the response
+        response_content = response_content.strip()
+
+        # Remove a markdown code fence (```json ... ``` or ``` ... ```) around the JSON, if any.
+        # removeprefix/removesuffix strip exactly the fence, unlike rstrip's character-set stripping
+        if strip_fences and response_content.startswith("```"):
+            response_content = response_content.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+
+        try:
+            data = _json_loads(response_content)
+        except json.JSONDecodeError as e:
+             logger.warning("Error decoding JSON from LLM response: %s", e)
+             logger.debug("LLM Response content: %s", response_content) # Log the raw response for debugging
+             return [] # Empty outputs on JSON error
+
+        results = data.get("results", [])
+        if len(results) != expected_results:
+            logger.warning("LLM returned %d results for a batch of %d texts.", len(results), expected_results)
+        return results
+
+    async def adetect_concepts_and_build_graph(self, text: str) -> ProcessorOutput:
+        """
+        Async version of `detect_concepts_and_build_graph`, using `litellm.acompletion`.
+
+        Args:
+            text: The input text to process.
+
+        Returns:
+            ProcessorOutput: The extracted concepts and events/relationships, or an empty
+            ProcessorOutput if detection fails or text is empty or too short.
+        """
+        if not self._is_extractable(text):
+            return ProcessorOutput()
+        cached = self._cached_result(text)
+        if cached is not None:
+            return self._build_output(cached, datetime.now())
+        # Chunks of a long text are requested one after another, so adetect_many's concurrency bound holds
+        results = []
+        chunks = self._split_text(text)
+        for chunk in chunks:
+            results.extend(await self._arequest_batch([chunk]))
+        if not results:
             return ProcessorOutput()
+        result = self._merge_results(results)
+        if len(results) == len(chunks):
+            self._store_results([text], [result])
+        return self._build_output(result, datetime.now())
 
-        # Define the prompt for the LLM
-        # We ask the LLM to output concepts and relationships in a simple, parsable format.
-        # Asking for JSON output is generally robust for parsing.
-        prompt = f"""Analyze the following text and extract key concepts and their relationships.
-        Please output the concepts and relationships in a JSON format.
-        The JSON should have two keys: "concepts" and "relationships".
-        "concepts" should be a list of strings, where each string is a key concept found in the text.
-        "relationships" should be a list of lists, where each inner list contains two strings [concept_A, concept_B] indicating that concept_A is related to concept_B.
-        Only include concepts and relationships that are directly mentioned or strongly implied in the text.
+    async def adetect_many(self, texts: List[str], max_concurrency: Optional[int] = None) -> List[ProcessorOutput]:
+        """
+        Detects concepts in many texts with concurrent LLM calls, one call per text.
 
-        Text:
-        {text}
+        At most `max_concurrency` requests are in flight at once, so network latency overlaps
+        across texts without exceeding provider rate limits.
 
-        JSON Output:
+        Args:
+            texts: The input texts to process.
+            max_concurrency: Maximum number of concurrent LLM calls. Defaults to the config's
+                `max_concurrency` setting (10 if unset).
+
+        Returns:
+            List[ProcessorOutput]: One output per input text, in input order. A text whose call
+            raised gets an empty ProcessorOutput instead of aborting the others.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+
+        async def detect(text: str) -> ProcessorOutput:
+            async with semaphore:
+                return await self.adetect_concepts_and_build_graph(text)
+
+        results = await asyncio.gather(*(detect(text) for text in texts), return_exceptions=True)
+        outputs = []
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning("Error during async concept detection: %s", result)
+                result = ProcessorOutput()
+            outputs.append(result)
+        return outputs
+
+    def _build_output(self, result: dict, extracted_at: datetime) -> ProcessorOutput:
         """
+        Converts one parsed LLM result object into a ProcessorOutput.
 
+        Args:
+            result: A dict with "concepts" (list of names) and "relationships" (list of name pairs).
+            extracted_at: Timestamp given to every relationship event of the result.
+
+        Returns:
+            ProcessorOutput: The distinct concepts (including names only found in relationships)
+            and one relationship event per unordered pair. Malformed results yield whatever could
+            be extracted before the problem.
+        """
         extracted_concepts = []
         extracted_events = []
 
         try:
-            # Call the LLM using litellm with configured parameters
-            response = litellm.completion(
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant that extracts concepts and relationships from text."},
-                    {"role": "user", "content": prompt}
-                ],
-                **self.llm_settings # Pass LLM parameters from config
-            )
-
-            # Extract the JSON string from the response
-            response_content = response.choices[0].message.content.strip()
-
-            # Attempt to parse the JSON output
-            if response_content.startswith("```json"):
-                response_content = response_content[len("```json"):].rstrip("```")
-
-            try:
-                data = json.loads(response_content)
-            except json.JSONDecodeError as e:
-                 print(f"Error decoding JSON from LLM response: {e}")
-                 print("LLM Response content:", response_content) # Print the raw response for debugging
-                 return ProcessorOutput() # Return empty output on JSON error
+            # Concept names in first-seen order; LLMs often repeat names, and each becomes one concept
+            concept_names = dict.fromkeys(_intern_name(concept_name) for concept_name in result.get("concepts", []))
 
-            concepts_list = data.get("concepts", [])
-            relationships_list = data.get("relationships", [])
+            # Create ExtractedEvent instances for relationships, once per unordered pair. Malformed
+            # entries (anything but a pair) are skipped
+            seen_pairs = set()
+            for relation in result.get("relationships", []):
+                if not (isinstance(relation, (list, tuple)) and len(relation) == 2):
+                    continue
+                pair = frozenset(relation)
+                if pair in seen_pairs:
+                    continue
+                seen_pairs.add(pair)
+                concept_a_name, concept_b_name = _intern_name(relation[0]), _intern_name(relation[1])
+                extracted_events.append(self._relationship_event(concept_a_name, concept_b_name, extracted_at))
+                # Names only mentioned in relationships are concepts too
+                concept_names.setdefault(concept_a_name)
+                concept_names.setdefault(concept_b_name)
 
             # Create ExtractedConcept instances
-            for concept_name in concepts_list:
-                # ConceptDetector doesn't assign IDs, that's for the Integrator
-                extracted_concepts.append(ExtractedConcept(name=concept_name))
-
-            # Create ExtractedEvent instances for relationships
-            for relation in relationships_list:
-                if len(relation) == 2:
-                    concept_a_name, concept_b_name = relation
-                    # ExtractedEvent refers to concepts by their names
-                    involved_concept_identifiers = [concept_a_name, concept_b_name]
-
-                    # Create an ExtractedEvent representing the relationship
-                    # Event ID is assigned by the Integrator
-                    relationship_event = ExtractedEvent(
-                        concept_identifiers=involved_concept_identifiers,
-                        timestamp=datetime.now(),
-                        delta=0.0, # No state change implied by just a relationship
-                        event_type='relationship',
-                        properties={
-                            "source": "ConceptDetector_LLM", 
-                            "relationship": f"{concept_a_name} <-> {concept_b_name}" # Store original names/relation
-                         }
-                    )
-                    extracted_events.append(relationship_event)
+            # ConceptDetector doesn't assign IDs, that's for the Integrator
+            extracted_concepts = [ExtractedConcept(name=concept_name) for concept_name in concept_names]
 
         except Exception as e:
-            print(f"Error during LLM call or concept extraction: {e}")
-            # Continue and return whatever was extracted before the error, or an empty output
+            logger.warning("Error during concept extraction: %s", e)
+            # Continue and return whatever was extracted before the error
 
         # Return ProcessorOutput
         return ProcessorOutput(extracted_concepts=extracted_concepts, extracted_events=extracted_events)
 
+    @staticmethod
+    def _relationship_event(concept_a_name: str, concept_b_name: str, timestamp: datetime) -> ExtractedEvent:
+        """
+        Creates the ExtractedEvent representing a relationship between two named concepts.
+
+        Args:
+            concept_a_name: Name of the first concept.
+            concept_b_name: Name of the second concept.
+            timestamp: The extraction time; callers read the clock once per LLM answer, not per event.
+
+        Returns:
+            ExtractedEvent: A 'relationship' event referring to the concepts by name.
+        """
+        # ExtractedEvent refers to concepts by their names; the Event ID is assigned by the Integrator
+        concept_a_name, concept_b_name = _intern_name(concept_a_name), _intern_name(concept_b_name)
+        return ExtractedEvent(
+            concept_identifiers=[concept_a_name, concept_b_name],
+            timestamp=timestamp,
+            delta=0.0, # No state change implied by just a relationship
+            event_type='relationship',
+            properties={
+                "source": "ConceptDetector_LLM",
+                "relationship": f"{concept_a_name} <-> {concept_b_name}" # Store original names/relation
+             }
+        )
+
+    def stream_detect(self, text: str) -> Iterator[Union[ExtractedConcept, ExtractedEvent]]:
+        """
+        Detects concepts and relationships in text, yielding each one as soon as the LLM has produced it.
+
+        The LLM response is streamed and parsed incrementally, so extraction overlaps with generation
+        instead of waiting for the complete JSON document.
+
+        Args:
+            text: The input text to process.
+
+        Yields:
+            Union[ExtractedConcept, ExtractedEvent]: Each distinct concept and relationship event, in
+            the order the LLM emits them; a concept only named in a relationship is yielded just
+            before its first event. Nothing is yielded for empty or too short text; on an LLM error the stream ends early.
+        """
+        if not self._is_extractable(text):
+            return
+
+        # One clock read for everything extracted from this text
+        extracted_at = datetime.now()
+        cached = self._cached_result(text)
+        if cached is not None:
+            output = self._build_output(cached, extracted_at)
+            yield from output.extracted_concepts
+            yield from output.extracted_events
+            return
+
+        self._resolve_response_format()
+        results = []
+        chunks = self._split_text(text)
+        try:
+            # Duplicates are dropped as in _build_output, across all chunks of the text
+            seen_names, seen_pairs = set(), set()
+            for text_chunk in chunks:
+                parser = _StreamingExtractionParser()
+                # Only opening the stream is retried; an error mid-stream ends it
+                response = self._completion(self._build_messages([text_chunk]), stream=True)
+                for chunk in response:
+                    for kind, value in parser.feed(chunk.choices[0].delta.content or ""):
+                        if kind == "concept":
+                            names = (_intern_name(value),)
+                        else:
+                            pair = frozenset(value)
+                            if pair in seen_pairs:
+                                continue
+                            seen_pairs.add(pair)
+                            names = tuple(map(_intern_name, value))
+                        for name in names:
+                            if name not in seen_names:
+                                seen_names.add(name)
+                                yield ExtractedConcept(name=name)
+                        if kind == "relationship":
+                            yield self._relationship_event(*names, extracted_at)
+                # The complete answer is available once the stream ends; cache it like a regular response
+                results.extend(self._parse_llm_response(parser.text, 1, strip_fences=not self._json_mode))
+            if len(results) == len(chunks):
+                self._store_results([text], [self._merge_results(results)])
+        except Exception as e:
+            logger.warning("Error during streaming LLM call or concept extraction: %s", e)
+
+
+class _StreamingExtractionParser:
+    """
+    Incremental scanner for the detector's JSON answer, fed with arbitrary chunks of text.
+
+    Tracks string/escape state and a stack of open containers (with the object key each one is the
+    value of), and reports every string element of a "concepts" array and every two-element array
+    inside a "relationships" array as soon as it closes. Each element is decoded on its own, so a
+    malformed element is skipped without losing the rest of the stream. Characters outside the JSON
+    structure (such as a ```json fence) are ignored.
+    """
+
+    def __init__(self):
+        # The response received so far
+        self.text = ""
+        self._pos = 0
+        self._in_string = False
+        self._escaped = False
+        self._string_start = 0
+        # Open containers as [opening char, key it is the value of, start offset, expecting a key]
+        self._stack: List[list] = []
+        self._pending_key: Optional[str] = None
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Consumes a chunk of the response.
+
+        Args:
+            chunk: The next piece of the response text.
+
+        Returns:
+            List[Tuple[str, Any]]: Completed elements, as ("concept", name) or ("relationship", [a, b]).
+        """
+        self.text += chunk
+        completed = []
+        buffer, stack = self.text, self._stack
+        for pos in range(self._pos, len(buffer)):
+            char = buffer[pos]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    self._string_closed(buffer[self._string_start:pos + 1], completed)
+            elif char == '"':
+                self._in_string = True
+                self._string_start = pos
+            elif char in "{[":
+                key = self._pending_key if stack and stack[-1][0] == "{" else None
+                stack.append([char, key, pos, char == "{"])
+                self._pending_key = None
+            elif char in "}]":
+                if not stack:
+                    continue
+                _, key, start, _ = stack.pop()
+                if char == "]" and stack and stack[-1][0] == "[" and stack[-1][1] == "relationships":
+                    relation = self._decode(buffer[start:pos + 1])
+                    if isinstance(relation, list) and len(relation) == 2:
+                        completed.append(("relationship", relation))
+            elif char == ":" and stack and stack[-1][0] == "{":
+                stack[-1][3] = False
+            elif char == "," and stack and stack[-1][0] == "{":
+                stack[-1][3] = True
+                self._pending_key = None
+        self._pos = len(buffer)
+        return completed
+
+    def _string_closed(self, raw: str, completed: List[Tuple[str, Any]]):
+        """
+        Handles a complete JSON string literal: an object key or a concept name.
+        """
+        stack = self._stack
+        if not stack:
+            return
+        top = stack[-1]
+        if top[0] == "{" and top[3]:
+            self._pending_key = self._decode(raw)
+        elif top[0] == "[" and top[1] == "concepts":
+            name = self._decode(raw)
+            if isinstance(name, str):
+                completed.append(("concept", name))
+
+    @staticmethod
+    def _decode(raw: str) -> Any:
+        """
+        Decodes one JSON element, returning None if it is malformed.
+        """
+        try:
+            return _json_loads(raw)
+        except json.JSONDecodeError as e:
+            logger.warning("Skipping malformed element in streamed LLM response: %s", e)
+            return None
+
 # Example Usage (for testing, not part of the class)
 # if __name__ == "__main__":
 #     # Need a dummy config.yaml or ensure one exists for initialization
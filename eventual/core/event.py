@@ -1,10 +1,26 @@
+import json
+import sys
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING, Dict, Any, Set
-from uuid import uuid4
+from eventual.core.identifiers import generate_id
 
 if TYPE_CHECKING:
     from .concept import Concept # For type hinting
 
+# Bound `format` of the context description template, looked up once instead of per event
+_DESCRIPTION_TEMPLATE = "Event {eid}: Concepts [{cs}], Delta {d}, Metadata {m}".format
+
+def _canonical_metadata(metadata: dict[str, any]) -> str:
+    """
+    Serialize metadata to a stable string: JSON with sorted keys, falling back to `str()` for
+    values JSON cannot represent. Equal metadata always yields the same string.
+    """
+    try:
+        return json.dumps(metadata, sort_keys=True, default=str)
+    except TypeError:
+        # Keys of mixed types cannot be sorted
+        return repr(metadata)
+
 class Event:
     """
     Represents a discrete event in the event-based hypergraph.
@@ -16,7 +32,8 @@ class Event:
     it involves, a delta (which might be 0 for relational events), and a type.
 
     Attributes:
-        event_id (str): A unique identifier for the event.
+        event_id (str): A unique identifier for the event. Must not change after construction, since
+                        it determines the event's (cached) hash.
         timestamp (datetime): The time at which the event occurred.
         concepts (set[Concept]): The set of concepts involved in this event.
         delta (float): The magnitude of the change (e.g., in a concept's state if the event is about a single concept's change,
@@ -25,6 +42,12 @@ class Event:
         event_type (str): The type of the event (e.g., 'state_change', 'relationship').
     """
 
+    # Slots drop the per-instance __dict__, shrinking every event and speeding attribute access
+    __slots__ = (
+        "event_id", "timestamp", "_concepts", "_concept_ids", "_cached_concept_names_str", "_delta", "_delta_str",
+        "_metadata", "_metadata_canonical", "_cached_description", "event_type", "_hash",
+    )
+
     def __init__(
         self,
         concepts: set['Concept'], # Changed from concept_id: str
@@ -41,21 +64,144 @@ class Event:
             concepts (set[Concept]): The set of concepts involved in this event.
             delta (float): The magnitude of the change or a value associated with the event.
             timestamp (Optional[datetime]): The time at which the event occurred.
-                Defaults to the current time if not provided.
+                Defaults to the current time if not provided. When creating many events at once,
+                read the clock once and pass the same timestamp rather than relying on the default.
             metadata (Optional[dict[str, any]]): Additional metadata associated with the event.
                 Defaults to an empty dictionary if not provided.
-            event_id (Optional[str]): A unique identifier for the event. If None, a UUID is generated.
+            event_id (Optional[str]): A unique identifier for the event. If None, a unique ID is generated
+                (see `eventual.core.identifiers`).
             event_type (str): The type of the event (e.g., 'state_change', 'relationship'). Defaults to 'state_change'.
         """
         if not concepts:
             raise ValueError("An event must involve at least one concept.")
             
-        self.event_id = event_id if event_id else f"event_{uuid4().hex}"  # Generate a unique ID for the event
+        # Interned like Concept.concept_id: the ID is a dict/dedup key and appears in every description
+        self.event_id = sys.intern(event_id if event_id else generate_id("event"))
+        # Events live in sets and dict-backed indexes; the hash is computed once from the (fixed) ID
+        self._hash = hash(self.event_id)
         self.timestamp = timestamp if timestamp is not None else datetime.now()
+        self._cached_concept_names_str: Optional[str] = None
+        self._cached_description: Optional[str] = None
         self.concepts = concepts
         self.delta = delta
         self.metadata = metadata if metadata is not None else {}
-        self.event_type = event_type # Assign the event type
+        # A handful of event types is shared by every event; interning keeps one string per type even
+        # for events loaded from JSON or msgpack, where each value is parsed into a new string
+        self.event_type = sys.intern(event_type) if isinstance(event_type, str) else event_type
+
+    @property
+    def concepts(self) -> set['Concept']:
+        """
+        The set of concepts involved in this event.
+
+        Assigning a new set invalidates the cached `concept_ids`, `concept_names_str` and `description_cached`.
+        Mutating the set in place does not, so replace the set rather than editing it once the
+        event is in use.
+        """
+        return self._concepts
+
+    @concepts.setter
+    def concepts(self, concepts: set['Concept']):
+        self._concepts = concepts
+        self._concept_ids = None
+        self._cached_concept_names_str = None
+        self._cached_description = None
+
+    @property
+    def concept_ids(self) -> frozenset[str]:
+        """
+        The IDs of the concepts involved in this event.
+
+        Built once per assigned `concepts` set. Comparing these frozensets is cheaper than comparing
+        sets of Concept objects, and their hash is computed once and cached.
+        """
+        if self._concept_ids is None:
+            self._concept_ids = frozenset(concept.concept_id for concept in self._concepts)
+        return self._concept_ids
+
+    @property
+    def delta(self) -> float:
+        """
+        The magnitude of the change or a value associated with the event.
+        """
+        return self._delta
+
+    @delta.setter
+    def delta(self, delta: float):
+        self._delta = delta
+        # Pre-format once; the same event is described in many context generations
+        self._delta_str = f"{delta:.2f}"
+        self._cached_description = None
+
+    @property
+    def metadata(self) -> dict[str, any]:
+        """
+        Additional metadata associated with the event.
+
+        Assigning a new dict or calling `add_metadata` refreshes `metadata_canonical` and
+        `description_cached`; mutating the dict in place does not.
+        """
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, metadata: dict[str, any]):
+        self._metadata = metadata
+        self._metadata_canonical = _canonical_metadata(metadata)
+        self._cached_description = None
+
+    def add_metadata(self, key: str, value: any):
+        """
+        Add or update metadata for the event.
+
+        Args:
+            key (str): The metadata key.
+            value (any): The metadata value.
+        """
+        self._metadata[key] = value
+        self._metadata_canonical = _canonical_metadata(self._metadata)
+        self._cached_description = None
+
+    @property
+    def metadata_canonical(self) -> str:
+        """
+        The metadata as canonical JSON (sorted keys), computed when the metadata is set.
+
+        Used verbatim in `description_cached`, and stable enough to serve as a cache or
+        deduplication key for the event's metadata.
+        """
+        return self._metadata_canonical
+
+    @property
+    def concept_names_str(self) -> str:
+        """
+        The names of the involved concepts, sorted and joined with ", ".
+
+        Computed on first access and reused afterwards, since context generation formats
+        the same events over and over.
+
+        Returns:
+            str: The comma-separated, sorted concept names.
+        """
+        if self._cached_concept_names_str is None:
+            self._cached_concept_names_str = ", ".join(sorted(c.name for c in self._concepts))
+        return self._cached_concept_names_str
+
+    @property
+    def description_cached(self) -> str:
+        """
+        A one-line description of the event used when building LLM context, e.g.
+        `Event event_1: Concepts [apple, banana], Delta 0.10, Metadata {"source": "chat"}`.
+
+        Built on first access and reused until the concepts, delta or metadata are replaced.
+
+        Returns:
+            str: The event description.
+        """
+        if self._cached_description is None:
+            self._cached_description = _DESCRIPTION_TEMPLATE(
+                eid=self.event_id, cs=self.concept_names_str, d=self._delta_str, m=self._metadata_canonical
+            )
+        return self._cached_description
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -67,7 +213,7 @@ class Event:
         return {
             "event_id": self.event_id,
             "timestamp": self.timestamp.isoformat(),
-            "concept_ids": [concept.concept_id for concept in self.concepts], # Store concept IDs
+            "concept_ids": list(self.concept_ids), # Store concept IDs
             "delta": self.delta,
             "metadata": self.metadata,
             "event_type": self.event_type, # Include event_type in dict
@@ -119,10 +265,9 @@ class Event:
         Returns:
             str: A string representation of the event.
         """
-        concept_names = ", ".join(sorted([c.name for c in self.concepts]))
         return (
             f"Event(event_id={self.event_id}, timestamp={self.timestamp}, "
-            f"concepts=[{concept_names}], delta={self.delta}, metadata={self.metadata}, event_type={self.event_type})" # Include event_type in repr
+            f"concepts=[{self.concept_names_str}], delta={self.delta}, metadata={self.metadata}, event_type={self.event_type})" # Include event_type in repr
         )
 
     def __eq__(self, other: any) -> bool:
@@ -139,11 +284,27 @@ class Event:
             return False
         return self.event_id == other.event_id
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Return the state for pickling, leaving out the cached hash.
+
+        String hashes are randomized per process, so the hash is recomputed on unpickling instead.
+        """
+        return {name: getattr(self, name) for name in self.__slots__ if name != "_hash" and hasattr(self, name)}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        """
+        Restore a pickled event and recompute its hash.
+        """
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        self._hash = hash(self.event_id)
+
     def __hash__(self) -> int:
         """
         Return a hash value for the event based on its event_id.
 
         Returns:
-            int: A hash value based on the event's ID.
+            int: A hash value based on the event's ID, computed once at construction.
         """
-        return hash(self.event_id)
+        return self._hash
@@ -37,17 +37,178 @@ event = Event(
 hypergraph.add_event(event)
 ```
 """
+import bisect
+import dataclasses
 import json
 import logging # Import logging
-from typing import Optional, List, Set, Tuple, Dict, Any
+import math
+import sys
+import threading
+from typing import Optional, List, Set, Tuple, Dict, Any, Union, Iterable, Iterator
 from eventual.core.event import Event
-from eventual.core.concept import Concept
-from datetime import datetime, timedelta
-import spacy # Import spacy for query processing
+from eventual.core.concept import Concept, _datetime_to_ns
+from array import array
+from datetime import date, datetime, time as time_of_day, timedelta
+from enum import Enum
+from operator import attrgetter
+from types import MappingProxyType
+import numpy as np
 
 # Get the logger for this module
 logger = logging.getLogger(__name__)
 
+def _json_default(obj: Any) -> Any:
+    """
+    Convert a value the json module cannot encode the way orjson encodes it.
+
+    Dates and times become ISO 8601 strings, numpy arrays lists, numpy scalars Python numbers,
+    dataclasses dicts of their fields and enums their values; anything else becomes `str(obj)`.
+    """
+    if isinstance(obj, (date, time_of_day)):
+        return obj.isoformat()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    return str(obj)
+
+def _json_key(key: Any) -> Any:
+    """Convert a dict key the way orjson's OPT_NON_STR_KEYS does."""
+    if isinstance(key, (str, int, float, bool)) or key is None:
+        return key
+    return _json_default(key)
+
+def _json_compatible(obj: Any) -> Any:
+    """
+    Recursively prepare `obj` for the json module: non-finite floats become None and keys and
+    values the module cannot encode are converted with `_json_key`/`_json_default`.
+    """
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {_json_key(key): _json_compatible(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_json_compatible(value) for value in obj]
+    if isinstance(obj, (str, int, bool)) or obj is None:
+        return obj
+    converted = _json_default(obj)
+    return converted if isinstance(converted, str) else _json_compatible(converted)
+
+def _stdlib_json_dumps(obj: Any) -> bytes:
+    """
+    Encode `obj` with the json module into the same document orjson would produce.
+
+    Compact separators, raw UTF-8 and `_json_default` match orjson's output. NaN and infinity
+    (written as null by orjson) and keys other than str/int/float/bool/None make the fast path
+    fail, in which case the object is converted with `_json_compatible` first.
+    """
+    try:
+        return json.dumps(obj, default=_json_default, allow_nan=False, ensure_ascii=False, separators=(",", ":")).encode()
+    except (TypeError, ValueError):
+        return json.dumps(_json_compatible(obj), allow_nan=False, ensure_ascii=False, separators=(",", ":")).encode()
+
+try:
+    # orjson encodes several times faster than the json module and produces bytes directly. It is
+    # optional; without it the json module is used through _stdlib_json_dumps, which writes the
+    # same document
+    from orjson import dumps as _orjson_dumps, loads as _json_loads, OPT_NON_STR_KEYS, OPT_SERIALIZE_NUMPY
+
+    def _json_dumps(obj: Any) -> bytes:
+        return _orjson_dumps(obj, default=str, option=OPT_NON_STR_KEYS | OPT_SERIALIZE_NUMPY)
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = _stdlib_json_dumps
+
+# Pipeline components the hypergraph never uses. Lemmas need only the tokenizer, tagger, attribute
+# ruler and lemmatizer (the rule lemmatizer relies on the POS tags), and stop words are lexical
+# attributes, so the dependency parser and NER are not loaded at all
+_UNUSED_PIPES = ("parser", "ner")
+
+# Upper bound on the number of lemmas memoized per hypergraph
+_LEMMA_CACHE_SIZE = 100_000
+
+# spaCy pipeline shared by all hypergraphs, loaded on first use (see _shared_nlp)
+_NLP = None
+_NLP_LOCK = threading.Lock()
+
+def _shared_nlp():
+    """
+    Return the process-wide spaCy pipeline, importing spaCy and loading the model on first use.
+
+    Loading `en_core_web_sm` takes seconds and hundreds of MB, so hypergraphs that never lemmatize
+    (e.g. ones built only to be serialized) do not pay for it, and all hypergraphs share one
+    pipeline, which is safe for concurrent reads. The lock keeps concurrent first uses from loading
+    the model twice.
+
+    Returns:
+        spacy.Language: The pipeline without the unused components.
+    """
+    global _NLP
+    if _NLP is None:
+        with _NLP_LOCK:
+            if _NLP is None:
+                import spacy # Import spacy for query processing
+                try:
+                    _NLP = spacy.load("en_core_web_sm", exclude=_UNUSED_PIPES)
+                except OSError:
+                    print("Downloading spaCy model 'en_core_web_sm'...")
+                    from spacy.cli import download
+                    download("en_core_web_sm")
+                    _NLP = spacy.load("en_core_web_sm", exclude=_UNUSED_PIPES)
+    return _NLP
+
+class _EventTimeIndex:
+    """
+    Struct-of-arrays index of event timestamps, sorted by time.
+
+    Epoch-nanosecond timestamps and the matching event registry indices live in two parallel numpy
+    arrays that double in capacity when full. Events mostly arrive in time order and are appended;
+    an older event is inserted at its sorted position. Entries with equal timestamps are kept in
+    insertion order.
+    """
+    __slots__ = ("timestamps_ns", "indices", "size")
+
+    def __init__(self, capacity: int = 16):
+        self.timestamps_ns = np.empty(capacity, dtype=np.int64)
+        self.indices = np.empty(capacity, dtype=np.intp)
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def insert(self, timestamp_ns: int, index: int):
+        n = self.size
+        if n == len(self.indices):
+            capacity = 2 * n
+            for name in ("timestamps_ns", "indices"):
+                old = getattr(self, name)
+                new = np.empty(capacity, dtype=old.dtype)
+                new[:n] = old[:n]
+                setattr(self, name, new)
+        position = n
+        if n and timestamp_ns < self.timestamps_ns[n - 1]:
+            position = int(np.searchsorted(self.timestamps_ns[:n], timestamp_ns, side="right"))
+            self.timestamps_ns[position + 1:n + 1] = self.timestamps_ns[position:n]
+            self.indices[position + 1:n + 1] = self.indices[position:n]
+        self.timestamps_ns[position] = timestamp_ns
+        self.indices[position] = index
+        self.size = n + 1
+
+    def since(self, cutoff_ns: int) -> np.ndarray:
+        """
+        Registry indices of the entries stamped at or after `cutoff_ns`, most recent first; entries with
+        equal timestamps stay in insertion order.
+        """
+        start = int(np.searchsorted(self.timestamps_ns[:self.size], cutoff_ns, side="left"))
+        timestamps_ns = self.timestamps_ns[start:self.size]
+        indices = self.indices[start:self.size]
+        # Sort by descending timestamp, then ascending index; the slice is already in ascending order
+        return indices[np.lexsort((indices, -timestamps_ns))]
+
 class Hypergraph:
     """
     Represents a hypergraph that stores concepts and events. The hypergraph is the core data structure
@@ -58,25 +219,97 @@ class Hypergraph:
         concepts (dict[str, Concept]): A dictionary of concepts, keyed by concept ID.
         events (dict[str, Event]): A dictionary of events, keyed by event ID.
         _concept_names (dict[str, str]): Internal dictionary mapping lemmatized concept names to concept IDs for efficient lookup.
-        _nlp (spacy.Language): spaCy language model for query processing.
+        _events_by_idx (List[Event]): Registry of events in insertion order. Concepts' events are recorded
+                                      by index into this list rather than as the objects.
+        _event_positions (dict[str, int]): Registry index of each event, keyed by event ID.
+        _concept_event_indices (dict[str, array]): Registry indices of each concept's events, keyed by concept
+                                                   ID. Owned by the hypergraph, so a concept can belong to
+                                                   several hypergraphs; the concept links to the array to
+                                                   expose its `events`.
+        _events_by_time (_EventTimeIndex): Timestamps (as datetime64-compatible epoch nanoseconds) and registry
+                                           indices of every event in packed arrays sorted by time, so recent
+                                           events are found by binary search. Recorded when the event is
+                                           added; later timestamp changes are not seen.
+        _events_by_concept_set (dict[frozenset[str], List[int]]): Registry indices of events keyed by the IDs of
+                                                                  their concepts, for exact concept-set lookups.
+        _name_search_index (Optional[Tuple[str, List[int], List[str]]]): The lemmatized names joined into one string,
+                                                                          with each name's start offset and concept
+                                                                          ID, for `search_concepts_by_name`. Built on
+                                                                          first search, dropped when a concept is added.
+        _concept_name_by_id (dict[str, str]): Internal dictionary mapping concept IDs to concept names, so that
+                                              name-only queries (`retrieve_knowledge_names`) need not touch
+                                              Concept objects.
+        _nlp (spacy.Language): spaCy language model for query processing, loaded on first use and shared
+                               by all hypergraphs.
+        _lemma_cache (dict[str, str]): Lemmas already computed by `_get_lemma`, keyed by the raw text, so
+                                       repeated words and names do not run the spaCy pipeline again.
+        _version (int): Monotonically increasing mutation counter. Every method that adds concepts or
+                        events bumps it, so callers that cache derived results (e.g. the
+                        SituationalAwarenessAdapter) can detect that the hypergraph has changed.
+                        Code that mutates `concepts`/`events` directly must bump it as well.
     """
 
-    def __init__(self):
+    def __init__(self, lemma_cache_path: Optional[str] = None):
         """
         Initialize an empty Hypergraph.
+
+        Args:
+            lemma_cache_path (Optional[str]): Path of a lemma cache written by `save_lemma_cache`. Loading
+                                              one makes lemmatizing frequent words free from the start.
         """
         self.concepts: dict[str, Concept] = {}
         self.events: dict[str, Event] = {}
+        self._events_by_idx: List[Event] = []
+        self._event_positions: dict[str, int] = {}
+        self._concept_event_indices: dict[str, array] = {}
+        self._events_by_time = _EventTimeIndex()
+        self._events_by_concept_set: dict[frozenset, List[int]] = {}
         # Use lemmatized lower-case names for efficient lookup
         self._concept_names: dict[str, str] = {}
+        self._concept_name_by_id: dict[str, str] = {}
+        self._name_search_index: Optional[Tuple[str, List[int], List[str]]] = None
+        self._version: int = 0
+        # Resolved to the shared pipeline on first use; see the _nlp property
+        self._nlp_pipeline = None
+        self._lemma_cache: dict[str, str] = {}
+        if lemma_cache_path:
+            self.load_lemma_cache(lemma_cache_path)
+
+    @property
+    def _nlp(self):
+        """
+        The spaCy pipeline used for lemmatization, loaded lazily and shared between hypergraphs.
+        """
+        if self._nlp_pipeline is None:
+            self._nlp_pipeline = _shared_nlp()
+        return self._nlp_pipeline
+
+    @_nlp.setter
+    def _nlp(self, nlp):
+        self._nlp_pipeline = nlp
+
+    def load_lemma_cache(self, path: str):
+        """
+        Add the lemmas stored in a JSON file (as written by `save_lemma_cache`) to the lemma cache.
+
+        Args:
+            path (str): Path of the JSON file mapping texts to lemmas.
+        """
         try:
-            self._nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            print("Downloading spaCy model 'en_core_web_sm'...")
-            from spacy.cli import download
-            download("en_core_web_sm")
-            self._nlp = spacy.load("en_core_web_sm")
+            with open(path, "rb") as f:
+                self._lemma_cache.update((text, sys.intern(lemma)) for text, lemma in _json_loads(f.read()).items())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load lemma cache from {path}: {e}")
 
+    def save_lemma_cache(self, path: str):
+        """
+        Write the lemma cache to a JSON file, e.g. to prepopulate the cache of future hypergraphs.
+
+        Args:
+            path (str): Path of the JSON file to write.
+        """
+        with open(path, "wb") as f:
+            f.write(_json_dumps(self._lemma_cache))
 
     def _get_lemma(self, text: str) -> str:
         """
@@ -90,10 +323,50 @@ class Hypergraph:
         """
         if not text:
             return ""
-        doc = self._nlp(text)
+        lemma = self._lemma_cache.get(text)
+        if lemma is None:
+            lemma = self._cache_lemma(text, self._nlp(text))
+        return lemma
+
+    def _get_lemmas(self, texts: List[str]) -> List[str]:
+        """
+        Gets the lemmas of several texts, as `_get_lemma` would, running the texts that are not cached
+        through spaCy as one batch.
+
+        Args:
+            texts: The input texts.
+
+        Returns:
+            The lemma of each text, in order.
+        """
+        lemmas = {text: self._lemma_cache.get(text) for text in texts if text}
+        missing = [text for text, lemma in lemmas.items() if lemma is None]
+        if missing:
+            for text, doc in zip(missing, self._nlp.pipe(missing)):
+                lemmas[text] = self._cache_lemma(text, doc)
+        return [lemmas[text] if text else "" for text in texts]
+
+    def _cache_lemma(self, text: str, doc) -> str:
+        """
+        Extracts the lemma of `text` from its spaCy doc and memoizes it.
+
+        Args:
+            text: The input text.
+            doc: The spaCy doc of `text`.
+
+        Returns:
+            The lemma of the text.
+        """
         if doc and doc[0]:
-            return doc[0].lemma_.lower()
-        return text.lower() # Fallback to lower case if lemmatization fails
+            lemma = doc[0].lemma_.lower()
+        else:
+            lemma = text.lower() # Fallback to lower case if lemmatization fails
+        # Interned, so the keys of _concept_names and the lemmas later looked up in it are the
+        # same string objects and dict probes succeed on the identity check
+        lemma = sys.intern(lemma)
+        if len(self._lemma_cache) < _LEMMA_CACHE_SIZE:
+            self._lemma_cache[text] = lemma
+        return lemma
 
     def add_concept(self, concept: Concept):
         """
@@ -116,6 +389,9 @@ class Hypergraph:
         self.concepts[concept.concept_id] = concept
         # Store the mapping from lemmatized name to concept ID
         self._concept_names[lemmatized_name] = concept.concept_id
+        self._concept_name_by_id[concept.concept_id] = concept.name
+        self._name_search_index = None
+        self._version += 1
 
     def get_concept(self, concept_id: str) -> Optional[Concept]:
         """
@@ -172,6 +448,47 @@ class Hypergraph:
         self.add_concept(concept)
         return self.get_concept(concept.concept_id) # Return the instance now stored in the hypergraph
 
+    def add_concepts_bulk(self, concepts: Iterable[Concept]) -> List[Concept]:
+        """
+        Add several concepts, each unless it already exists, as `add_concept_if_not_exists` would.
+
+        The names are lemmatized in one spaCy batch and the version is bumped once, so this is much
+        cheaper than adding the concepts one at a time. Concepts later in `concepts` that share an ID
+        or lemmatized name with an earlier one resolve to the earlier one.
+
+        Args:
+            concepts (Iterable[Concept]): The concepts to add.
+
+        Returns:
+            List[Concept]: For each concept, in order, the existing or newly added concept.
+        """
+        concepts = list(concepts)
+        if not concepts:
+            return []
+        lemmas = self._get_lemmas([concept.name for concept in concepts])
+
+        stored_concepts: List[Concept] = []
+        added = False
+        for concept, lemmatized_name in zip(concepts, lemmas):
+            # Check by ID first (primary key), then by lemmatized name
+            stored_concept = self.concepts.get(concept.concept_id)
+            if stored_concept is None:
+                existing_concept_id_by_name = self._concept_names.get(lemmatized_name)
+                if existing_concept_id_by_name:
+                    stored_concept = self.concepts[existing_concept_id_by_name]
+                else:
+                    self.concepts[concept.concept_id] = concept
+                    self._concept_names[lemmatized_name] = concept.concept_id
+                    self._concept_name_by_id[concept.concept_id] = concept.name
+                    stored_concept = concept
+                    added = True
+            stored_concepts.append(stored_concept)
+
+        if added:
+            self._name_search_index = None
+            self._version += 1
+        return stored_concepts
+
     def add_event(self, event: Event):
         """
         Add an event to the hypergraph.
@@ -185,24 +502,68 @@ class Hypergraph:
         if event.event_id in self.events:
             raise ValueError(f"Event with ID {event.event_id} already exists.")
 
-        # Ensure event concepts reference the instances stored in the hypergraph
-        hypergraph_concepts: Set[Concept] = set()
-        for concept_in_event in event.concepts:
-            stored_concept = self.get_concept(concept_in_event.concept_id)
-            if stored_concept:
-                 hypergraph_concepts.add(stored_concept)
-            else:
-                 # Use logging.warning instead of print
-                 logger.warning(f"Adding event {event.event_id} with concept {concept_in_event.concept_id} not found in hypergraph. Event not linked to this concept.")
+        # Ensure event concepts reference the instances stored in the hypergraph. The lookups run in
+        # map() rather than a Python loop calling get_concept per concept
+        concept_ids = [concept_in_event.concept_id for concept_in_event in event.concepts]
+        stored_concepts = list(map(self.concepts.get, concept_ids))
+        hypergraph_concepts: Set[Concept] = set(filter(None, stored_concepts))
+        if len(hypergraph_concepts) != len(concept_ids):
+            for concept_id, stored_concept in zip(concept_ids, stored_concepts):
+                if not stored_concept:
+                    # Use logging.warning instead of print
+                    logger.warning(f"Adding event {event.event_id} with concept {concept_id} not found in hypergraph. Event not linked to this concept.")
 
         # Update the event object's concepts to reference the stored instances
         event.concepts = hypergraph_concepts
 
+        # Link event to concept within the hypergraph's stored concepts
+        self._register_event(event)
         self.events[event.event_id] = event
+        self._version += 1
 
-        # Link event to concept within the hypergraph's stored concepts
+    def _register_event(self, event: Event):
+        """
+        Append an event to the index registry and record its index for each of its concepts.
+
+        Args:
+            event (Event): The event, whose concepts must be instances stored in this hypergraph.
+        """
+        registry = self._events_by_idx
+        index = len(registry)
+        registry.append(event)
+        self._event_positions[event.event_id] = index
+        concept_event_indices = self._concept_event_indices
         for concept in event.concepts:
-             concept.events.add(event)
+            indices = concept_event_indices.get(concept.concept_id)
+            if indices is None:
+                indices = concept_event_indices[concept.concept_id] = array("i")
+                concept._link_hypergraph(indices, registry, self._event_positions)
+            indices.append(index)
+        self._events_by_time.insert(_datetime_to_ns(event.timestamp), index)
+        # The event's concept-ID frozenset hashes its members once (order-independently) and caches the result
+        self._events_by_concept_set.setdefault(event.concept_ids, []).append(index)
+
+    def _events_of_concepts(self, concepts) -> List[Event]:
+        """
+        Collect the distinct events that involve any of the given concepts.
+
+        The concepts' event indices are merged with a single numpy union instead of a Python set of
+        Event objects, then resolved through the registry.
+
+        Args:
+            concepts (Iterable[Concept]): Concepts stored in this hypergraph.
+
+        Returns:
+            List[Event]: The events, in registration order.
+        """
+        concept_event_indices = self._concept_event_indices
+        index_arrays = [np.frombuffer(indices, dtype=np.intc)
+                        for indices in (concept_event_indices.get(concept.concept_id) for concept in concepts) if indices]
+        if not index_arrays:
+            return []
+        indices = np.unique(np.concatenate(index_arrays)) if len(index_arrays) > 1 else index_arrays[0]
+        registry = self._events_by_idx
+        return [registry[i] for i in indices.tolist()]
 
     def get_event(self, event_id: str) -> Optional[Event]:
         """
@@ -226,11 +587,8 @@ class Hypergraph:
         Returns:
             list[Event]: A list of events involving the concept.
         """
-        concept = self.get_concept(concept_id)
-        if not concept:
-            return []
-        # Return a list from the set of events for consistency with type hint
-        return list(concept.events)
+        # Resolve the concept's event indices with a C-level map over the registry, in registration order
+        return list(map(self._events_by_idx.__getitem__, self._concept_event_indices.get(concept_id, ())))
 
     def find_related_concepts(self, concept_id: str) -> set[Concept]:
         """
@@ -246,16 +604,12 @@ class Hypergraph:
         if not concept:
             return set()
 
-        related_concepts = set()
-        # Access events from the concept object retrieved from self.concepts
-        # Ensure the concept object is retrieved from the hypergraph's internal store
-        stored_concept = self.get_concept(concept_id)
-        if stored_concept:
-            for event in stored_concept.events:
-                related_concepts.update(event.concepts)
-            related_concepts.discard(stored_concept)  # Remove the original concept
-
-        return related_concepts
+        # `concept` comes from the hypergraph's internal store, so its events are the stored ones. They are
+        # read straight from this hypergraph's append-only index array rather than through the `events` set view.
+        # A single comprehension, leaving out the original concept as it goes. Event concepts are the
+        # instances stored in this hypergraph, so the stored concept is excluded by identity
+        events = map(self._events_by_idx.__getitem__, self._concept_event_indices.get(concept.concept_id, ()))
+        return {related for event in events for related in event.concepts if related is not concept}
 
     def get_events_by_concept_set(self, concept_ids: set[str]) -> list[Event]:
         """
@@ -272,15 +626,13 @@ class Hypergraph:
             # If any concept ID in the input set is not in the hypergraph, no event can match this set
             return []
 
-        matching_events = []
-        # Retrieve concept objects for the given IDs once from the hypergraph's store
-        target_concepts = {self.concepts[cid] for cid in concept_ids}
-
-        for event in self.events.values():
-            # Compare the set of concept objects in the event to the target set
-            if event.concepts == target_concepts:
-                matching_events.append(event)
-        return matching_events
+        # Events are indexed by their concept-ID set when registered, so this is a single hash lookup.
+        # The comparison of precomputed ID frozensets guards against events whose concepts were reassigned
+        # afterwards
+        target_ids = frozenset(concept_ids)
+        registry = self._events_by_idx
+        return [event for event in map(registry.__getitem__, self._events_by_concept_set.get(target_ids, ()))
+                if event.concept_ids == target_ids]
 
     def search_concepts_by_name(self, keyword: str) -> List[Concept]:
         """
@@ -293,15 +645,42 @@ class Hypergraph:
             List[Concept]: A list of concepts whose names contain the keyword.
         """
         keyword_lower = keyword.lower()
+        if "\0" in keyword_lower:
+            return []
+        # All lemmatized (already lower-case) names are searched with str.find over one NUL-separated string,
+        # so the scan runs in C rather than as a Python loop over the names. A keyword without NUL cannot
+        # match across two names
+        names, starts, concept_ids = self._get_name_search_index()
+        if not starts:
+            # No concepts; an empty keyword would otherwise "match" the empty string at offset 0
+            return []
         matching_concepts = []
-        # Iterate through concept names lookup for efficiency
-        for lemmatized_name, concept_id in self._concept_names.items():
-             if keyword_lower in lemmatized_name:
-                  concept = self.get_concept(concept_id)
-                  if concept:
-                       matching_concepts.append(concept)
+        position = names.find(keyword_lower)
+        while position != -1:
+            i = bisect.bisect_right(starts, position) - 1
+            concept = self.concepts.get(concept_ids[i])
+            if concept:
+                matching_concepts.append(concept)
+            # Continue with the next name; past the last one, find() returns -1
+            position = names.find(keyword_lower, starts[i + 1] if i + 1 < len(starts) else len(names) + 1)
         return matching_concepts
 
+    def _get_name_search_index(self) -> Tuple[str, List[int], List[str]]:
+        """
+        Return the name search index, building it if concepts were added since it was last built.
+
+        Returns:
+            Tuple[str, List[int], List[str]]: The NUL-joined lemmatized names, the start offset of each name
+                                              and the matching concept IDs, in insertion order.
+        """
+        if self._name_search_index is None:
+            starts, offset = [], 0
+            for name in self._concept_names:
+                starts.append(offset)
+                offset += len(name) + 1
+            self._name_search_index = ("\0".join(self._concept_names), starts, list(self._concept_names.values()))
+        return self._name_search_index
+
     def get_recent_events(self, time_window: timedelta) -> List[Event]:
         """
         Retrieve events that occurred within the specified time window before the current time.
@@ -312,14 +691,9 @@ class Hypergraph:
         Returns:
             List[Event]: A list of events within the time window, ordered by timestamp (most recent first).
         """
-        now = datetime.now()
-        recent_events = []
-        for event in self.events.values():
-            if now - event.timestamp <= time_window:
-                recent_events.append(event)
-        # Sort by timestamp in descending order (most recent first)
-        recent_events.sort(key=lambda event: event.timestamp, reverse=True)
-        return recent_events
+        cutoff_ns = _datetime_to_ns(datetime.now() - time_window)
+        registry = self._events_by_idx
+        return [registry[i] for i in self._events_by_time.since(cutoff_ns).tolist()]
 
     def retrieve_knowledge(self, query: str) -> Tuple[List[Concept], List[Event]]:
         """
@@ -332,27 +706,111 @@ class Hypergraph:
             Tuple[List[Concept], List[Event]]: A tuple containing a list of relevant concepts
                                               and a list of relevant events.
         """
-        # 1. Tokenize and lemmatize the query string.
-        doc = self._nlp(query)
-        query_lemmas = {token.lemma_.lower() for token in doc if not token.is_stop and token.is_alpha}
+        # 1-2. Find the concepts whose names (lemmas) match the lemmatized terms from the query.
+        return self._knowledge_of_concept_ids(self._match_query_concept_ids(query))
 
-        # 2. Find concepts in the hypergraph whose names (lemmas) match the lemmatized terms from the query.
-        relevant_concepts: Set[Concept] = set()
-        for lemma in query_lemmas:
-            concept = self.get_concept_by_name(lemma) # Use efficient name lookup
-            if concept:
-                relevant_concepts.add(concept)
+    def retrieve_knowledge_batch(self, queries: List[str], batch_size: int = 64, n_process: int = 1) -> List[Tuple[List[Concept], List[Event]]]:
+        """
+        Retrieve relevant concepts and events for several query strings at once.
+
+        The queries are lemmatized together with `nlp.pipe`, which amortizes spaCy's per-call
+        overhead across the batch. Only lemmatization is spread over processes; the concept and
+        event lookups that follow are dict and array operations in this process.
+
+        Args:
+            queries (List[str]): The query strings.
+            batch_size (int): Number of queries spaCy processes per batch.
+            n_process (int): Number of processes spaCy lemmatizes with (-1 for one per CPU). Worker
+                             start-up costs far more than lemmatizing a few queries, so use more than
+                             one only for large batches.
+
+        Returns:
+            List[Tuple[List[Concept], List[Event]]]: One `retrieve_knowledge` result per query, in query order.
+        """
+        return [self._knowledge_of_concept_ids(self._match_doc_concept_ids(doc))
+                for doc in self._nlp.pipe(queries, batch_size=batch_size, n_process=n_process)]
+
+    def _knowledge_of_concept_ids(self, concept_ids: Set[str]) -> Tuple[List[Concept], List[Event]]:
+        """
+        Resolve matched concept IDs into the concepts and the events involving them.
+
+        Args:
+            concept_ids (Set[str]): IDs of the matched concepts.
+
+        Returns:
+            Tuple[List[Concept], List[Event]]: The matched concepts and their events.
+        """
+        relevant_concepts = [self.concepts[concept_id] for concept_id in concept_ids]
 
         # 3. Collect all events that involve these matched concepts.
-        relevant_events: Set[Event] = set()
-        for concept in relevant_concepts:
-            # Access events directly from the concept object in the hypergraph
-            stored_concept = self.get_concept(concept.concept_id)
-            if stored_concept:
-                relevant_events.update(stored_concept.events)
+        relevant_events = self._events_of_concepts(relevant_concepts)
+
+        # 4. Return the relevant concepts and events.
+        return relevant_concepts, relevant_events
+
+    def retrieve_knowledge_names(self, query: str) -> Tuple[List[str], List[str]]:
+        """
+        Retrieve the names of relevant concepts and the descriptions of relevant events for a query.
+
+        Matches the same concepts and events as `retrieve_knowledge`, but returns the strings that
+        context generation actually needs: concept names come from an ID-to-name index and event
+        descriptions from each event's cached description.
+
+        Args:
+            query (str): The query string.
+
+        Returns:
+            Tuple[List[str], List[str]]: The names of the relevant concepts, sorted alphabetically, and the
+                                         descriptions of the relevant events, most recent first.
+        """
+        concept_ids = self._match_query_concept_ids(query)
+        names = sorted(self._concept_name_by_id[concept_id] for concept_id in concept_ids)
+
+        relevant_events = self._events_of_concepts(self.concepts[concept_id] for concept_id in concept_ids)
+        descriptions = [event.description_cached
+                        for event in sorted(relevant_events, key=attrgetter("timestamp"), reverse=True)]
+        return names, descriptions
+
+    def _match_query_concept_ids(self, query: str) -> Set[str]:
+        """
+        Find the IDs of concepts whose lemmatized names match terms of the query.
+
+        Args:
+            query (str): The query string.
 
-        # 4. Return the set of relevant concepts and events.
-        return list(relevant_concepts), list(relevant_events)
+        Returns:
+            Set[str]: The IDs of the matching concepts.
+        """
+        # Tokenize and lemmatize the query string
+        return self._match_doc_concept_ids(self._nlp(query))
+
+    def _match_doc_concept_ids(self, doc) -> Set[str]:
+        """
+        Find the IDs of concepts whose lemmatized names match terms of an already processed query.
+
+        Args:
+            doc (spacy.tokens.Doc): The processed query.
+
+        Returns:
+            Set[str]: The IDs of the matching concepts.
+        """
+        from spacy.attrs import LEMMA, IS_STOP, IS_ALPHA
+
+        # Drop stop words and non-alphabetic tokens. The flags are filtered as one uint64 array instead of
+        # per-token attribute access; only surviving lemma hashes are resolved through the StringStore
+        attributes = doc.to_array([LEMMA, IS_STOP, IS_ALPHA])
+        lemma_ids = attributes[(attributes[:, 1] == 0) & (attributes[:, 2] != 0), 0]
+        strings = doc.vocab.strings
+        query_lemmas = {strings[lemma_id].lower() for lemma_id in set(lemma_ids.tolist())}
+
+        matched_ids: Set[str] = set()
+        for lemma in query_lemmas:
+            # Same lookup as get_concept_by_name, without materializing the Concept. Concept names are
+            # lemmatized on insertion, so each query term costs one dict lookup
+            concept_id = self._concept_names.get(self._get_lemma(lemma))
+            if concept_id and concept_id in self.concepts:
+                matched_ids.add(concept_id)
+        return matched_ids
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -371,40 +829,233 @@ class Hypergraph:
         hypergraph = cls()
 
         # Load concepts first
-        concepts_data = data.get("concepts", {})
-        for concept_id, concept_data in concepts_data.items():
-            concept = Concept.from_dict(concept_data)
-            hypergraph.concepts[concept_id] = concept
-            # Ensure lemmatized name is stored during loading
-            lemmatized_name = hypergraph._get_lemma(concept.name)
-            hypergraph._concept_names[lemmatized_name] = concept_id
+        for concept_data in data.get("concepts", {}).values():
+            hypergraph._load_concept(concept_data)
 
         # Load events and link them to concepts
-        events_data = data.get("events", {})
-        for event_id, event_data in events_data.items():
-            # Retrieve concept objects from the hypergraph based on event_data's concept_ids
-            event_concepts: Set[Concept] = set()
-            for concept_id in event_data.get("concept_ids", []):
-                concept = hypergraph.get_concept(concept_id)
-                if concept:
-                    event_concepts.add(concept)
-                else:
-                    # This indicates an issue with the saved data - a concept ID in an event
-                    # doesn't correspond to a concept in the saved concepts list.
-                    logger.warning(f"Concept ID {concept_id} for event {event_id} not found during loading. Event may be incomplete.")
-
-            # Only create the event if its concepts can be retrieved (at least partially)
-            if event_concepts or not event_data.get("concept_ids"):
-                 event = Event.from_dict(event_data, concepts=event_concepts) # Pass the set of concepts
-                 hypergraph.events[event_id] = event
-                 # Link the event back to the concepts
-                 for concept in event_concepts:
-                      concept.events.add(event)
+        for event_id, event_data in data.get("events", {}).items():
+            hypergraph._load_event(event_id, event_data)
+
+        hypergraph._version += 1
+        return hypergraph
+
+    def _load_concept(self, concept_data: Dict[str, Any]):
+        """
+        Store a serialized concept (as produced by `Concept.to_dict`) while loading.
+
+        Args:
+            concept_data (Dict[str, Any]): The serialized concept.
+        """
+        concept = Concept.from_dict(concept_data)
+        # Keyed by the concept's own (interned) ID rather than the JSON key string
+        concept_id = concept.concept_id
+        self.concepts[concept_id] = concept
+        # Ensure lemmatized name is stored during loading
+        lemmatized_name = self._get_lemma(concept.name)
+        self._concept_names[lemmatized_name] = concept_id
+        self._concept_name_by_id[concept_id] = concept.name
+
+    def _load_event(self, event_id: str, event_data: Dict[str, Any]):
+        """
+        Store a serialized event (as produced by `Event.to_dict`) while loading, linking it to its
+        concepts, which must already have been loaded.
+
+        Args:
+            event_id (str): The event's ID, used in warnings.
+            event_data (Dict[str, Any]): The serialized event.
+        """
+        # Retrieve concept objects from the hypergraph based on event_data's concept_ids
+        event_concepts: Set[Concept] = set()
+        for concept_id in event_data.get("concept_ids", []):
+            concept = self.get_concept(concept_id)
+            if concept:
+                event_concepts.add(concept)
             else:
-                logger.warning(f"Skipping event {event_id} during loading due to no concepts found.")
+                # This indicates an issue with the saved data - a concept ID in an event
+                # doesn't correspond to a concept in the saved concepts list.
+                logger.warning(f"Concept ID {concept_id} for event {event_id} not found during loading. Event may be incomplete.")
+
+        # Only create the event if its concepts can be retrieved (at least partially)
+        if event_concepts or not event_data.get("concept_ids"):
+             event = Event.from_dict(event_data, concepts=event_concepts) # Pass the set of concepts
+             self.events[event.event_id] = event
+             # Link the event back to the concepts
+             self._register_event(event)
+        else:
+            logger.warning(f"Skipping event {event_id} during loading due to no concepts found.")
+
+
+    def to_json(self) -> bytes:
+        """
+        Serialize the Hypergraph to UTF-8 encoded JSON.
+
+        Encodes the `to_dict` document with orjson when it is installed, falling back to the json module.
+        Values JSON cannot represent (e.g. datetimes in metadata) are written as strings.
+
+        Returns:
+            bytes: The JSON document.
+        """
+        return _json_dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]) -> "Hypergraph":
+        """
+        Create a Hypergraph from a JSON document, such as one written by `to_json`.
+
+        Args:
+            data (Union[bytes, str]): The JSON document.
+
+        Returns:
+            Hypergraph: The restored hypergraph.
+        """
+        return cls.from_dict(_json_loads(data))
+
+    def iter_ndjson(self) -> Iterator[bytes]:
+        """
+        Serialize the Hypergraph as newline-delimited JSON, one record per line.
+
+        Every concept is written before any event, each as its `to_dict` document tagged with
+        `"kind": "concept"` or `"kind": "event"`. Records are encoded one at a time, so the whole
+        document is never held in memory.
 
+        Yields:
+            bytes: One JSON record, terminated by a newline.
+        """
+        for concept in list(self.concepts.values()):
+            yield _json_dumps({"kind": "concept", **concept.to_dict()}) + b"\n"
+        for event in list(self.events.values()):
+            yield _json_dumps({"kind": "event", **event.to_dict()}) + b"\n"
+
+    @classmethod
+    def from_ndjson(cls, lines: Iterable[Union[bytes, str]]) -> "Hypergraph":
+        """
+        Create a Hypergraph from newline-delimited JSON records, such as those written by `iter_ndjson`.
+
+        Records are decoded and stored one at a time, so `lines` can be an open file.
+
+        Args:
+            lines (Iterable[Union[bytes, str]]): The records. Blank lines are ignored.
+
+        Returns:
+            Hypergraph: The restored hypergraph.
+
+        Raises:
+            ValueError: If a record has an unknown kind.
+        """
+        hypergraph = cls()
+        for line in lines:
+            if not line.strip():
+                continue
+            record = _json_loads(line)
+            kind = record.pop("kind", None)
+            if kind == "concept":
+                hypergraph._load_concept(record)
+            elif kind == "event":
+                hypergraph._load_event(record.get("event_id"), record)
+            else:
+                raise ValueError(f"Unknown hypergraph record kind: {kind!r}")
+        hypergraph._version += 1
         return hypergraph
 
+    def to_msgpack(self) -> bytes:
+        """
+        Serialize the Hypergraph to msgpack bytes.
+
+        The document is the one produced by `to_dict`, in a binary encoding that is smaller and faster
+        to parse than JSON. Requires the optional `msgpack` package, which is imported only when this
+        method is called.
+
+        Returns:
+            bytes: The packed hypergraph.
+        """
+        import msgpack
+
+        return msgpack.packb(self.to_dict(), use_bin_type=True, default=str)
+
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> "Hypergraph":
+        """
+        Create a Hypergraph from bytes written by `to_msgpack`. Requires the optional `msgpack` package.
+
+        Args:
+            data (bytes): The packed hypergraph.
+
+        Returns:
+            Hypergraph: The restored hypergraph.
+        """
+        import msgpack
+
+        return cls.from_dict(msgpack.unpackb(data, raw=False))
+
+    def freeze(self) -> "FrozenHypergraph":
+        """
+        Return a read-only version of this hypergraph for retrieval-only workloads.
+
+        Lookup indexes that are otherwise built on demand are built up front, and the concept and event
+        stores become read-only mappings. The frozen hypergraph shares its concepts, events and indexes
+        with this one, so freeze a graph once it is fully built (e.g. right after `from_dict`) and stop
+        mutating the original.
+
+        Returns:
+            FrozenHypergraph: The read-only hypergraph.
+        """
+        frozen = FrozenHypergraph.__new__(FrozenHypergraph)
+        frozen.__dict__.update(self.__dict__)
+        frozen.concepts = MappingProxyType(self.concepts)
+        frozen.events = MappingProxyType(self.events)
+        frozen._concept_names = MappingProxyType(self._concept_names)
+        frozen._concept_name_by_id = MappingProxyType(self._concept_name_by_id)
+        frozen._get_name_search_index()
+        return frozen
 
     def __repr__(self):
-        return f"Hypergraph(concepts={len(self.concepts)}, events={len(self.events)})"
+        return f"{type(self).__name__}(concepts={len(self.concepts)}, events={len(self.events)})"
+
+
+class FrozenHypergraph(Hypergraph):
+    """
+    A read-only Hypergraph, created with `Hypergraph.freeze()` or `FrozenHypergraph.from_dict`.
+
+    All query methods work as on a Hypergraph; methods that add concepts or events raise TypeError.
+    """
+
+    def add_concept(self, concept: Concept):
+        raise TypeError("Cannot add a concept to a FrozenHypergraph.")
+
+    def add_concept_if_not_exists(self, concept: Concept) -> Concept:
+        """
+        Return the stored concept with the same ID or lemmatized name.
+
+        Raises:
+            TypeError: If no such concept exists, since it cannot be added.
+        """
+        existing_concept = self.get_concept(concept.concept_id) or self.get_concept_by_name(concept.name)
+        if existing_concept is None:
+            raise TypeError("Cannot add a concept to a FrozenHypergraph.")
+        return existing_concept
+
+    def add_concepts_bulk(self, concepts: Iterable[Concept]) -> List[Concept]:
+        """
+        Return the stored concept with the same ID or lemmatized name as each of `concepts`.
+
+        Raises:
+            TypeError: If any of them does not exist, since it cannot be added.
+        """
+        return [self.add_concept_if_not_exists(concept) for concept in concepts]
+
+    def add_event(self, event: Event):
+        raise TypeError("Cannot add an event to a FrozenHypergraph.")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FrozenHypergraph":
+        """
+        Create a FrozenHypergraph from a dictionary (see `Hypergraph.from_dict`).
+        """
+        return Hypergraph.from_dict(data).freeze()
+
+    @classmethod
+    def from_ndjson(cls, lines: Iterable[Union[bytes, str]]) -> "FrozenHypergraph":
+        """
+        Create a FrozenHypergraph from newline-delimited JSON records (see `Hypergraph.from_ndjson`).
+        """
+        return Hypergraph.from_ndjson(lines).freeze()
@@ -47,25 +47,88 @@ composite_sensor = CompositeSensor("composite_sensor_1", {
 # print("Composite Sensor Reading:", composite_reading)
 ```
 """
-from abc import ABC, abstractmethod
-from typing import Optional
+import asyncio
+import inspect
+import logging
+import sys
+import threading
+import weakref
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import repeat
+from types import MappingProxyType
+from typing import Optional, Union
 from datetime import datetime
 from dataclasses import dataclass, field
+import numpy as np
 
 # Import the new processor output dataclasses
 from eventual.processors.processor_output import ProcessorOutput, ExtractedConcept, ExtractedEvent
 
 # Assuming TextProcessor is available
 from eventual.processors.text_processor import TextProcessor # Updated import path and name likely
+from eventual.utils.numerical_properties import normalize_value
 
-class Sensor(ABC):
+# Sensors can fire at high rates, so per-read messages are DEBUG logs that cost almost nothing when disabled
+logger = logging.getLogger(__name__)
+
+# TextProcessor shared by all TextSensors created without one, built on first use (see _shared_text_processor)
+_default_text_processor: Optional[TextProcessor] = None
+_default_text_processor_lock = threading.Lock()
+
+def _shared_text_processor() -> TextProcessor:
+    """
+    Return the process-wide default TextProcessor, creating it on first use.
+
+    A TextProcessor loads a spaCy pipeline and its configuration, so sensors created without an
+    explicit processor share one instead of each loading their own. The lock keeps concurrent first
+    uses from building it twice.
+
+    Returns:
+        TextProcessor: The shared processor.
+    """
+    global _default_text_processor
+    if _default_text_processor is None:
+        with _default_text_processor_lock:
+            if _default_text_processor is None:
+                _default_text_processor = TextProcessor()
+    return _default_text_processor
+
+@lru_cache(maxsize=None)
+def _accepts_timestamp(sensor_class: type) -> bool:
+    """
+    Whether `sensor_class.read_data` takes a `timestamp` keyword.
+
+    Checked once per class, so `CompositeSensor` can hand its timestamp to children that support it
+    and still read third-party sensors with the plain `read_data()` call.
+    """
+    return "timestamp" in inspect.signature(sensor_class.read_data).parameters
+
+# A sensor's most recent reading and the time it was taken, stored together so a read records both in one write
+Reading = namedtuple("Reading", ("data", "timestamp"))
+_NO_READING = Reading(None, None)
+
+class Sensor:
     """
     Abstract base class for all sensors in the Eventual framework.
 
     A Sensor represents a source of sensory data, which can be of any type (e.g., text, light, sound).
     Sensors are responsible for reading raw data and emitting it in a standardized format for further processing.
+
+    Subclasses must override `read_data`; this is checked once when the subclass is defined rather
+    than through `ABCMeta`, which also makes `isinstance` checks against Sensor plain type checks.
     """
 
+    # Slots drop the per-instance __dict__; deployments may hold thousands of sensors. Subclasses
+    # that do not declare their own get a __dict__ as usual
+    __slots__ = ("sensor_id", "sensor_type", "_reading")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.read_data is Sensor.read_data:
+            raise TypeError(f"{cls.__name__} must override read_data")
+
     def __init__(self, sensor_id: str, sensor_type: str):
         """
         Initialize a Sensor.
@@ -74,14 +137,33 @@ class Sensor(ABC):
             sensor_id (str): A unique identifier for the sensor.
             sensor_type (str): The type of sensor (e.g., "text", "light").
         """
-        self.sensor_id = sensor_id
-        self.sensor_type = sensor_type
+        if type(self) is Sensor:
+            raise TypeError("Sensor is abstract; instantiate a subclass that implements read_data")
+        # Interned: sensor IDs key combined readings and both strings repeat across many sensors
+        self.sensor_id = sys.intern(sensor_id)
+        self.sensor_type = sys.intern(sensor_type)
         # last_reading should ideally be a standardized format, but for generic Sensor base class,
-        # keeping it flexible as dict[str, any] for now.
-        self.last_reading: Optional[dict[str, any]] = None
-        self.last_reading_timestamp: Optional[datetime] = None
+        # keeping it flexible for now: a dict[str, any], or the ProcessorOutput of sensors that extract.
+        self._reading: Reading = _NO_READING
+
+    @property
+    def last_reading(self) -> Optional[Union[dict[str, any], ProcessorOutput]]:
+        """The most recent reading, or None if no reading has been taken."""
+        return self._reading.data
+
+    @last_reading.setter
+    def last_reading(self, data: Optional[Union[dict[str, any], ProcessorOutput]]):
+        self._reading = self._reading._replace(data=data)
+
+    @property
+    def last_reading_timestamp(self) -> Optional[datetime]:
+        """The time of the most recent reading, or None if no reading has been taken."""
+        return self._reading.timestamp
+
+    @last_reading_timestamp.setter
+    def last_reading_timestamp(self, timestamp: Optional[datetime]):
+        self._reading = self._reading._replace(timestamp=timestamp)
 
-    @abstractmethod
     # Note: The return type is generalized as dict[str, any] in the base class,
     # but concrete implementations like TextSensor should return more specific types (like ProcessorOutput).
     def read_data(self, *args, **kwargs) -> dict[str, any]:
@@ -90,25 +172,43 @@ class Sensor(ABC):
 
         The specific arguments and return format depend on the sensor type.
         Concrete sensor implementations should override this method with appropriate type hints.
+        Implementations may accept an optional `timestamp: Optional[datetime]` keyword to record
+        instead of reading the clock; `CompositeSensor` passes one timestamp to all its children.
 
         Returns:
             dict[str, any]: A dictionary containing the sensor reading and metadata.
                             Example: {"value": 0.5, "units": "lux", "timestamp": datetime.now()}
             ProcessorOutput: (For sensors like TextSensor that perform extraction)
         """
-        pass
+        raise NotImplementedError
+
+    async def read_data_async(self, *args, **kwargs) -> dict[str, any]:
+        """
+        Read data from the sensor without blocking the running event loop.
+
+        The default implementation runs `read_data` on the event loop's default executor. Sensors
+        that can wait on I/O natively, or answer some reads without blocking, should override it.
+
+        Args:
+            *args: Passed to `read_data`.
+            **kwargs: Passed to `read_data`.
+
+        Returns:
+            dict[str, any]: The same reading `read_data` returns.
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, partial(self.read_data, *args, **kwargs))
 
-    def get_last_reading(self) -> Optional[dict[str, any]]:
+    def get_last_reading(self) -> Optional[Union[dict[str, any], ProcessorOutput]]:
         """
         Get the most recent reading from the sensor.
 
         Returns:
-            Optional[dict[str, any]]: The last reading, or None if no reading has been taken.
+            Optional[Union[dict[str, any], ProcessorOutput]]: The last reading, or None if no reading has been taken.
         """
-        return self.last_reading
+        return self._reading.data
 
     def __repr__(self):
-        return f"Sensor(sensor_id={self.sensor_id}, type={self.sensor_type}, last_reading={'...' if self.last_reading else None})"
+        return f"Sensor(sensor_id={self.sensor_id}, type={self.sensor_type}, last_reading={'...' if self.last_reading is not None else None})"
 
 
 class TextSensor(Sensor):
@@ -117,45 +217,161 @@ class TextSensor(Sensor):
 
     This sensor uses a TextProcessor to extract concepts and relationships from text input
     and returns the results as a `ProcessorOutput` object.
+
+    Sensor loops often re-poll the same buffer, so results are kept in a small LRU cache keyed
+    by `(text, text_processor.concept_map_version)`. Updating the processor's concept map through
+    `update_concept_map` bumps that version, which implicitly invalidates stale entries. Call
+    `clear_cache()` after mutating `concept_map` directly. Cache hits return the same
+    `ProcessorOutput` instance, so treat it as read-only.
     """
 
-    def __init__(self, sensor_id: str, text_processor: Optional[TextProcessor] = None):
+    __slots__ = ("_text_processor", "_cache", "_cache_max")
+
+    def __init__(self, sensor_id: str, text_processor: Optional[TextProcessor] = None, cache_size: int = 1024):
         """
         Initialize a TextSensor.
 
         Args:
             sensor_id (str): A unique identifier for the sensor.
             text_processor (Optional[TextProcessor]): An optional TextProcessor instance to use.
-                                                      If None, a new one will be initialized.
+                                                      If None, the process-wide default processor is
+                                                      used; its concept map is shared by every sensor
+                                                      using it, so pass your own instance to customize it.
+            cache_size (int): Maximum number of extraction results to keep in the LRU cache.
+                              Use 0 to disable caching.
         """
         super().__init__(sensor_id, "text")
         # TextSensor now HAS-A TextProcessor, rather than importing and calling a function
-        self._text_processor = text_processor if text_processor is not None else TextProcessor()
+        self._text_processor = text_processor if text_processor is not None else _shared_text_processor()
+        self._cache: "OrderedDict[tuple, ProcessorOutput]" = OrderedDict()
+        self._cache_max = cache_size
 
-    def read_data(self, text: str) -> ProcessorOutput:
+    def clear_cache(self):
+        """
+        Drop all cached extraction results.
+
+        Only needed when the processor's concept map was mutated without going through
+        `update_concept_map` (which would otherwise bump its version).
+        """
+        self._cache.clear()
+
+    def _cache_key(self, text: str) -> tuple:
+        """The LRU cache key of `text` under the processor's current concept map."""
+        return (text, getattr(self._text_processor, "concept_map_version", 0))
+
+    def _extract_concepts(self, text: str) -> ProcessorOutput:
+        """
+        Run the TextProcessor on `text`, reusing a cached result for text seen before.
+
+        Args:
+            text (str): The raw text input.
+
+        Returns:
+            ProcessorOutput: The extracted concepts and events.
+        """
+        key = self._cache_key(text)
+        processor_output = self._cache.get(key)
+        if processor_output is not None:
+            self._cache.move_to_end(key)
+            return processor_output
+
+        processor_output = self._text_processor.extract_concepts(text) # Assuming extract_concepts is the primary method
+        if self._cache_max > 0:
+            self._cache[key] = processor_output
+            if len(self._cache) > self._cache_max:
+                self._cache.popitem(last=False)
+        return processor_output
+
+    def read_data(self, text: str, timestamp: Optional[datetime] = None) -> ProcessorOutput:
         """
         Process text data using the TextProcessor and return structured output.
 
         Args:
             text (str): The raw text input.
+            timestamp (Optional[datetime]): The time of the reading. Defaults to the current time.
 
         Returns:
             ProcessorOutput: A structured object containing extracted concepts and events.
         """
-        print(f"TextSensor '{self.sensor_id}' reading data...")
+        logger.debug("TextSensor '%s' reading data...", self.sensor_id)
         # Use the internal TextProcessor instance
-        processor_output = self._text_processor.extract_concepts(text) # Assuming extract_concepts is the primary method
+        processor_output = self._extract_concepts(text)
         # Note: TextSensor currently only uses extract_concepts (TF-IDF). 
         # If LLM or phase shift functionality is needed via the sensor, 
         # additional methods or a different sensor design might be required.
         
-        # Store a representation of the reading; ProcessorOutput is the new standardized output for this sensor
-        self.last_reading = {"processor_output": processor_output}
-        self.last_reading_timestamp = datetime.now()
+        # ProcessorOutput is the standardized output for this sensor, so it is stored as the reading itself
+        self._reading = Reading(processor_output, timestamp if timestamp is not None else datetime.now())
         
-        print(f"TextSensor '{self.sensor_id}' read data. Extracted {len(processor_output.extracted_concepts)} concepts, {len(processor_output.extracted_events)} events.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("TextSensor '%s' read data. Extracted %d concepts, %d events.", self.sensor_id,
+                         len(processor_output.extracted_concepts), len(processor_output.extracted_events))
         return processor_output
 
+    def read_batch(self, texts: list[str], timestamp: Optional[datetime] = None) -> list[ProcessorOutput]:
+        """
+        Process several texts at once and return one structured output per text.
+
+        Cached texts are answered from the cache; the rest go to the TextProcessor in a single
+        `extract_concepts_batch` call, with each distinct text extracted once. The last output
+        becomes the sensor's last reading.
+
+        Args:
+            texts (list[str]): The raw text inputs.
+            timestamp (Optional[datetime]): The time of the readings. Defaults to the current time.
+
+        Returns:
+            list[ProcessorOutput]: One structured object per text, in order.
+        """
+        logger.debug("TextSensor '%s' reading %d texts...", self.sensor_id, len(texts))
+        keys = [self._cache_key(text) for text in texts]
+        # Each distinct text is looked up and extracted once. Cache hits are moved to the end of
+        # the LRU order, as in _extract_concepts
+        results: dict[tuple, Optional[ProcessorOutput]] = {}
+        missing_keys, missing_texts = [], []
+        for key, text in zip(keys, texts):
+            if key in results:
+                continue
+            processor_output = self._cache.get(key)
+            if processor_output is None:
+                missing_keys.append(key)
+                missing_texts.append(text)
+            else:
+                self._cache.move_to_end(key)
+            results[key] = processor_output
+        if missing_texts:
+            extracted = self._text_processor.extract_concepts_batch(missing_texts)
+            for key, processor_output in zip(missing_keys, extracted):
+                results[key] = processor_output
+                if self._cache_max > 0:
+                    self._cache[key] = processor_output
+            if self._cache_max > 0:
+                while len(self._cache) > self._cache_max:
+                    self._cache.popitem(last=False)
+        outputs = [results[key] for key in keys]
+
+        if outputs:
+            self._reading = Reading(outputs[-1], timestamp if timestamp is not None else datetime.now())
+        return outputs
+
+    async def read_data_async(self, text: str, timestamp: Optional[datetime] = None) -> ProcessorOutput:
+        """
+        Process text data without blocking the running event loop.
+
+        Text whose result is cached is answered directly; otherwise extraction (spaCy and TF-IDF,
+        both CPU-bound) runs on the event loop's default executor.
+
+        Args:
+            text (str): The raw text input.
+            timestamp (Optional[datetime]): The time of the reading. Defaults to the current time.
+
+        Returns:
+            ProcessorOutput: A structured object containing extracted concepts and events.
+        """
+        if self._cache_key(text) in self._cache:
+            return self.read_data(text, timestamp)
+        return await super().read_data_async(text, timestamp)
+
 
 class NumericalSensor(Sensor):
     """
@@ -166,6 +382,8 @@ class NumericalSensor(Sensor):
     It returns a dictionary with the processed numerical value and associated concept name.
     """
 
+    __slots__ = ("concept_name", "units", "_lo", "_hi")
+
     def __init__(self, sensor_id: str, concept_name: str, units: str = "units"):
         """
         Initialize a NumericalSensor.
@@ -177,36 +395,74 @@ class NumericalSensor(Sensor):
         """
         # Sensor type is numerical, but we also associate it with a concept name
         super().__init__(sensor_id, "numerical") 
-        self.concept_name = concept_name # Store the associated concept name
-        self.units = units
+        # Store the associated concept name; interned since it is looked up by name during integration
+        self.concept_name = sys.intern(concept_name)
+        self.units = sys.intern(units)
+        # Assuming normalization range [0, 1] is standard for concept state update
+        self._lo, self._hi = 0.0, 1.0
 
-    def read_data(self, value: float) -> dict[str, any]:
+    def read_data(self, value: float, timestamp: Optional[datetime] = None) -> dict[str, any]:
         """
         Process numerical data and return it in a standardized format.
 
         Args:
             value (float): The raw numerical value from the sensor.
+            timestamp (Optional[datetime]): The time of the reading. Defaults to the current time.
 
         Returns:
             dict[str, any]: A dictionary containing the normalized value, associated concept name, units, and metadata.
                             Example: {"concept_name": "light", "value": 0.5, "units": "lux", "timestamp": datetime.now()}
         """
-        from eventual.utils.numerical_properties import normalize_value
-
-        # Assuming normalization range [0, 1] is standard for concept state update
-        normalized_value = normalize_value(value, 0, 1)  
+        normalized_value = normalize_value(value, self._lo, self._hi)
+        if timestamp is None:
+            timestamp = datetime.now()
         
         reading_data = {
             "concept_name": self.concept_name, # Include the associated concept name
             "value": normalized_value,
             "units": self.units,
-            "timestamp": datetime.now()
+            "timestamp": timestamp
         }
 
-        self.last_reading = reading_data
-        self.last_reading_timestamp = datetime.now()
+        self._reading = Reading(reading_data, timestamp)
         
-        print(f"NumericalSensor '{self.sensor_id}' read data for concept '{self.concept_name}': {normalized_value} {self.units}")
+        logger.debug("NumericalSensor '%s' read data for concept '%s': %s %s", self.sensor_id, self.concept_name, normalized_value, self.units)
+        return reading_data
+
+    def read_batch(self, values: np.ndarray, timestamp: Optional[datetime] = None) -> dict[str, any]:
+        """
+        Process many numerical values at once.
+
+        The values are normalized exactly as `read_data` does it, in one array operation, and share
+        a single timestamp.
+
+        Args:
+            values (np.ndarray): The raw numerical values from the sensor (any 1-D array-like).
+            timestamp (Optional[datetime]): The time of the readings. Defaults to the current time.
+
+        Returns:
+            dict[str, any]: A dictionary like `read_data`'s, with the normalized float64 array under "values".
+                            Example: {"concept_name": "light", "values": array([0.5, 0.7]), "units": "lux", "timestamp": datetime.now()}
+        """
+        span = self._hi - self._lo
+        if span == 0:
+            normalized_values = np.zeros(np.shape(values), dtype=np.float64)  # Avoid division by zero
+        else:
+            normalized_values = np.subtract(values, self._lo, dtype=np.float64)
+            normalized_values /= span
+        if timestamp is None:
+            timestamp = datetime.now()
+
+        reading_data = {
+            "concept_name": self.concept_name,
+            "values": normalized_values,
+            "units": self.units,
+            "timestamp": timestamp
+        }
+
+        self._reading = Reading(reading_data, timestamp)
+
+        logger.debug("NumericalSensor '%s' read %d values for concept '%s'", self.sensor_id, len(normalized_values), self.concept_name)
         return reading_data
 
 
@@ -220,48 +476,154 @@ class CompositeSensor(Sensor):
     as the combination logic might be sensor-specific and require further processing.
     """
 
+    # Children are kept as parallel ID and sensor lists, which reads iterate directly. __weakref__
+    # lets the pool's finalizer track the sensor
+    __slots__ = ("_ids", "_sensors", "_pool", "_pool_finalizer", "__weakref__")
+
     def __init__(self, sensor_id: str, child_sensors: dict[str, Sensor]):
         """
         Initialize a CompositeSensor.
 
+        Child sensors are read concurrently on a thread pool, so a composite reading takes as long
+        as its slowest child rather than the sum of all of them. The pool is started on the first
+        read and shut down by `close()`, on leaving a `with` block, or when the sensor is garbage
+        collected.
+
         Args:
             sensor_id (str): A unique identifier for the sensor.
             child_sensors (dict[str, Sensor]): A dictionary of child sensors, keyed by their IDs.
         """
         super().__init__(sensor_id, "composite")
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_finalizer: Optional[weakref.finalize] = None
         self.child_sensors = child_sensors
 
-    def read_data(self) -> dict[str, any]:
+    @property
+    def child_sensors(self) -> MappingProxyType:
         """
-        Read data from all child sensors and combine it into a single reading.
+        The child sensors, keyed by their IDs, as a read-only mapping.
 
-        Returns:
-            dict[str, any]: A dictionary containing the combined sensor readings and metadata.
-                            Example: {"readings": {"text_sensor_1": {...}, "light_sensor_1": {...}}, "timestamp": datetime.now()}
+        Assign a new dictionary to change the children.
+        """
+        return MappingProxyType(dict(zip(self._ids, self._sensors)))
+
+    @child_sensors.setter
+    def child_sensors(self, child_sensors: dict[str, Sensor]):
+        self._ids: list[str] = list(child_sensors)
+        self._sensors: list[Sensor] = list(child_sensors.values())
+        # Sized for the previous children; a new pool is created on the next read
+        self._shutdown_pool(wait=False)
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Create the thread pool used to read child sensors on first use."""
+        if self._pool is None:
+            pool = ThreadPoolExecutor(
+                max_workers=min(32, max(1, len(self._sensors))),
+                thread_name_prefix=f"CompositeSensor-{self.sensor_id}",
+            )
+            # Stops the idle threads if the sensor is dropped without being closed. The callback
+            # holds the pool, not the sensor, so it does not keep the sensor alive
+            self._pool_finalizer = weakref.finalize(self, pool.shutdown, wait=False)
+            self._pool = pool
+        return self._pool
+
+    def _shutdown_pool(self, wait: bool):
+        """Shut down the thread pool, if one was started, and drop its finalizer."""
+        if self._pool is not None:
+            self._pool_finalizer.detach()
+            self._pool.shutdown(wait=wait)
+            self._pool = None
+            self._pool_finalizer = None
+
+    def _read_child(self, sensor_id: str, sensor: Sensor, timestamp: datetime) -> any:
         """
-        print(f"CompositeSensor '{self.sensor_id}' reading data from child sensors...")
-        combined_reading = {}
-        for sensor_id, sensor in self.child_sensors.items():
-            # Note: This assumes child sensors' read_data methods don't require specific args,
-            # or that this composite sensor can provide them if needed.
-            # It also collects whatever format the child sensor returns.
-            try:
-                reading = sensor.read_data() # Pass any necessary args here if required by child sensors
-                combined_reading[sensor_id] = reading
-            except Exception as e:
-                 print(f"Error reading data from child sensor '{sensor_id}': {e}")
-                 combined_reading[sensor_id] = {"error": str(e)}
+        Read a single child sensor, turning a failure into an error entry.
+
+        Args:
+            sensor_id (str): The ID of the child sensor.
+            sensor (Sensor): The child sensor to read.
+            timestamp (datetime): The composite reading's timestamp, passed on to children that accept one.
 
+        Returns:
+            any: The child's reading, or {"error": ...} if reading it raised.
+        """
+        # Note: This assumes child sensors' read_data methods don't require specific args,
+        # or that this composite sensor can provide them if needed.
+        # It also collects whatever format the child sensor returns.
+        try:
+            if _accepts_timestamp(type(sensor)):
+                return sensor.read_data(timestamp=timestamp)
+            return sensor.read_data() # Pass any necessary args here if required by child sensors
+        except Exception as e:
+            logger.warning("Error reading data from child sensor '%s': %s", sensor_id, e)
+            return {"error": str(e)}
+
+    def _store_reading(self, combined_reading: dict[str, any], timestamp: datetime) -> dict[str, any]:
+        """Wrap the combined child readings with the timestamp and record them as the last reading."""
         reading_data = {
             "readings": combined_reading,
-            "timestamp": datetime.now()
+            "timestamp": timestamp
         }
-        self.last_reading = reading_data
-        self.last_reading_timestamp = datetime.now()
-        
-        print(f"CompositeSensor '{self.sensor_id}' finished reading data.")
+        self._reading = Reading(reading_data, timestamp)
+
+        logger.debug("CompositeSensor '%s' finished reading data.", self.sensor_id)
         return reading_data
 
+    def read_data(self) -> dict[str, any]:
+        """
+        Read data from all child sensors concurrently and combine it into a single reading.
+
+        The clock is read once; the composite reading and every child that accepts a `timestamp`
+        keyword share that timestamp.
+
+        Returns:
+            dict[str, any]: A dictionary containing the combined sensor readings and metadata.
+                            Example: {"readings": {"text_sensor_1": {...}, "light_sensor_1": {...}}, "timestamp": datetime.now()}
+        """
+        logger.debug("CompositeSensor '%s' reading data from child sensors...", self.sensor_id)
+        timestamp = datetime.now()
+        readings = self._get_pool().map(self._read_child, self._ids, self._sensors, repeat(timestamp))
+        return self._store_reading(dict(zip(self._ids, readings)), timestamp)
+
+    async def _read_child_async(self, sensor_id: str, sensor: Sensor, timestamp: datetime) -> any:
+        """
+        Asynchronous counterpart of `_read_child`, awaiting the child's `read_data_async`.
+        """
+        try:
+            if _accepts_timestamp(type(sensor)):
+                return await sensor.read_data_async(timestamp=timestamp)
+            return await sensor.read_data_async()
+        except Exception as e:
+            logger.warning("Error reading data from child sensor '%s': %s", sensor_id, e)
+            return {"error": str(e)}
+
+    async def read_data_async(self) -> dict[str, any]:
+        """
+        Read data from all child sensors concurrently without blocking the running event loop.
+
+        Each child's `read_data_async` is awaited together, so children that wait on I/O natively
+        (such as nested composite sensors) overlap with the rest, and blocking children run on the
+        event loop's executor.
+
+        Returns:
+            dict[str, any]: The combined reading, in the same format as `read_data`.
+        """
+        logger.debug("CompositeSensor '%s' reading data from child sensors...", self.sensor_id)
+        timestamp = datetime.now()
+        sensor_ids = self._ids
+        readings = await asyncio.gather(*map(self._read_child_async, sensor_ids, self._sensors, repeat(timestamp)))
+        return self._store_reading(dict(zip(sensor_ids, readings)), timestamp)
+
+    def close(self):
+        """Shut down the thread pool used to read child sensors."""
+        self._shutdown_pool(wait=True)
+
+    def __enter__(self) -> "CompositeSensor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
 # Example Usage (for testing, not part of the class)
 # if __name__ == "__main__":
 #     # Example demonstrating the updated TextSensor output
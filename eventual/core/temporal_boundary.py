@@ -15,12 +15,21 @@ config = TemporalBoundaryConfig(
 )
 ```
 """
+import sys
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Sequence
 from dataclasses import dataclass
+import numpy as np
 from eventual.core import Concept, Event
+from eventual.core._boundary_kernels import update_thresholds
 
-@dataclass
+# Every detection reads the config, so it is slotted where dataclasses support it (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Bound once instead of looked up per batch
+_now = datetime.now
+
+@dataclass(**_SLOTS)
 class TemporalBoundaryConfig:
     """
     Configuration for the TemporalBoundary detector.
@@ -45,7 +54,6 @@ class TemporalBoundary:
 
     Attributes:
         config (TemporalBoundaryConfig): The configuration for the detector.
-        history (dict[str, list[float]]): A history of state changes for each concept.
     """
 
     def __init__(self, config: Optional[TemporalBoundaryConfig] = None):
@@ -57,7 +65,64 @@ class TemporalBoundary:
                 If not provided, default values will be used.
         """
         self.config = config if config else TemporalBoundaryConfig()
-        self.history: dict[str, list[float]] = {}
+        # Per concept: the sum of all past deltas, each decayed by decay_factor per later change,
+        # and the number of changes seen. Together they give the decayed average in O(1). Both
+        # live in dense arrays (row per concept, see _rows) so a whole batch updates at once.
+        self._rows: dict[str, int] = {}
+        self._decayed_sum = np.zeros(16, dtype=np.float64)
+        self._count = np.zeros(16, dtype=np.int64)
+
+    def _rows_for(self, concept_ids: Sequence[str]) -> np.ndarray:
+        """
+        Look up the state rows of the given concepts, assigning rows to concepts seen for the first time.
+
+        Args:
+            concept_ids (Sequence[str]): The concept IDs.
+
+        Returns:
+            np.ndarray: The row of each concept, in the order given.
+        """
+        rows = self._rows
+        try:
+            # Fast path: every concept already has a row, so this is one dict lookup per ID
+            return np.fromiter(map(rows.__getitem__, concept_ids), dtype=np.intp, count=len(concept_ids))
+        except KeyError:
+            pass
+        new_ids = [concept_id for concept_id in dict.fromkeys(concept_ids) if concept_id not in rows]
+        start = len(rows)
+        needed = start + len(new_ids)
+        if needed > len(self._count):
+            capacity = max(needed, 2 * len(self._count))
+            for name in ("_decayed_sum", "_count"):
+                old = getattr(self, name)
+                new = np.zeros(capacity, dtype=old.dtype)
+                new[:start] = old[:start]
+                setattr(self, name, new)
+        rows.update(zip(new_ids, range(start, needed)))
+        return np.fromiter(map(rows.__getitem__, concept_ids), dtype=np.intp, count=len(concept_ids))
+
+    def _dynamic_thresholds(self, rows: np.ndarray, deltas: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Record a change for each row, in order, and return the rows' updated dynamic thresholds.
+
+        The decayed sum obeys `sum_t = delta_t + decay_factor * sum_{t-1}`, so it is updated in
+        place instead of re-weighting the whole history on every change. The update runs in
+        `update_thresholds`, which is compiled with Numba when it is installed.
+
+        Args:
+            rows (np.ndarray): The state row of each change; a row may repeat.
+            deltas (np.ndarray): The size of each change.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The dynamic threshold after each change, and the row's
+                                           number of changes so far.
+        """
+        thresholds = np.empty(len(rows), dtype=np.float64)
+        event_numbers = np.empty(len(rows), dtype=np.int64)
+        update_thresholds(self._decayed_sum, self._count, rows, deltas,
+                          float(self.config.decay_factor), float(self.config.threshold),
+                          thresholds, event_numbers)
+        return thresholds, event_numbers
 
     def _calculate_dynamic_threshold(self, concept_id: str, delta: float) -> float:
         """
@@ -70,19 +135,8 @@ class TemporalBoundary:
         Returns:
             float: The dynamic threshold for the concept.
         """
-        if concept_id not in self.history:
-            self.history[concept_id] = []
-        self.history[concept_id].append(delta)
-
-        # Apply exponential decay to historical deltas
-        weighted_deltas = [
-            delta * (self.config.decay_factor ** i)
-            for i, delta in enumerate(reversed(self.history[concept_id]))
-        ]
-        avg_delta = sum(weighted_deltas) / len(weighted_deltas) if weighted_deltas else 0.0
-
-        # Adjust the threshold based on the average delta
-        return self.config.threshold * (1 + avg_delta)
+        thresholds, _ = self._dynamic_thresholds(self._rows_for([concept_id]), np.array([delta], dtype=np.float64))
+        return float(thresholds[0])
 
     def detect_event(self, concept: Concept, new_state: float) -> Optional[Event]:
         """
@@ -95,22 +149,57 @@ class TemporalBoundary:
         Returns:
             Optional[Event]: An event representing the change, or None if no significant change occurred.
         """
-        delta = abs(concept.state - new_state)
+        return self.detect_events_batch([concept], [new_state])[0]
+
+    def detect_events_batch(self, concepts: Sequence[Concept], new_states: Sequence[float]) -> List[Optional[Event]]:
+        """
+        Detect significant changes for many concepts at once.
+
+        Equivalent to calling `detect_event` for each pair in order, but the deltas, threshold
+        updates and comparisons are done as array operations and `Event` objects are only built
+        for the concepts that crossed their threshold.
+
+        Args:
+            concepts (Sequence[Concept]): The concepts whose states have changed.
+            new_states (Sequence[float]): The new state of each concept (a list or 1-D array).
 
-        # Calculate the threshold (dynamic or static)
-        threshold = (
-            self._calculate_dynamic_threshold(concept.concept_id, delta)
-            if self.config.dynamic_threshold
-            else self.config.threshold
-        )
+        Returns:
+            List[Optional[Event]]: For each concept, an event representing the change, or None if no
+                                   significant change occurred.
 
-        if delta >= threshold:
+        Raises:
+            ValueError: If `concepts` and `new_states` differ in length.
+        """
+        n = len(concepts)
+        new_states = np.ascontiguousarray(new_states, dtype=np.float64)
+        if new_states.shape != (n,):
+            raise ValueError(f"Expected {n} new states, got an array of shape {new_states.shape}")
+        results: List[Optional[Event]] = [None] * n
+        if not n:
+            return results
+
+        old_states = np.fromiter((concept.state for concept in concepts), dtype=np.float64, count=n)
+        deltas = np.abs(old_states - new_states)
+        rows = self._rows_for([concept.concept_id for concept in concepts])
+
+        # Calculate the thresholds (dynamic or static)
+        if self.config.dynamic_threshold:
+            thresholds, event_numbers = self._dynamic_thresholds(rows, deltas)
+        else:
+            thresholds = self.config.threshold
+            event_numbers = self._count[rows]
+
+        hits = np.flatnonzero(deltas >= thresholds)
+        if not len(hits):
+            return results
+        timestamp = _now()
+        # Plain Python ints and floats format and compare faster than numpy scalars
+        for i, event_number, delta in zip(hits.tolist(), event_numbers[hits].tolist(), deltas[hits].tolist()):
             # Create an event
-            event = Event(
-                event_id=f"event_{len(self.history.get(concept.concept_id, []))}",
-                timestamp=datetime.now(),
-                concepts={concept},
+            results[i] = Event(
+                event_id=f"event_{event_number}",
+                timestamp=timestamp,
+                concepts={concepts[i]},
                 delta=delta,
             )
-            return event
-        return None
\ No newline at end of file
+        return results
@@ -1,2 +1,3 @@
-from .extractor import DataExtractor, Event, Relation
+from .extractor import DataExtractor, Event, Relation, enable_http_cache, disable_http_cache
+from .endpoints import ENDPOINTS
 from .integrator import DataIntegrator, IntegratedEvent, IntegratedRelation
\ No newline at end of file
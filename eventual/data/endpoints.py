@@ -0,0 +1,21 @@
+"""
+Endpoints queried by the `DataExtractor`.
+
+Each endpoint can be overridden with an environment variable (read at import time) or by editing
+`ENDPOINTS` before extracting, e.g. to point at a local Virtuoso or QLever mirror. Entries containing
+`{lang}` are per-language templates.
+
+Wikidata SPARQL queries go to the QLever Wikidata endpoint, which answers them much faster than the
+public Wikidata Query Service and is refreshed hourly. When it fails, the extractor retries the
+query against `ENDPOINTS["wikidata_sparql_fallback"]` (the Wikidata Query Service).
+"""
+import os
+
+ENDPOINTS: dict[str, str] = {
+    "wikidata_sparql": os.environ.get("EVENTUAL_WIKIDATA_SPARQL", "https://qlever.cs.uni-freiburg.de/api/wikidata"),
+    "wikidata_sparql_fallback": os.environ.get("EVENTUAL_WIKIDATA_SPARQL_FALLBACK", "https://query.wikidata.org/sparql"),
+    "wikidata_api": os.environ.get("EVENTUAL_WIKIDATA_API", "https://www.wikidata.org/w/api.php"),
+    "wikipedia_api": os.environ.get("EVENTUAL_WIKIPEDIA_API", "https://{lang}.wikipedia.org/w/api.php"),
+    "dbpedia_sparql": os.environ.get("EVENTUAL_DBPEDIA_SPARQL", "http://{lang}.dbpedia.org/sparql"),
+    "yago_api": os.environ.get("EVENTUAL_YAGO_API", "https://yago-knowledge.org/api/events"),
+}
@@ -1,6 +1,137 @@
 import requests
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+from requests.adapters import HTTPAdapter
+from .endpoints import ENDPOINTS
+
+try:
+    # ijson parses SPARQL results incrementally from the response stream, so only one binding is
+    # materialized at a time. It is optional; without it the whole response is parsed at once
+    import ijson
+except ImportError:
+    ijson = None
+
+# Upper bound on concurrent per-language requests
+_MAX_WORKERS = 8
+
+# Maximum number of entity IDs per wbgetentities request (the Wikidata API's limit)
+_WBGETENTITIES_BATCH = 50
+
+def _make_session(session: Optional[requests.Session] = None) -> requests.Session:
+    """
+    Configure the HTTP session shared by all extractors.
+
+    Reusing one session keeps connections alive, so only the first request to each host pays for
+    the TCP and TLS handshakes. The pool is sized for `_MAX_WORKERS` concurrent requests per host,
+    and the User-Agent identifies the client as Wikimedia's API etiquette asks.
+
+    Args:
+        session (Optional[requests.Session]): The session to configure. Defaults to a new plain session.
+    """
+    session = session if session is not None else requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = "eventual/0.1.0 (https://github.com/milesgray/eventual) python-requests"
+    return session
+
+_SESSION = _make_session()
+
+def enable_http_cache(cache_name: str = "eventual_http", backend: str = "sqlite", expire_after: int = 86400) -> requests.Session:
+    """
+    Cache extractor responses on disk, so repeated queries (e.g. across `DataIntegrator.run` calls)
+    are answered locally and keep working while an endpoint is down.
+
+    Requires the optional `requests-cache` package. Responses are keyed by method, URL and
+    normalized parameters, so identical SPARQL queries hit the same entry; server `Cache-Control`
+    headers are honoured, and other responses expire after `expire_after` seconds.
+
+    Args:
+        cache_name (str): The cache name (for the sqlite backend, the database file path without suffix).
+        backend (str): The requests-cache storage backend.
+        expire_after (int): Seconds a response stays fresh when the server gives no caching headers.
+
+    Returns:
+        requests.Session: The cached session now used by all extractors. Call
+                          `session.cache.clear()` on it to drop the cache.
+
+    Raises:
+        ImportError: If requests-cache is not installed.
+    """
+    global _SESSION
+    import requests_cache
+
+    _SESSION = _make_session(requests_cache.CachedSession(
+        cache_name=cache_name, backend=backend, expire_after=expire_after, cache_control=True,
+    ))
+    return _SESSION
+
+def disable_http_cache():
+    """
+    Go back to uncached requests for all extractors.
+    """
+    global _SESSION
+    _SESSION = _make_session()
+
+def _first_value(values: dict[str, dict], languages: list[str], default: str) -> str:
+    """
+    Return the value of the first language in `languages` present in a wbgetentities labels or descriptions dict.
+    """
+    for lang in languages:
+        if lang in values:
+            return values[lang]["value"]
+    return default
+
+def _sparql_bindings(url: str, query: str, fallback_url: Optional[str] = None) -> Iterator[dict]:
+    """
+    Run a SPARQL query and iterate over the bindings of its JSON results.
+
+    The request is sent immediately; the body is parsed lazily as the bindings are consumed.
+
+    Args:
+        url (str): The SPARQL endpoint.
+        query (str): The SPARQL query.
+        fallback_url (Optional[str]): An endpoint to retry the query against if `url` cannot be
+                                      reached or does not answer with HTTP 200.
+
+    Returns:
+        Iterator[dict]: The result bindings, in order.
+    """
+    headers = {"Accept": "application/sparql-results+json"}
+    try:
+        response = _SESSION.get(url, headers=headers, params={"query": query}, stream=True)
+    except requests.RequestException:
+        if fallback_url is None:
+            raise
+        response = None
+    if fallback_url is not None and (response is None or response.status_code != 200):
+        if response is not None:
+            response.close()
+        return _sparql_bindings(fallback_url, query)
+    if ijson is None:
+        return iter(response.json().get("results", {}).get("bindings", []))
+    return _stream_bindings(response)
+
+def _stream_bindings(response: requests.Response) -> Iterator[dict]:
+    """
+    Parse the bindings of a streamed SPARQL JSON response one at a time with ijson.
+    """
+    response.raw.decode_content = True
+    try:
+        yield from ijson.items(response.raw, "results.bindings.item")
+    finally:
+        response.close()
+
+def _map_languages(fetch: Callable[[str], list['Event']], languages: list[str]) -> list['Event']:
+    """
+    Run a per-language fetch for every language concurrently and concatenate the results in language order.
+    """
+    if len(languages) <= 1:
+        return [event for lang in languages for event in fetch(lang)]
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(languages))) as pool:
+        return [event for events in pool.map(fetch, languages) for event in events]
 
 @dataclass
 class Event:
@@ -14,57 +145,106 @@ class Relation:
     subject_id: str
     predicate: str
     object_id: str
+    source: str = "Wikidata"
 
 class DataExtractor:
     @staticmethod
     def extract_events_from_wikipedia(languages: list[str]) -> list[Event]:
         """
         Extract events from Wikipedia for the given languages.
+
+        The languages are fetched concurrently.
         """
-        events = []
-        for lang in languages:
-            # Example: Fetch events from Wikipedia API
-            url = f"https://{lang}.wikipedia.org/w/api.php"
-            params = {
-                "action": "query",
-                "list": "categorymembers",
-                "cmtitle": "Category:Events",
-                "cmlimit": 10,  # Limit for demonstration
-                "format": "json"
-            }
-            response = requests.get(url, params=params).json()
-            for page in response.get("query", {}).get("categorymembers", []):
-                event = Event(
-                    id=page["pageid"],
-                    label=page["title"],
-                    description=f"Event from Wikipedia ({lang})",
-                    source="Wikipedia"
-                )
-                events.append(event)
-        return events
+        return _map_languages(DataExtractor._fetch_wikipedia_events, languages)
+
+    @staticmethod
+    def _fetch_wikipedia_events(lang: str) -> list[Event]:
+        """
+        Extract events from the Wikipedia of one language.
+
+        The category members and their short descriptions are fetched together with
+        `generator=categorymembers`, up to 500 pages per request, following the API's continuation
+        until the whole category has been read. Pages without a short description get a generic one.
+        """
+        # Example: Fetch events from Wikipedia API
+        url = ENDPOINTS["wikipedia_api"].format(lang=lang)
+        params = {
+            "action": "query",
+            "generator": "categorymembers",
+            "gcmtitle": "Category:Events",
+            "gcmlimit": "max",  # 500 pages per request
+            "prop": "description",
+            "format": "json",
+            "formatversion": 2,  # Pages as a list rather than a dict keyed by page ID
+            "continue": "",
+        }
+        # Page ID -> page. A page's properties can arrive in a later batch than the page itself,
+        # so batches are merged before the events are built
+        pages: dict[int, dict] = {}
+        while True:
+            response = _SESSION.get(url, params=params).json()
+            for page in response.get("query", {}).get("pages", []):
+                pages.setdefault(page["pageid"], {}).update(page)
+            if "continue" not in response:
+                break
+            params.update(response["continue"])
+
+        return [
+            Event(
+                id=page_id,
+                label=page["title"],
+                description=page.get("description") or f"Event from Wikipedia ({lang})",
+                source="Wikipedia"
+            )
+            for page_id, page in pages.items()
+        ]
 
     @staticmethod
     def extract_events_from_wikidata(languages: list[str]) -> list[Event]:
         """
         Extract events from Wikidata for the given languages.
+
+        The SPARQL query only collects the event IDs; labels and descriptions are then fetched for
+        all events and languages at once with `wbgetentities`, in batches of 50 IDs, instead of
+        having the query service resolve labels. Each event gets the label and description of the
+        first of `languages` (then English) that has one.
         """
         events = []
         # Example: Query Wikidata for events
+        # QLever has no built-in prefixes, so they are declared explicitly
         query = """
-        SELECT ?event ?eventLabel WHERE {
+        PREFIX wd: <http://www.wikidata.org/entity/>
+        PREFIX wdt: <http://www.wikidata.org/prop/direct/>
+        SELECT ?event WHERE {
           ?event wdt:P31/wdt:P279* wd:Q1190554.  # Events
-          SERVICE wikibase:label { bd:serviceParam wikibase:language "[AUTO_LANGUAGE],en". }
         }
         LIMIT 10
         """
-        url = "https://query.wikidata.org/sparql"
-        headers = {"Accept": "application/json"}
-        response = requests.get(url, headers=headers, params={"query": query}).json()
-        for result in response.get("results", {}).get("bindings", []):
+        event_ids = list(dict.fromkeys(
+            result["event"]["value"].split("/")[-1]
+            for result in _sparql_bindings(ENDPOINTS["wikidata_sparql"], query, ENDPOINTS["wikidata_sparql_fallback"])
+        ))
+
+        label_languages = list(dict.fromkeys([*languages, "en"]))
+        entities = {}
+        for start in range(0, len(event_ids), _WBGETENTITIES_BATCH):
+            params = {
+                "action": "wbgetentities",
+                "ids": "|".join(event_ids[start:start + _WBGETENTITIES_BATCH]),
+                "languages": "|".join(label_languages),
+                "props": "labels|descriptions",
+                "format": "json"
+            }
+            response = _SESSION.get(ENDPOINTS["wikidata_api"], params=params).json()
+            entities.update(response.get("entities", {}))
+
+        for event_id in event_ids:
+            entity = entities.get(event_id, {})
             event = Event(
-                id=result["event"]["value"].split("/")[-1],
-                label=result["eventLabel"]["value"],
-                description="Event from Wikidata",
+                id=event_id,
+                # Like the query service's label service, fall back to the ID when there is no label
+                label=_first_value(entity.get("labels", {}), label_languages, default=event_id),
+                description=_first_value(entity.get("descriptions", {}), label_languages, default="Event from Wikidata"),
                 source="Wikidata"
             )
             events.append(event)
@@ -74,29 +254,37 @@ class DataExtractor:
     def extract_events_from_dbpedia(languages: list[str]) -> list[Event]:
         """
         Extract events from DBpedia for the given languages.
+
+        The languages are fetched concurrently.
+        """
+        return _map_languages(DataExtractor._fetch_dbpedia_events, languages)
+
+    @staticmethod
+    def _fetch_dbpedia_events(lang: str) -> list[Event]:
+        """
+        Extract events from the DBpedia of one language.
         """
         events = []
-        for lang in languages:
-            # Example: Query DBpedia for events
-            query = """
-            SELECT ?event ?label WHERE {
-              ?event a dbo:Event.
-              ?event rdfs:label ?label.
-              FILTER(LANG(?label) = "%s")
-            }
-            LIMIT 10
-            """ % lang
-            url = f"http://{lang}.dbpedia.org/sparql"
-            headers = {"Accept": "application/json"}
-            response = requests.get(url, headers=headers, params={"query": query}).json()
-            for result in response.get("results", {}).get("bindings", []):
-                event = Event(
-                    id=result["event"]["value"].split("/")[-1],
-                    label=result["label"]["value"],
-                    description="Event from DBpedia",
-                    source="DBpedia"
-                )
-                events.append(event)
+        # Example: Query DBpedia for events
+        query = """
+        PREFIX dbo: <http://dbpedia.org/ontology/>
+        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+        SELECT ?event ?label WHERE {
+          ?event a dbo:Event.
+          ?event rdfs:label ?label.
+          FILTER(LANG(?label) = "%s")
+        }
+        LIMIT 10
+        """ % lang
+        url = ENDPOINTS["dbpedia_sparql"].format(lang=lang)
+        for result in _sparql_bindings(url, query):
+            event = Event(
+                id=result["event"]["value"].split("/")[-1],
+                label=result["label"]["value"],
+                description="Event from DBpedia",
+                source="DBpedia"
+            )
+            events.append(event)
         return events
 
     @staticmethod
@@ -106,8 +294,8 @@ class DataExtractor:
         """
         events = []
         # Example: Query YAGO for events (hypothetical API)
-        url = "https://yago-knowledge.org/api/events"
-        response = requests.get(url).json()
+        url = ENDPOINTS["yago_api"]
+        response = _SESSION.get(url).json()
         for event_data in response.get("events", []):
             event = Event(
                 id=event_data["id"],
@@ -119,11 +307,13 @@ class DataExtractor:
         return events
 
     @staticmethod
-    def extract_relations_from_wikidata() -> list[Relation]:
+    def extract_relations_from_wikidata() -> Iterator[Relation]:
         """
         Extract relations between entities from Wikidata.
+
+        The query is sent right away, but the relations are parsed and yielded as they are consumed,
+        so a large result never has to be held in memory at once.
         """
-        relations = []
         # Example: Query Wikidata for relations
         query = """
         SELECT ?subject ?predicate ?object WHERE {
@@ -132,14 +322,12 @@ class DataExtractor:
         }
         LIMIT 10
         """
-        url = "https://query.wikidata.org/sparql"
-        headers = {"Accept": "application/json"}
-        response = requests.get(url, headers=headers, params={"query": query}).json()
-        for result in response.get("results", {}).get("bindings", []):
-            relation = Relation(
+        return (
+            Relation(
                 subject_id=result["subject"]["value"].split("/")[-1],
                 predicate=result["predicate"]["value"].split("/")[-1],
-                object_id=result["object"]["value"].split("/")[-1]
+                object_id=result["object"]["value"].split("/")[-1],
+                source="Wikidata"
             )
-            relations.append(relation)
-        return relations
\ No newline at end of file
+            for result in _sparql_bindings(ENDPOINTS["wikidata_sparql"], query, ENDPOINTS["wikidata_sparql_fallback"])
+        )
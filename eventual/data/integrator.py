@@ -1,103 +1,143 @@
-from dataclasses import dataclass
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
 from .extractor import DataExtractor, Event, Relation
 
+# Get the logger for this module
+logger = logging.getLogger(__name__)
+
 @dataclass
 class IntegratedEvent:
     id: str
     labels: dict[str, str]  # Language -> Label
     descriptions: dict[str, str]  # Language -> Description
-    sources: list[str]  # list of sources (e.g., Wikipedia, Wikidata)
+    sources: set[str] = field(default_factory=set)  # Sources (e.g., Wikipedia, Wikidata), interned
 
 @dataclass
 class IntegratedRelation:
     subject_id: str
     predicate: str
     object_id: str
-    sources: list[str]  # list of sources
+    sources: set[str] = field(default_factory=set)  # Sources, interned
+
+# Sources in the order their labels and descriptions are preferred by `resolve_conflicts`
+SOURCE_PRIORITY = ("Wikidata", "Wikipedia", "DBpedia", "YAGO")
+
+def _prefer(values: dict[str, str]) -> dict[str, str]:
+    """
+    Reduce per-source values to the one from the highest-priority source.
+
+    Args:
+        values (dict[str, str]): Source -> value.
+
+    Returns:
+        dict[str, str]: {"preferred": value}, or `values` itself if it is already resolved or holds
+                        no source from `SOURCE_PRIORITY`.
+    """
+    for source in SOURCE_PRIORITY:
+        if source in values:
+            return {"preferred": values[source]}
+    return values
 
 class DataIntegrator:
     def __init__(self, languages: list[str]):
         self.languages = languages
         self.events: dict[str, IntegratedEvent] = {}  # Event ID -> IntegratedEvent
         self.relations: list[IntegratedRelation] = []
+        # (subject_id, predicate, object_id) -> IntegratedRelation, for constant-time duplicate checks
+        self._relation_index: dict[tuple[str, str, str], IntegratedRelation] = {}
 
     def integrate_events(self, events: list['Event']):
         """
         Integrate events from multiple sources.
         """
         for event in events:
+            # Only a handful of distinct sources exist, so every event shares the same few strings
+            source = sys.intern(event.source)
             if event.id not in self.events:
                 # Create a new integrated event
                 self.events[event.id] = IntegratedEvent(
                     id=event.id,
-                    labels={event.source: event.label},
-                    descriptions={event.source: event.description},
-                    sources=[event.source]
+                    labels={source: event.label},
+                    descriptions={source: event.description},
+                    sources={source}
                 )
             else:
                 # Merge with existing event
                 integrated_event = self.events[event.id]
-                integrated_event.labels[event.source] = event.label
-                integrated_event.descriptions[event.source] = event.description
-                if event.source not in integrated_event.sources:
-                    integrated_event.sources.append(event.source)
+                integrated_event.labels[source] = event.label
+                integrated_event.descriptions[source] = event.description
+                integrated_event.sources.add(source)
 
-    def integrate_relations(self, relations: list['Relation']):
+    def integrate_relations(self, relations: Iterable['Relation'], source: Optional[str] = None):
         """
-        Integrate relations from multiple sources.
+        Integrate relations from one or more sources.
+
+        Args:
+            relations (Iterable[Relation]): The relations to integrate; consumed once, so a lazy
+                                            iterator (see `DataExtractor.extract_relations_from_wikidata`) works.
+            source (Optional[str]): The source all the relations come from (e.g., Wikidata). If None,
+                                    each relation's own `source` is used.
         """
+        if source is not None:
+            source = sys.intern(source)
         for relation in relations:
+            relation_source = source if source is not None else sys.intern(relation.source)
             # Check if the relation already exists
-            existing_relation = next(
-                (r for r in self.relations if
-                 r.subject_id == relation.subject_id and
-                 r.predicate == relation.predicate and
-                 r.object_id == relation.object_id),
-                None
-            )
+            key = (relation.subject_id, relation.predicate, relation.object_id)
+            existing_relation = self._relation_index.get(key)
             if existing_relation:
                 # Add the source to the existing relation
-                if relation.source not in existing_relation.sources:
-                    existing_relation.sources.append(relation.source)
+                existing_relation.sources.add(relation_source)
             else:
                 # Create a new integrated relation
-                self.relations.append(IntegratedRelation(
+                integrated_relation = IntegratedRelation(
                     subject_id=relation.subject_id,
                     predicate=relation.predicate,
                     object_id=relation.object_id,
-                    sources=[relation.source]
-                ))
+                    sources={relation_source}
+                )
+                self.relations.append(integrated_relation)
+                self._relation_index[key] = integrated_relation
 
     def resolve_conflicts(self):
         """
         Resolve conflicts in event labels and descriptions.
-        For example, prefer Wikidata labels over Wikipedia labels.
+
+        Each event keeps a single "preferred" label and description, taken from the highest-priority
+        source that provides one (see `SOURCE_PRIORITY`; Wikidata first). Values from sources not in
+        the priority list are left as they are.
         """
         for event in self.events.values():
-            # Prefer Wikidata labels if available
-            if "Wikidata" in event.labels:
-                preferred_label = event.labels["Wikidata"]
-                event.labels = {"preferred": preferred_label}
-            # Prefer Wikidata descriptions if available
-            if "Wikidata" in event.descriptions:
-                preferred_description = event.descriptions["Wikidata"]
-                event.descriptions = {"preferred": preferred_description}
+            event.labels = _prefer(event.labels)
+            event.descriptions = _prefer(event.descriptions)
 
     def run(self):
         """
         Run the integration process.
         """
-        print("Integrating data...")
-        # Example: Integrate events from multiple sources
-        self.integrate_events(DataExtractor.extract_events_from_wikipedia(self.languages))
-        self.integrate_events(DataExtractor.extract_events_from_wikidata(self.languages))
-        self.integrate_events(DataExtractor.extract_events_from_dbpedia(self.languages))
-        self.integrate_events(DataExtractor.extract_events_from_yago(self.languages))
+        logger.info("Integrating data...")
+        # The sources are independent network fetches, so they run concurrently; the results are
+        # integrated in a fixed order so merging does not depend on which fetch finishes first
+        event_extractors = (
+            DataExtractor.extract_events_from_wikipedia,
+            DataExtractor.extract_events_from_wikidata,
+            DataExtractor.extract_events_from_dbpedia,
+            DataExtractor.extract_events_from_yago,
+        )
+        with ThreadPoolExecutor(max_workers=len(event_extractors) + 1) as pool:
+            event_futures = [pool.submit(extract, self.languages) for extract in event_extractors]
+            # Example: Relations from Wikidata
+            relations_future = pool.submit(DataExtractor.extract_relations_from_wikidata)
 
-        # Example: Integrate relations from Wikidata
-        self.integrate_relations(DataExtractor.extract_relations_from_wikidata())
+            # Example: Integrate events from multiple sources
+            for future in event_futures:
+                self.integrate_events(future.result())
+            self.integrate_relations(relations_future.result())
 
         # Resolve conflicts
         self.resolve_conflicts()
 
-        print("Integration complete.")
\ No newline at end of file
+        logger.info("Integration complete.")
\ No newline at end of file
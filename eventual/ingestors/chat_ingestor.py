@@ -37,10 +37,14 @@ print("Extracted Events:", processor_output.extracted_events)
 # print("Hypergraph state after chat ingestion:", hypergraph)
 ```
 """
+import logging
 from typing import Optional
 from eventual.processors.text_processor import TextProcessor
 from eventual.processors.processor_output import ProcessorOutput
 
+# Get the logger for this module
+logger = logging.getLogger(__name__)
+
 class ChatIngestor:
     """
     A class for ingesting chat messages and processing them using a TextProcessor.
@@ -74,11 +78,11 @@ class ChatIngestor:
                              from the chat message.
         """
         if not message:
-            print("Warning: Empty chat message received.")
+            logger.warning("Empty chat message received.")
             return ProcessorOutput() # Return empty output for empty message
 
         # Use the TextProcessor to extract concepts and relationships using the LLM method
         processor_output = self._text_processor.extract_concepts_and_graph_llm(message)
 
-        print(f"ChatIngestor processed message. Extracted {len(processor_output.extracted_concepts)} concepts and {len(processor_output.extracted_events)} events.")
+        logger.debug("ChatIngestor processed message. Extracted %d concepts and %d events.", len(processor_output.extracted_concepts), len(processor_output.extracted_events))
         return processor_output
@@ -1,5 +1,5 @@
+import logging
 from typing import TYPE_CHECKING, Optional
-from uuid import uuid4
 from datetime import datetime
 
 from eventual.ingestors.integrator import BaseIntegrator
@@ -12,9 +12,13 @@ if TYPE_CHECKING:
     from eventual.processors.processor_output import ProcessorOutput, ExtractedConcept, ExtractedEvent
 
 # Import concrete Concept and Event for instantiation
+from eventual.core.identifiers import generate_id
 from eventual.core.concept import Concept # type: ignore
 from eventual.core.event import Event # type: ignore
 
+# Get the logger for this module
+logger = logging.getLogger(__name__)
+
 class HypergraphIntegrator(BaseIntegrator):
     """
     An Integrator specifically designed to integrate data into a Hypergraph.
@@ -30,30 +34,31 @@ class HypergraphIntegrator(BaseIntegrator):
             processor_output (ProcessorOutput): The structured data output from a processor.
             hypergraph (Hypergraph): The Hypergraph instance to integrate data into.
         """
-        print(f"Integrating data: {len(processor_output.extracted_concepts)} concepts, {len(processor_output.extracted_events)} events.")
+        logger.info("Integrating data: %d concepts, %d events.", len(processor_output.extracted_concepts), len(processor_output.extracted_events))
 
         # 1. Integrate Concepts
         # Add all extracted concepts to the hypergraph first, ensuring uniqueness.
         # This is important so that events can refer to these concepts.
-        integrated_concepts: list[Concept] = []
-        for ext_concept in processor_output.extracted_concepts:
-            # Use add_concept_if_not_exists to handle potential duplicates by name or ID
-            # Assign a temporary ID if not provided in the extracted concept, Hypergraph will handle actual ID if new
-            concept_to_add = Concept(
-                concept_id=ext_concept.concept_id if ext_concept.concept_id else f"concept_{uuid4().hex}",
+        # Assign a temporary ID if not provided in the extracted concept, Hypergraph will handle actual ID if new
+        concepts_to_add = [
+            Concept(
+                concept_id=ext_concept.concept_id if ext_concept.concept_id else generate_id("concept"),
                 name=ext_concept.name,
                 initial_state=ext_concept.initial_state, # Use initial_state from extracted data
                 metadata=ext_concept.properties # Use metadata field for properties
             )
-            try:
-                # add_concept_if_not_exists returns the existing or newly added concept
-                integrated_concept = hypergraph.add_concept_if_not_exists(concept_to_add)
-                integrated_concepts.append(integrated_concept) # Keep track of concepts that are definitely in the hypergraph
-                # print(f"Integrated concept: {integrated_concept.name} (ID: {integrated_concept.concept_id})") # Optional logging
-            except ValueError as e:
-                 # This might happen if a concept with the same ID or name but different attributes exists
-                 # Depending on desired behavior, this might need more sophisticated handling (e.g., merging)
-                 print(f"Warning: Could not integrate concept '{ext_concept.name}' (ID: {ext_concept.concept_id}): {e}")
+            for ext_concept in processor_output.extracted_concepts
+        ]
+        # add_concepts_bulk returns the existing or newly added concept for each one, handling
+        # duplicates by name or ID, with one batched lemmatization pass for the whole output
+        integrated_concepts: list[Concept] = hypergraph.add_concepts_bulk(concepts_to_add)
+
+        # Names seen in this batch -> their concepts in the hypergraph, so events can resolve their
+        # concepts without lemmatizing each identifier again
+        name_index: dict[str, Concept] = {}
+        for ext_concept, integrated_concept in zip(processor_output.extracted_concepts, integrated_concepts):
+            name_index[ext_concept.name] = integrated_concept
+            name_index.setdefault(integrated_concept.name, integrated_concept)
 
 
         # 2. Integrate Events
@@ -67,19 +72,20 @@ class HypergraphIntegrator(BaseIntegrator):
                 # Try to get by ID first if it looks like a UUID, otherwise by name
                 # This requires a heuristic or explicit typing in ExtractedEvent if both are possible
                 # Assuming concept_identifiers are primarily names (lemmas) from TextProcessor for now
-                resolved_concept = hypergraph.get_concept_by_name(concept_id_or_name)
+                # Fall back to the hypergraph for concepts that were not part of this batch
+                resolved_concept = name_index.get(concept_id_or_name) or hypergraph.get_concept_by_name(concept_id_or_name)
 
                 if resolved_concept:
                     involved_concepts.append(resolved_concept)
                 else:
-                    print(f"Warning: Concept '{concept_id_or_name}' for event {ext_event.event_id if ext_event.event_id else '[new event]'} not found in hypergraph. Skipping event integration.")
+                    logger.warning("Concept '%s' for event %s not found in hypergraph. Skipping event integration.", concept_id_or_name, ext_event.event_id or '[new event]')
                     all_concepts_found = False
                     break # Cannot integrate this event if a concept is missing
 
             if all_concepts_found and involved_concepts:
                 # Create the actual Event object
                 event_to_add = Event(
-                    event_id=ext_event.event_id if ext_event.event_id else f"event_{uuid4().hex}",
+                    event_id=ext_event.event_id if ext_event.event_id else generate_id("event"),
                     timestamp=ext_event.timestamp,
                     concepts=set(involved_concepts), # Event expects a set of Concept objects
                     delta=ext_event.delta,
@@ -88,8 +94,9 @@ class HypergraphIntegrator(BaseIntegrator):
 
                 try:
                     hypergraph.add_event(event_to_add)
-                    # print(f"Integrated event: {event_to_add.event_id} involving {[c.name for c in involved_concepts]}") # Optional logging
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Integrated event: %s involving %s", event_to_add.event_id, [c.name for c in involved_concepts])
                 except ValueError as e:
-                    print(f"Warning: Could not integrate event {event_to_add.event_id}: {e}")
+                    logger.warning("Could not integrate event %s: %s", event_to_add.event_id, e)
 
-        print("Integration complete.")
+        logger.info("Integration complete.")
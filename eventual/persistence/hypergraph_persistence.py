@@ -22,7 +22,8 @@ persistence_manager = HypergraphPersistence()
 # Define the file path
 file_path = "hypergraph_data.json"
 
-# Save the hypergraph
+# Save the hypergraph (files ending in .ndjson or .jsonl are written one record per line, and
+# adding a .zst suffix, e.g. "hypergraph_data.json.zst", compresses the file with zstd)
 persistence_manager.save_hypergraph(hypergraph, file_path)
 print(f"Hypergraph saved to {file_path}")
 
@@ -32,26 +33,142 @@ print(f"Hypergraph loaded from {file_path}")
 print(f"Loaded Hypergraph state: {loaded_hypergraph}")
 ```
 """
+import io
 import json
+import logging
 import os
-from typing import Optional
+import secrets
+import stat
+from typing import Iterable, Iterator, Optional, Tuple
 from eventual.core.hypergraph import Hypergraph
 
+# Get the logger for this module
+logger = logging.getLogger(__name__)
+
+# Files with these suffixes hold newline-delimited JSON records, which are written and read one
+# concept or event at a time instead of as a single document
+_NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+# Files with this suffix are zstd-compressed; the rest of the name selects the format within
+_ZSTD_SUFFIX = ".zst"
+
+
+def _zstandard():
+    """
+    Import the optional `zstandard` package, which is needed only for `.zst` files.
+
+    Returns:
+        module: The `zstandard` module.
+
+    Raises:
+        ImportError: If `zstandard` is not installed.
+    """
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("Reading or writing .zst hypergraph files requires the 'zstandard' package.") from e
+    return zstandard
+
+
+def _compressed(chunks: Iterable[bytes], level: int) -> Iterator[bytes]:
+    """
+    Compress `chunks` into a single zstd frame, chunk by chunk.
+
+    Args:
+        chunks (Iterable[bytes]): The uncompressed data.
+        level (int): The zstd compression level.
+
+    Yields:
+        bytes: The compressed data.
+    """
+    compressor = _zstandard().ZstdCompressor(level=level).compressobj()
+    for chunk in chunks:
+        yield compressor.compress(chunk)
+    yield compressor.flush()
+
+
+def _create_temp_file(directory: str, name: str) -> Tuple[int, str]:
+    """
+    Create a new, uniquely named temporary file for `name` in `directory`.
+
+    Unlike `tempfile.mkstemp`, which always uses mode 0600, the file is created with 0o666 so the
+    kernel applies the process umask, as it does for any new file.
+
+    Args:
+        directory (str): The directory to create the file in.
+        name (str): The name of the file it will replace, used as a prefix.
+
+    Returns:
+        Tuple[int, str]: The open file descriptor and the path of the file.
+    """
+    while True:
+        tmp_path = os.path.join(directory, f".{name}.{secrets.token_hex(8)}.tmp")
+        try:
+            return os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), tmp_path
+        except FileExistsError:
+            continue
+
+
+def _write_atomic(file_path: str, chunks: Iterable[bytes]):
+    """
+    Write `chunks` to a temporary file next to `file_path`, then move it into place.
+
+    The replacement is atomic, so readers see either the previous file or the complete new one,
+    and a failure part-way through leaves the previous file untouched. The new file keeps the mode
+    of the file it replaces, or gets the usual mode for new files (0o666 less the umask).
+
+    Args:
+        file_path (str): The destination path.
+        chunks (Iterable[bytes]): The file contents.
+    """
+    try:
+        existing_mode: Optional[int] = stat.S_IMODE(os.stat(file_path).st_mode)
+    except FileNotFoundError:
+        existing_mode = None
+    directory, name = os.path.split(os.path.abspath(file_path))
+    fd, tmp_path = _create_temp_file(directory, name)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            if existing_mode is not None:
+                os.fchmod(f.fileno(), existing_mode)
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
 class HypergraphPersistence:
     """
     Manages saving and loading of the Hypergraph to and from a file.
     """
 
-    def __init__(self):
+    def __init__(self, compression_level: int = 3):
         """
         Initialize the HypergraphPersistence manager.
+
+        Args:
+            compression_level (int): The zstd level used for `.zst` files. Low levels (the default 3)
+                                     suit frequent saves; higher ones (e.g. 9 or more) shrink archived
+                                     hypergraphs further at the cost of slower saves.
         """
-        pass # No specific initialization needed for this basic version
+        self.compression_level = compression_level
 
     def save_hypergraph(self, hypergraph: Hypergraph, file_path: str):
         """
         Saves the Hypergraph object to a JSON file.
 
+        The document is encoded by `Hypergraph.to_json`, which uses orjson when it is installed and
+        writes compact JSON rather than indenting it. Paths ending in `.ndjson` or `.jsonl` are
+        written as newline-delimited records by `Hypergraph.iter_ndjson` instead, which keeps only one
+        record in memory at a time. A further `.zst` suffix (e.g. `graph.ndjson.zst`) compresses the
+        file with zstd, which needs the optional `zstandard` package; the repetitive JSON typically
+        shrinks several times over. The file is replaced atomically, so an interrupted save never
+        leaves a truncated file behind.
+
         Args:
             hypergraph (Hypergraph): The Hypergraph object to save.
             file_path (str): The path to the JSON file.
@@ -59,16 +176,24 @@ class HypergraphPersistence:
         if not isinstance(hypergraph, Hypergraph):
             raise TypeError("hypergraph must be an instance of Hypergraph")
 
-        hypergraph_dict = hypergraph.to_dict()
-
         try:
             # Ensure the directory exists
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            with open(file_path, 'w') as f:
-                json.dump(hypergraph_dict, f, indent=4)
-            print(f"Hypergraph successfully saved to {file_path}")
+            directory = os.path.dirname(file_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            compress = file_path.endswith(_ZSTD_SUFFIX)
+            if compress:
+                _zstandard()  # Fail before serializing anything if zstandard is missing
+            if file_path.removesuffix(_ZSTD_SUFFIX).endswith(_NDJSON_SUFFIXES):
+                chunks = hypergraph.iter_ndjson()
+            else:
+                chunks = (hypergraph.to_json(),)
+            if compress:
+                chunks = _compressed(chunks, self.compression_level)
+            _write_atomic(file_path, chunks)
+            logger.info("Hypergraph successfully saved to %s", file_path)
         except IOError as e:
-            print(f"Error saving hypergraph to {file_path}: {e}")
+            logger.error("Error saving hypergraph to %s: %s", file_path, e)
             # Depending on desired behavior, you might re-raise the exception or handle it.
             raise
 
@@ -76,6 +201,9 @@ class HypergraphPersistence:
         """
         Loads a Hypergraph object from a JSON file.
 
+        Paths ending in `.ndjson` or `.jsonl` are read as newline-delimited records, one line at a time,
+        and paths ending in `.zst` are decompressed as they are read (see `save_hypergraph`).
+
         Args:
             file_path (str): The path to the JSON file.
 
@@ -83,22 +211,27 @@ class HypergraphPersistence:
             Optional[Hypergraph]: The loaded Hypergraph object, or None if the file does not exist or loading fails.
         """
         if not os.path.exists(file_path):
-            print(f"Warning: Hypergraph save file not found at {file_path}. Returning None.")
+            logger.warning("Hypergraph save file not found at %s. Returning None.", file_path)
             return None
 
         try:
-            with open(file_path, 'r') as f:
-                hypergraph_dict = json.load(f)
-
-            # Create a new Hypergraph instance from the loaded dictionary
-            hypergraph = Hypergraph.from_dict(hypergraph_dict)
-            print(f"Hypergraph successfully loaded from {file_path}")
+            with open(file_path, 'rb') as f:
+                stream = f
+                if file_path.endswith(_ZSTD_SUFFIX):
+                    # Buffered so that NDJSON records can be read line by line
+                    stream = io.BufferedReader(_zstandard().ZstdDecompressor().stream_reader(f))
+                if file_path.removesuffix(_ZSTD_SUFFIX).endswith(_NDJSON_SUFFIXES):
+                    hypergraph = Hypergraph.from_ndjson(stream)
+                else:
+                    # Create a new Hypergraph instance from the loaded document
+                    hypergraph = Hypergraph.from_json(stream.read())
+            logger.info("Hypergraph successfully loaded from %s", file_path)
             return hypergraph
-        except json.JSONDecodeError as e:
-            print(f"Error decoding JSON from {file_path}: {e}")
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError is a subclass
+            logger.error("Error decoding JSON from %s: %s", file_path, e)
             return None
         except Exception as e:
-            print(f"Error loading hypergraph from {file_path}: {e}")
+            logger.error("Error loading hypergraph from %s: %s", file_path, e)
             return None
 
     def delete_hypergraph_file(self, file_path: str):
@@ -111,11 +244,11 @@ class HypergraphPersistence:
         if os.path.exists(file_path):
             try:
                 os.remove(file_path)
-                print(f"Hypergraph save file deleted: {file_path}")
+                logger.info("Hypergraph save file deleted: %s", file_path)
             except OSError as e:
-                print(f"Error deleting hypergraph save file {file_path}: {e}")
+                logger.error("Error deleting hypergraph save file %s: %s", file_path, e)
                 # Depending on desired behavior, you might re-raise the exception or handle it.
                 raise
         else:
-            print(f"Warning: Hypergraph save file not found for deletion: {file_path}")
+            logger.warning("Hypergraph save file not found for deletion: %s", file_path)
 
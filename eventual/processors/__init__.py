@@ -1,2 +1,2 @@
 from .text_processor import TextProcessor
-from .processor_output import ProcessorOutput
\ No newline at end of file
+from .processor_output import ProcessorOutput, ConceptGraph
\ No newline at end of file
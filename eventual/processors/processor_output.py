@@ -1,8 +1,15 @@
+import sys
 from dataclasses import dataclass, field
 from typing import Optional
 from datetime import datetime
+import numpy as np
 
-@dataclass
+# Processors emit extracted concepts and events in bulk (one per concept mention or relationship),
+# so they are slotted where dataclasses support it (Python 3.10+): no per-instance __dict__,
+# and attribute access is a direct slot read
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class ExtractedConcept:
     """
     Represents a concept extracted by a processor.
@@ -14,7 +21,7 @@ class ExtractedConcept:
     properties: dict[str, any] = field(default_factory=dict)
     initial_state: float = 0.0 # Assuming a default initial state
 
-@dataclass
+@dataclass(**_SLOTS)
 class ExtractedEvent:
     """
     Represents an event or relationship extracted by a processor.
@@ -37,3 +44,63 @@ class ProcessorOutput:
     """
     extracted_concepts: list[ExtractedConcept] = field(default_factory=list)
     extracted_events: list[ExtractedEvent] = field(default_factory=list)
+
+    def to_concept_graph(self) -> "ConceptGraph":
+        """
+        Builds the compact concept graph of this output (see `ConceptGraph.from_processor_output`).
+        """
+        return ConceptGraph.from_processor_output(self)
+
+@dataclass(**_SLOTS)
+class ConceptGraph:
+    """
+    Compact, index-based graph of extracted concepts and their pairwise relationships.
+
+    Concept names are stored once in `concepts`; each relationship is a row of `edges` holding the
+    indices of its two concepts, so an edge costs two int32s instead of Python lists of strings.
+    The edge array can be fed directly to numpy/scipy graph algorithms.
+    """
+    concepts: list[str] = field(default_factory=list)
+    # (E, 2) int32 array of (source, target) indices into `concepts`
+    edges: np.ndarray = field(default_factory=lambda: np.empty((0, 2), dtype=np.int32))
+
+    @classmethod
+    def from_processor_output(cls, output: "ProcessorOutput") -> "ConceptGraph":
+        """
+        Builds the graph from a processor output.
+
+        Every extracted concept becomes a node. Every extracted event involving exactly two concepts
+        becomes an edge; concepts named only by such events are added as nodes too.
+
+        Args:
+            output (ProcessorOutput): The processor output.
+
+        Returns:
+            ConceptGraph: The graph.
+        """
+        name_to_idx: dict[str, int] = {}
+        for concept in output.extracted_concepts:
+            name_to_idx.setdefault(concept.name, len(name_to_idx))
+        pairs = [event.concept_identifiers for event in output.extracted_events if len(event.concept_identifiers) == 2]
+        edges = np.fromiter(
+            (name_to_idx.setdefault(name, len(name_to_idx)) for pair in pairs for name in pair),
+            dtype=np.int32,
+            count=2 * len(pairs),
+        ).reshape(-1, 2)
+        return cls(concepts=list(name_to_idx), edges=edges)
+
+    def to_scipy_csr(self):
+        """
+        Builds the (directed) adjacency matrix as a `scipy.sparse.csr_matrix`.
+
+        Requires scipy, which is imported only when this method is called.
+
+        Returns:
+            scipy.sparse.csr_matrix: An N x N matrix with the number of edges from concept i to concept j
+            at (i, j).
+        """
+        from scipy.sparse import csr_matrix
+
+        n = len(self.concepts)
+        weights = np.ones(len(self.edges), dtype=np.int32)
+        return csr_matrix((weights, (self.edges[:, 0], self.edges[:, 1])), shape=(n, n))
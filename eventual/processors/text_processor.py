@@ -103,6 +103,7 @@ import spacy
 import litellm
 import os
 import json
+import threading
 import yaml
 from uuid import uuid4
 from datetime import datetime
@@ -146,8 +147,13 @@ class TextProcessor:
         """
         self.nlp = spacy.load(language_model)
         self.vectorizer = TfidfVectorizer(stop_words="english")
+        # extract_concepts refits the shared vectorizer per text; the lock keeps concurrent calls
+        # (e.g. sensors sharing this processor across threads) from reading each other's fit
+        self._vectorizer_lock = threading.Lock()
         # Ensure concept map keys are lemmas
         self.concept_map = {self._get_lemma(k): [self._get_lemma(s) for s in v] for k, v in self._load_default_concept_map().items()}
+        # Bumped whenever concept_map changes, so callers caching extract_concepts results can tell they are stale
+        self.concept_map_version = 0
         self.llm_settings = self._load_llm_config(config_path)
 
         # Ensure API keys are set up as environment variables for litellm
@@ -252,13 +258,65 @@ class TextProcessor:
             return ProcessorOutput()
 
         try:
-            self.vectorizer.fit([" ".join(tokens_lemma)])
-            tfidf_matrix = self.vectorizer.transform([" ".join(tokens_lemma)])
-            feature_names = self.vectorizer.get_feature_names_out()
+            with self._vectorizer_lock:
+                self.vectorizer.fit([" ".join(tokens_lemma)])
+                tfidf_matrix = self.vectorizer.transform([" ".join(tokens_lemma)])
+                feature_names = self.vectorizer.get_feature_names_out()
             tfidf_scores = dict(zip(feature_names, tfidf_matrix.toarray()[0]))
         except ValueError: # Handle empty vocabulary case
              return ProcessorOutput()
 
+        return self._concepts_from_scores(tfidf_scores, normalize)
+
+    def extract_concepts_batch(self, texts: list[str], normalize: bool = True) -> list[ProcessorOutput]:
+        """
+        Extract concepts from several texts at once; equivalent to calling `extract_concepts` on each.
+
+        The texts are lemmatized together with `nlp.pipe` and vectorized in one sparse matrix instead
+        of fitting a vectorizer per text. `extract_concepts` scores each text on its own (a one-document
+        fit, where every IDF is 1), so the batch uses plain L2-normalized term frequencies, which gives
+        the same scores per text.
+
+        Args:
+            texts (list[str]): The input texts.
+            normalize (bool): Whether to normalize the values to a range of [0, 1]. Defaults to True.
+
+        Returns:
+            list[ProcessorOutput]: One output per text, in order.
+        """
+        outputs = [ProcessorOutput() for _ in texts]
+        # Empty texts are skipped without lemmatizing them, as in extract_concepts
+        positions = [i for i, text in enumerate(texts) if text]
+        documents = [
+            " ".join(token.lemma_.lower() for token in doc if not token.is_stop and token.is_alpha)
+            for doc in self.nlp.pipe(texts[i] for i in positions)
+        ]
+        vectorizer = TfidfVectorizer(stop_words="english", use_idf=False)
+        try:
+            tf_matrix = vectorizer.fit_transform(documents).tocsr()
+        except ValueError: # Handle empty vocabulary case
+            return outputs
+        feature_names = vectorizer.get_feature_names_out().tolist()
+        indptr, indices, data = tf_matrix.indptr, tf_matrix.indices.tolist(), tf_matrix.data.tolist()
+        for row, i in enumerate(positions):
+            start, end = indptr[row], indptr[row + 1]
+            if start == end:
+                continue
+            tfidf_scores = dict(zip([feature_names[j] for j in indices[start:end]], data[start:end]))
+            outputs[i] = self._concepts_from_scores(tfidf_scores, normalize)
+        return outputs
+
+    def _concepts_from_scores(self, tfidf_scores: dict[str, float], normalize: bool) -> ProcessorOutput:
+        """
+        Map per-lemma TF-IDF scores of one text to scored concepts (steps 3-5 of `extract_concepts`).
+
+        Args:
+            tfidf_scores (dict[str, float]): TF-IDF score of each lemma in the text.
+            normalize (bool): Whether to normalize the values to a range of [0, 1].
+
+        Returns:
+            ProcessorOutput: An object containing the extracted concepts as ExtractedConcept instances.
+        """
         # Step 3: Map lemmas to concepts using the concept map (which uses lemmas as keys)
         concept_scores = defaultdict(float)
         for concept_lemma, synonyms_lemmas in self.concept_map.items():
@@ -334,9 +392,9 @@ class TextProcessor:
             # Extract and parse the JSON string from the response
             response_content = response.choices[0].message.content.strip()
 
-            # Handle cases where the LLM might include markdown like ```json ```
-            if response_content.startswith("```json"):
-                response_content = response_content[len("```json"):].rstrip("```")
+            # Handle cases where the LLM might include markdown like ```json ``` (or a bare ``` fence)
+            if response_content.startswith("```"):
+                response_content = response_content.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
 
             # Handle cases where the response might be wrapped in other text or is not valid JSON
             try:
@@ -355,7 +413,8 @@ class TextProcessor:
                 # Do not assign concept_id here; that's the Integrator's job
                 extracted_concepts.append(ExtractedConcept(name=concept_lemma))
 
-            # Create ExtractedEvent instances for relationships
+            # Create ExtractedEvent instances for relationships, all stamped with one clock read
+            extracted_at = datetime.now()
             for relation in relationships_list:
                 if len(relation) == 2:
                     concept_a_name, concept_b_name = relation
@@ -370,7 +429,7 @@ class TextProcessor:
                     # Do not assign event_id here; that's the Integrator's job
                     relationship_event = ExtractedEvent(
                         concept_identifiers=involved_concept_identifiers,
-                        timestamp=datetime.now(),
+                        timestamp=extracted_at,
                         delta=0.0, # No state change implied by just a relationship
                         event_type='relationship',
                         properties={
@@ -400,6 +459,7 @@ class TextProcessor:
         concept_lemma = self._get_lemma(concept)
         synonyms_lemmas = [self._get_lemma(s) for s in synonyms]
         self.concept_map[concept_lemma] = synonyms_lemmas
+        self.concept_map_version += 1
 
     def detect_phase_shifts(self, text1: str, text2: str, delta_threshold: float = 0.1) -> list[ExtractedEvent]:
         """
@@ -428,6 +488,7 @@ class TextProcessor:
         concepts2_scores = {c.name: c.initial_state for c in concepts2_output.extracted_concepts}
 
         phase_shift_events = []
+        detected_at = datetime.now() # One clock read for all shifts between the two texts
         all_concepts_lemmas = set(concepts1_scores.keys()).union(set(concepts2_scores.keys()))
         
         for concept_lemma in all_concepts_lemmas:
@@ -444,7 +505,7 @@ class TextProcessor:
                  # Do not assign event_id here; that's the Integrator's job
                  phase_shift_event = ExtractedEvent(
                      concept_identifiers=involved_concept_identifiers,
-                     timestamp=datetime.now(),
+                     timestamp=detected_at,
                      delta=delta, 
                      event_type='phase_shift',
                      properties={
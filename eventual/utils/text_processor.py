@@ -334,9 +334,9 @@ class TextProcessor:
             # Extract and parse the JSON string from the response
             response_content = response.choices[0].message.content.strip()
 
-            # Handle cases where the LLM might include markdown like ```json ```
-            if response_content.startswith("```json"):
-                response_content = response_content[len("```json"):].rstrip("```")
+            # Handle cases where the LLM might include markdown like ```json ``` (or a bare ``` fence)
+            if response_content.startswith("```"):
+                response_content = response_content.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
 
             # Handle cases where the response might be wrapped in other text or is not valid JSON
             try:
@@ -355,7 +355,8 @@ class TextProcessor:
                 # Do not assign concept_id here; that's the Integrator's job
                 extracted_concepts.append(ExtractedConcept(name=concept_lemma))
 
-            # Create ExtractedEvent instances for relationships
+            # Create ExtractedEvent instances for relationships, all stamped with one clock read
+            extracted_at = datetime.now()
             for relation in relationships_list:
                 if len(relation) == 2:
                     concept_a_name, concept_b_name = relation
@@ -370,7 +371,7 @@ class TextProcessor:
                     # Do not assign event_id here; that's the Integrator's job
                     relationship_event = ExtractedEvent(
                         concept_identifiers=involved_concept_identifiers,
-                        timestamp=datetime.now(),
+                        timestamp=extracted_at,
                         delta=0.0, # No state change implied by just a relationship
                         event_type='relationship',
                         properties={
@@ -428,6 +429,7 @@ class TextProcessor:
         concepts2_scores = {c.name: c.initial_state for c in concepts2_output.extracted_concepts}
 
         phase_shift_events = []
+        detected_at = datetime.now() # One clock read for all shifts between the two texts
         all_concepts_lemmas = set(concepts1_scores.keys()).union(set(concepts2_scores.keys()))
         
         for concept_lemma in all_concepts_lemmas:
@@ -444,7 +446,7 @@ class TextProcessor:
                  # Do not assign event_id here; that's the Integrator's job
                  phase_shift_event = ExtractedEvent(
                      concept_identifiers=involved_concept_identifiers,
-                     timestamp=datetime.now(),
+                     timestamp=detected_at,
                      delta=delta, 
                      event_type='phase_shift',
                      properties={
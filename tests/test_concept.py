@@ -0,0 +1,97 @@
+import pytest
+from datetime import datetime, timezone
+from eventual.core import Concept, Event
+from eventual.core.concept import bulk_update_states
+
+def test_history_records_state_changes():
+    concept = Concept(concept_id="light_1", name="light", initial_state=1.0)
+    concept.update_state(0.5, reason="Light dimmed")
+    concept.update_state(0.5, reason="No change")  # Same state, not recorded
+
+    history = concept.get_history()
+    assert [entry["state"] for entry in history] == [1.0, 0.5]
+    assert history[0]["reason"] == "Initial state"
+    assert history[1]["delta"] == -0.5
+    assert isinstance(history[1]["timestamp"], datetime)
+    assert history[0]["timestamp"] <= history[1]["timestamp"] <= datetime.now()
+
+def test_to_dict_from_dict_round_trip():
+    concept = Concept(concept_id="light_1", name="light", initial_state=1.0, metadata={"source": "sensor_1"})
+    concept.update_state(0.25, reason="Light dimmed")
+
+    restored = Concept.from_dict(concept.to_dict())
+    assert restored.concept_id == "light_1"
+    assert restored.state == 0.25
+    assert restored.metadata == {"source": "sensor_1"}
+    assert restored.get_history() == concept.get_history()
+
+def test_from_dict_accepts_naive_local_timestamps():
+    timestamp = datetime(2024, 1, 2, 3, 4, 5, 678901)
+    data = {
+        "concept_id": "c1",
+        "name": "sound",
+        "state": 0.5,
+        "history": [{"timestamp": timestamp.isoformat(), "state": 0.5, "delta": None, "reason": "Initial state"}],
+    }
+    restored = Concept.from_dict(data)
+    assert restored.get_history()[0]["timestamp"] == timestamp
+
+def test_history_arrays_expose_columns():
+    concept = Concept(name="temperature", initial_state=0.0)
+    for value in range(1, 10):  # Enough updates to grow the underlying buffers
+        concept.update_state(float(value))
+
+    timestamps, states, deltas = concept.history_arrays()
+    assert len(timestamps) == len(states) == len(deltas) == 10
+    assert states.tolist() == [float(v) for v in range(10)]
+    assert deltas[1:].sum() == 9.0
+    assert not states.flags.writeable
+    assert concept.get_history()[0]["delta"] is None
+
+def test_bulk_update_states_matches_update_state():
+    concepts = [Concept(name=name, initial_state=1.0) for name in ("light", "sound", "heat")]
+
+    deltas = bulk_update_states(concepts, [0.5, 1.0, 2.0], reasons=["dim", "same", "warm"])
+
+    assert deltas.tolist() == [-0.5, 0.0, 1.0]
+    assert [c.state for c in concepts] == [0.5, 1.0, 2.0]
+    assert [len(c.get_history()) for c in concepts] == [2, 1, 2]
+    assert concepts[2].get_history()[-1]["reason"] == "warm"
+
+def test_bulk_update_states_rejects_duplicate_concepts():
+    concept = Concept(name="light")
+    with pytest.raises(ValueError):
+        bulk_update_states([concept, concept], [0.1, 0.2])
+
+
+def test_concept_name_and_event_id_are_interned():
+    a = Concept(name="".join(["li", "ght"]))
+    b = Concept(name="".join(["lig", "ht"]))
+    assert a.name is b.name
+    event = Event(concepts={a}, delta=0.0, event_id="".join(["evt", "_1"]))
+    assert event.event_id is Event(concepts={b}, delta=0.0, event_id="".join(["ev", "t_1"])).event_id
+
+
+def test_get_history_snapshot_is_cached_until_state_changes():
+    concept = Concept(name="light", initial_state=1.0)
+    first = concept.get_history()
+    assert isinstance(first, tuple)
+    assert concept.get_history() is first
+
+    concept.update_state(0.2, reason="dimmed")
+    second = concept.get_history()
+    assert second is not first
+    assert [entry["state"] for entry in second] == [1.0, 0.2]
+
+    bulk_update_states([concept], [0.4])
+    assert len(concept.get_history()) == 3
+
+
+def test_to_dict_writes_utc_iso_timestamps():
+    concept = Concept(name="light", initial_state=1.0)
+    concept.update_state(0.5)
+    timestamps = [entry["timestamp"] for entry in concept.to_dict()["history"]]
+    assert all(ts.endswith("+00:00") for ts in timestamps)
+    assert [datetime.fromisoformat(ts) for ts in timestamps] == [
+        entry["timestamp"].astimezone(timezone.utc) for entry in concept.get_history()
+    ]
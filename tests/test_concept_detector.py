@@ -0,0 +1,339 @@
+import asyncio
+import json
+import os
+import sys
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+import litellm
+
+from eventual.core.concept_detector import ConceptDetector
+
+
+def _llm_response(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+@pytest.fixture
+def detector():
+    return ConceptDetector()
+
+
+def test_batch_sends_one_request_per_batch(detector, monkeypatch):
+    calls = []
+
+    def fake_completion(messages, **kwargs):
+        calls.append(messages[-1]["content"])
+        return _llm_response(json.dumps({"results": [
+            {"concepts": ["light", "room"], "relationships": [["light", "room"]]},
+            {"concepts": ["sound"], "relationships": []},
+        ]}))
+
+    monkeypatch.setattr(litellm, "completion", fake_completion)
+    outputs = detector.detect_concepts_and_build_graph_batch(["The light is on in the room.", "", "I hear a sound."])
+
+    assert len(calls) == 1
+    assert "Text 1:\nThe light is on in the room." in calls[0]
+    assert "Text 2:\nI hear a sound." in calls[0]
+    assert [[c.name for c in output.extracted_concepts] for output in outputs] == [["light", "room"], [], ["sound"]]
+    assert outputs[0].extracted_events[0].concept_identifiers == ["light", "room"]
+    assert outputs[0].extracted_events[0].event_type == "relationship"
+
+
+def test_batch_splits_by_batch_size(detector, monkeypatch):
+    calls = []
+
+    def fake_completion(messages, **kwargs):
+        calls.append(messages)
+        return _llm_response(json.dumps({"results": [{"concepts": ["x"], "relationships": []}] * 2}))
+
+    monkeypatch.setattr(litellm, "completion", fake_completion)
+    detector.min_text_len = 1
+    outputs = detector.detect_concepts_and_build_graph_batch(["a", "b", "c"], batch_size=2)
+
+    assert len(calls) == 2
+    assert len(outputs) == 3
+
+
+def test_single_text_returns_empty_output_on_invalid_json(detector, monkeypatch):
+    monkeypatch.setattr(litellm, "completion", lambda messages, **kwargs: _llm_response("not json"))
+    output = detector.detect_concepts_and_build_graph("The light is on.")
+    assert output.extracted_concepts == []
+    assert output.extracted_events == []
+
+
+def test_adetect_many_limits_concurrency_and_isolates_failures(detector, monkeypatch):
+    in_flight = 0
+    peak = 0
+
+    async def fake_acompletion(messages, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        text = messages[-1]["content"].split("Text 1:\n", 1)[1].split("\n", 1)[0]
+        if text == "fail":
+            return _llm_response("not json")
+        return _llm_response(json.dumps({"results": [{"concepts": [text], "relationships": []}]}))
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+    detector.min_text_len = 1
+    texts = ["a", "b", "fail", "c", "d"]
+    outputs = asyncio.run(detector.adetect_many(texts, max_concurrency=2))
+
+    assert peak == 2
+    assert [[c.name for c in output.extracted_concepts] for output in outputs] == [["a"], ["b"], [], ["c"], ["d"]]
+
+
+def test_stream_detect_yields_elements_as_they_complete(detector, monkeypatch):
+    content = '```json\n{"results": [{"concepts": ["light", "ro\\"om", 3], "relationships": [["light", "ro\\"om"], ["x"]]}]}\n```'
+    pieces = [content[i:i + 7] for i in range(0, len(content), 7)]
+
+    def fake_completion(messages, stream=False, **kwargs):
+        assert stream
+        return iter(SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))]) for piece in pieces)
+
+    monkeypatch.setattr(litellm, "completion", fake_completion)
+    items = list(detector.stream_detect("The light is on in the room."))
+
+    assert [item.name for item in items[:2]] == ["light", 'ro"om']
+    assert len(items) == 3
+    assert items[2].concept_identifiers == ["light", 'ro"om']
+    assert items[2].event_type == "relationship"
+
+
+def test_config_is_parsed_once_until_file_changes(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("llm_settings:\n  model: model-a\n")
+
+    first, second = ConceptDetector(str(config_path)), ConceptDetector(str(config_path))
+    assert first.config is second.config
+    assert first.llm_settings == {"model": "model-a"}
+    assert first.llm_settings is not second.llm_settings
+    with pytest.raises(TypeError):
+        first.config["llm_settings"] = {}
+
+    config_path.write_text("llm_settings:\n  model: model-b\n")
+    os.utime(config_path, ns=(0, os.stat(config_path).st_mtime_ns + 1_000_000))
+    assert ConceptDetector(str(config_path)).llm_settings == {"model": "model-b"}
+
+
+def test_messages_reuse_prebuilt_prompt_and_request_json_mode(detector, monkeypatch):
+    captured = {}
+
+    def fake_completion(messages, **kwargs):
+        captured.update(messages=messages, kwargs=kwargs)
+        return _llm_response(json.dumps({"results": [{"concepts": [], "relationships": []}]}))
+
+    monkeypatch.setattr(litellm, "completion", fake_completion)
+    detector.detect_concepts_and_build_graph("The light is on.")
+
+    system_msg, user_msg = captured["messages"]
+    assert system_msg is ConceptDetector._SYSTEM_MSG
+    assert user_msg["content"] == "Text 1:\nThe light is on."
+    # The default model supports structured outputs, so the answer schema is requested
+    response_format = captured["kwargs"]["response_format"]
+    assert response_format["type"] == "json_schema"
+    assert response_format["json_schema"]["schema"]["required"] == ["results"]
+
+
+@pytest.mark.parametrize("content", [
+    '```json\n{"results": [{"concepts": ["light"]}]}\n```',
+    '```\n{"results": [{"concepts": ["light"]}]}\n```',
+    '{"results": [{"concepts": ["light"]}]}',
+])
+def test_parse_llm_response_strips_code_fences(content):
+    assert ConceptDetector._parse_llm_response(content, 1) == [{"concepts": ["light"]}]
+
+
+def test_build_output_skips_malformed_relationships(detector):
+    output = detector._build_output({
+        "concepts": ["light", "room"],
+        "relationships": [["light", "room"], ["light"], "light-room", None, ["room", "light"]],
+    }, datetime.now())
+    assert [c.name for c in output.extracted_concepts] == ["light", "room"]
+    assert [e.concept_identifiers for e in output.extracted_events] == [["light", "room"]]
+
+
+def test_build_output_deduplicates_concepts_and_pairs(detector):
+    output = detector._build_output({
+        "concepts": ["Gemini", "AI model", "Gemini"],
+        "relationships": [["Gemini", "AI model"], ["AI model", "Gemini"], ["Gemini", "Google"], ["Gemini", "AI model"]],
+    }, datetime.now())
+    assert [c.name for c in output.extracted_concepts] == ["Gemini", "AI model", "Google"]
+    assert [e.concept_identifiers for e in output.extracted_events] == [["Gemini", "AI model"], ["Gemini", "Google"]]
+    # Events of one answer share a single timestamp
+    assert output.extracted_events[0].timestamp is output.extracted_events[1].timestamp
+
+
+def test_build_output_interns_concept_names(detector):
+    output = detector._build_output(json.loads('{"concepts": ["light"], "relationships": [["light", "room"]]}'), datetime.now())
+    event_names = output.extracted_events[0].concept_identifiers
+    assert output.extracted_concepts[0].name is event_names[0]
+    assert event_names[1] is sys.intern("room")
+
+
+def test_repeated_texts_are_served_from_cache(monkeypatch):
+    store = {}
+    detector = ConceptDetector(cache=store)
+    prompts = []
+
+    def fake_completion(messages, **kwargs):
+        prompts.append(messages[-1]["content"])
+        texts = [line for line in messages[-1]["content"].splitlines() if line.startswith("Text ")]
+        return _llm_response(json.dumps({"results": [{"concepts": [f"c{len(prompts)}"]} for _ in texts]}))
+
+    monkeypatch.setattr(litellm, "completion", fake_completion)
+    first = detector.detect_concepts_and_build_graph("The light is on.")
+    outputs = detector.detect_concepts_and_build_graph_batch(["The light is on.", "I hear a sound."])
+
+    assert len(prompts) == 2
+    # Only the uncached text was sent with the second request
+    assert "The light is on." not in prompts[1]
+    assert [c.name for c in outputs[0].extracted_concepts] == [c.name for c in first.extracted_concepts] == ["c1"]
+    assert len(store) == 2
+
+    # Changing the LLM settings changes the cache key
+    detector.set_llm_settings({**detector.llm_settings, "temperature": 0.0})
+    detector.detect_concepts_and_build_graph("The light is on.")
+    assert len(prompts) == 3
+
+
+def test_fences_are_only_stripped_outside_json_mode(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("llm_settings:\n  model: some-unknown-model\n")
+    detector = ConceptDetector(str(config_path))
+    detector._resolve_response_format()
+    assert "response_format" not in detector.llm_settings
+    assert not detector._json_mode
+
+    fenced = '```json\n{"results": [{"concepts": ["light"]}]}\n```'
+    assert ConceptDetector._parse_llm_response(fenced, 1, strip_fences=False) == []
+
+
+
+def test_litellm_is_only_needed_once_the_llm_is_used(monkeypatch):
+    import eventual.core.concept_detector as concept_detector_module
+
+    def fail():
+        raise AssertionError("litellm imported")
+
+    monkeypatch.setattr(concept_detector_module, "_litellm", fail)
+    detector = ConceptDetector()
+    assert detector.detect_concepts_and_build_graph("") == detector.detect_concepts_and_build_graph_batch([""])[0]
+    with pytest.raises(AssertionError):
+        detector._resolve_response_format()
+
+
+def test_transient_errors_are_retried_with_backoff(tmp_path, monkeypatch):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("llm_settings:\n  model: gpt-4o\n  retry:\n    attempts: 3\n    initial: 0.5\n    jitter: 0\n")
+    detector = ConceptDetector(str(config_path))
+    assert "retry" not in detector.llm_settings
+
+    sleeps, calls = [], []
+
+    def fake_completion(messages, **kwargs):
+        assert "retry" not in kwargs
+        calls.append(messages)
+        if len(calls) < 3:
+            raise litellm.RateLimitError("slow down", llm_provider="openai", model="gpt-4o")
+        return _llm_response(json.dumps({"results": [{"concepts": ["light"]}]}))
+
+    monkeypatch.setattr(litellm, "completion", fake_completion)
+    monkeypatch.setattr("eventual.core.concept_detector.time.sleep", sleeps.append)
+    output = detector.detect_concepts_and_build_graph("The light is on.")
+
+    assert [c.name for c in output.extracted_concepts] == ["light"]
+    assert sleeps == [0.5, 1.0]
+
+
+def test_other_errors_are_not_retried(detector, monkeypatch):
+    calls = []
+
+    def fake_completion(messages, **kwargs):
+        calls.append(messages)
+        raise ValueError("bad request")
+
+    monkeypatch.setattr(litellm, "completion", fake_completion)
+    assert detector.detect_concepts_and_build_graph("The light is on.").extracted_concepts == []
+    assert len(calls) == 1
+
+
+def test_short_and_wordless_texts_skip_the_llm(tmp_path, monkeypatch):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("concept_detector:\n  min_text_len: 4\n")
+    detector = ConceptDetector(str(config_path))
+    calls = []
+
+    def fake_completion(messages, **kwargs):
+        calls.append(messages[-1]["content"])
+        return _llm_response(json.dumps({"results": [{"concepts": ["lamp"]}]}))
+
+    monkeypatch.setattr(litellm, "completion", fake_completion)
+    outputs = detector.detect_concepts_and_build_graph_batch(["   ", "ok  ", "?!?!?!", "lamp"])
+
+    assert len(calls) == 1
+    assert "Text 2" not in calls[0]
+    assert [[c.name for c in output.extracted_concepts] for output in outputs] == [[], [], [], ["lamp"]]
+
+
+def test_set_llm_settings_rebuilds_request_kwargs(detector, monkeypatch):
+    models = []
+
+    def fake_completion(messages, **kwargs):
+        models.append((kwargs["model"], "response_format" in kwargs))
+        return _llm_response(json.dumps({"results": [{"concepts": []}]}))
+
+    monkeypatch.setattr(litellm, "completion", fake_completion)
+    detector.detect_concepts_and_build_graph("The light is on.")
+    detector.set_llm_settings({"model": "some-unknown-model", "retry": {"attempts": 1}})
+    detector.detect_concepts_and_build_graph("The light is on.")
+
+    assert models == [("gpt-4o", True), ("some-unknown-model", False)]
+    assert detector.retry_settings["attempts"] == 1
+
+
+def test_long_texts_are_chunked_and_merged(tmp_path, monkeypatch):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("concept_detector:\n  chunk_tokens: 8\n  chunk_overlap: 2\n")
+    detector = ConceptDetector(str(config_path))
+    long_text = " ".join(f"word{n}" for n in range(30))
+    chunks = detector._split_text(long_text)
+    assert len(chunks) > 1
+    assert all(litellm.token_counter(model="gpt-4o", text=chunk) <= 8 for chunk in chunks)
+    assert detector._split_text("The light is on.") == ["The light is on."]
+
+    prompts = []
+
+    def fake_completion(messages, **kwargs):
+        prompts.append(messages[-1]["content"])
+        return _llm_response(json.dumps({"results": [
+            {"concepts": ["word", f"chunk{len(prompts)}"], "relationships": [["word", "text"]]},
+        ] * messages[-1]["content"].count("Text ")}))
+
+    monkeypatch.setattr(litellm, "completion", fake_completion)
+    short_output, long_output = detector.detect_concepts_and_build_graph_batch(["The light is on.", long_text])
+
+    # The short text is batched alone; each chunk of the long text gets its own request
+    assert len(prompts) == 1 + len(chunks)
+    assert [c.name for c in short_output.extracted_concepts] == ["word", "chunk1", "text"]
+    assert [c.name for c in long_output.extracted_concepts][:3] == ["word", "chunk2", "chunk3"]
+    assert len(long_output.extracted_events) == 1
+    # The merged result is cached for the whole text
+    detector.detect_concepts_and_build_graph(long_text)
+    assert len(prompts) == 1 + len(chunks)
+
+
+def test_structured_output_lookup_failures_are_logged(monkeypatch, caplog):
+    from eventual.core.concept_detector import _response_format_for
+
+    def failing_lookup(model):
+        raise Exception(f"Model {model} not found")
+
+    monkeypatch.setattr(litellm, "supports_response_schema", failing_lookup)
+    with caplog.at_level("DEBUG", logger="eventual.core.concept_detector"):
+        assert _response_format_for("unknown-model") is None
+    assert any(record.exc_info for record in caplog.records)
@@ -36,4 +36,11 @@ def test_inject_context_without_knowledge():
     # Check that the separator is not present
     assert "User Query:" not in full_context
 
+
+def test_inject_context_with_custom_template():
+    injector = ContextInjector(template="Background:\n{ctx}\n\nQuestion: {q}")
+    assert injector.inject_context("Concepts: apple.", "Why?") == "Background:\nConcepts: apple.\n\nQuestion: Why?"
+    # The template only applies when there is knowledge context
+    assert injector.inject_context("", "Why?") == "Why?"
+
 # Add more tests for different formatting scenarios or edge cases if needed
@@ -0,0 +1,69 @@
+from eventual.data import DataIntegrator, Event, Relation
+
+
+def test_integrate_relations_merges_duplicates_across_sources():
+    integrator = DataIntegrator(["en"])
+    integrator.integrate_relations(iter([
+        Relation("Q1", "P31", "Q2"),
+        Relation("Q1", "P31", "Q2"),
+        Relation("Q1", "P279", "Q3"),
+    ]), "Wikidata")
+    integrator.integrate_relations([Relation("Q1", "P31", "Q2")], "DBpedia")
+
+    assert [(r.subject_id, r.predicate, r.object_id) for r in integrator.relations] == [
+        ("Q1", "P31", "Q2"),
+        ("Q1", "P279", "Q3"),
+    ]
+    assert integrator.relations[0].sources == {"Wikidata", "DBpedia"}
+    assert integrator.relations[1].sources == {"Wikidata"}
+
+
+def test_integrate_relations_uses_each_relations_source_by_default():
+    integrator = DataIntegrator(["en"])
+    integrator.integrate_relations([
+        Relation("Q1", "P31", "Q2"),
+        Relation("Q1", "P31", "Q2", source="YAGO"),
+    ])
+
+    assert len(integrator.relations) == 1
+    assert integrator.relations[0].sources == {"Wikidata", "YAGO"}
+
+
+def test_resolve_conflicts_prefers_sources_in_priority_order():
+    integrator = DataIntegrator(["en"])
+    integrator.integrate_events([
+        Event("Q1", "Wikidata label", "Wikidata description", "Wikidata"),
+        Event("Q1", "Wikipedia label", "Wikipedia description", "Wikipedia"),
+        Event("Q2", "DBpedia label", "DBpedia description", "DBpedia"),
+        Event("Q2", "Wikipedia label", "Wikipedia description", "Wikipedia"),
+    ])
+    integrator.resolve_conflicts()
+
+    assert integrator.events["Q1"].labels == {"preferred": "Wikidata label"}
+    assert integrator.events["Q1"].descriptions == {"preferred": "Wikidata description"}
+    assert integrator.events["Q2"].labels == {"preferred": "Wikipedia label"}
+    assert integrator.events["Q2"].descriptions == {"preferred": "Wikipedia description"}
+
+
+def test_resolve_conflicts_leaves_unprioritized_sources_unchanged():
+    integrator = DataIntegrator(["en"])
+    integrator.integrate_events([Event("Q1", "Local label", "Local description", "Local archive")])
+    integrator.resolve_conflicts()
+
+    assert integrator.events["Q1"].labels == {"Local archive": "Local label"}
+    assert integrator.events["Q1"].descriptions == {"Local archive": "Local description"}
+
+
+def test_resolve_conflicts_twice_is_a_no_op():
+    integrator = DataIntegrator(["en"])
+    integrator.integrate_events([
+        Event("Q1", "YAGO label", "YAGO description", "YAGO"),
+        Event("Q1", "DBpedia label", "DBpedia description", "DBpedia"),
+    ])
+    integrator.resolve_conflicts()
+    labels, descriptions = integrator.events["Q1"].labels, integrator.events["Q1"].descriptions
+    integrator.resolve_conflicts()
+
+    assert integrator.events["Q1"].labels is labels
+    assert integrator.events["Q1"].descriptions is descriptions
+    assert labels == {"preferred": "DBpedia label"}
@@ -1,6 +1,8 @@
+import importlib.util
+import pickle
 import unittest
 from datetime import datetime, timedelta
-from eventual.core import Hypergraph, Concept, Event
+from eventual.core import Hypergraph, FrozenHypergraph, Concept, Event
 import logging # Import logging
 
 # Configure logging for the test to capture warnings
@@ -125,6 +127,27 @@ class TestHypergraph(unittest.TestCase):
         self.assertEqual(len(hypergraph.concepts), 1) # Should not add a new concept
         self.assertIs(returned_concept, existing_concept) # Should return the original concept instance
 
+    def test_add_concepts_bulk(self):
+        hypergraph = Hypergraph()
+        existing_concept = Concept(concept_id="existing_id_3", name="apple", initial_state=1.0)
+        hypergraph.add_concept(existing_concept)
+        version = hypergraph._version
+
+        new_concept = Concept(concept_id="new_id_1", name="banana", initial_state=0.5)
+        returned_concepts = hypergraph.add_concepts_bulk([
+            Concept(concept_id="different_id_2", name="apples", initial_state=2.0), # Existing lemmatized name
+            new_concept,
+            Concept(concept_id="new_id_1", name="cherry", initial_state=3.0), # ID added earlier in the batch
+            Concept(concept_id="different_id_3", name="bananas", initial_state=4.0), # Name added earlier in the batch
+        ])
+
+        self.assertEqual(len(hypergraph.concepts), 2)
+        self.assertEqual([c.concept_id for c in returned_concepts], ["existing_id_3", "new_id_1", "new_id_1", "new_id_1"])
+        self.assertIs(returned_concepts[0], existing_concept)
+        self.assertIs(hypergraph.get_concept_by_name("banana"), new_concept)
+        self.assertEqual(hypergraph._version, version + 1)
+        self.assertEqual(hypergraph.add_concepts_bulk([]), [])
+
     def test_add_event_single_concept(self):
         hypergraph = Hypergraph()
         concept = Concept(concept_id="light_1", name="light", initial_state=1.0)
@@ -144,6 +167,46 @@ class TestHypergraph(unittest.TestCase):
         self.assertIn(retrieved_concept, hypergraph.events["event_1"].concepts) # Verify concept in event is the stored instance
         self.assertEqual(len(hypergraph.events["event_1"].concepts), 1)
 
+    def test_event_concept_names_str_tracks_concept_reassignment(self):
+        hypergraph = Hypergraph()
+        apple = Concept(concept_id="concept_apple", name="apple", initial_state=1.0)
+        banana = Concept(concept_id="concept_banana", name="banana", initial_state=1.0)
+        hypergraph.add_concept(apple)
+        event = Event(event_id="event_names", concepts={banana, apple}, delta=0.1)
+        self.assertEqual(event.concept_names_str, "apple, banana")
+
+        # add_event replaces the concept set (banana is not in the hypergraph), which must reset the cache
+        hypergraph.add_event(event)
+        self.assertEqual(event.concept_names_str, "apple")
+
+    def test_event_description_cached_refreshes_on_metadata_update(self):
+        concept = Concept(concept_id="concept_light", name="light", initial_state=1.0)
+        event = Event(event_id="event_desc", concepts={concept}, delta=0.25, metadata={"source": "sensor"})
+        self.assertEqual(event.description_cached, 'Event event_desc: Concepts [light], Delta 0.25, Metadata {"source": "sensor"}')
+
+        event.add_metadata("room", "kitchen")
+        self.assertEqual(event.metadata_canonical, '{"room": "kitchen", "source": "sensor"}')
+        self.assertIn('"room": "kitchen"', event.description_cached)
+
+    def test_event_concept_ids_track_concept_reassignment(self):
+        apple = Concept(concept_id="concept_1", name="apple", initial_state=1.0)
+        banana = Concept(concept_id="concept_2", name="banana", initial_state=1.0)
+        event = Event(event_id="event_1", timestamp=datetime.now(), concepts={apple}, delta=0.1)
+        self.assertEqual(event.concept_ids, frozenset({"concept_1"}))
+        self.assertIs(event.concept_ids, event.concept_ids)
+        event.concepts = {apple, banana}
+        self.assertEqual(event.concept_ids, frozenset({"concept_1", "concept_2"}))
+
+    def test_event_pickle_round_trip_recomputes_hash(self):
+        concept = Concept(concept_id="concept_light", name="light", initial_state=1.0)
+        event = Event(event_id="event_pickle", concepts={concept}, delta=0.5, metadata={"source": "sensor"})
+        self.assertNotIn("_hash", event.__getstate__())
+
+        restored = pickle.loads(pickle.dumps(event))
+        self.assertEqual(restored, event)
+        self.assertEqual(hash(restored), hash("event_pickle"))
+        self.assertEqual(restored.description_cached, event.description_cached)
+
     def test_add_event_links_correct_concept_instance(self):
         hypergraph = Hypergraph()
         # Add the original concept instance
@@ -377,5 +440,250 @@ class TestHypergraph(unittest.TestCase):
         self.assertEqual(len(relevant_events), 1)
         self.assertIn(event1, relevant_events)
 
+    def test_concept_events_resolve_through_event_registry(self):
+        hypergraph = Hypergraph()
+        concept1 = Concept(concept_id="concept_1", name="apple", initial_state=1.0)
+        concept2 = Concept(concept_id="concept_2", name="banana", initial_state=1.0)
+        hypergraph.add_concept(concept1)
+        hypergraph.add_concept(concept2)
+        shared = Event(event_id="event_shared", concepts={concept1, concept2}, delta=0.1)
+        only_apple = Event(event_id="event_apple", concepts={concept1}, delta=0.2)
+        hypergraph.add_event(shared)
+        hypergraph.add_event(only_apple)
+
+        self.assertEqual(len(concept1.events), 2)
+        self.assertEqual(set(concept1.events), {shared, only_apple})
+        self.assertEqual(concept1.events & concept2.events, {shared})
+
+        # An event shared by several matched concepts is returned once
+        _, relevant_events = hypergraph.retrieve_knowledge("apples and bananas")
+        self.assertEqual(sorted(e.event_id for e in relevant_events), ["event_apple", "event_shared"])
+
+        # Membership is checked by event ID, without resolving the concept's other events
+        self.assertIn(Event(event_id="event_shared", concepts={concept2}, delta=0.0), concept1.events)
+        self.assertNotIn(only_apple, concept2.events)
+        self.assertNotIn("event_apple", concept1.events)
+
+    def test_concept_shared_between_hypergraphs(self):
+        first, second = Hypergraph(), Hypergraph()
+        concept = Concept(concept_id="concept_shared", name="apple", initial_state=1.0)
+        first.add_concept(concept)
+        second.add_concept(concept)
+        first_event = Event(event_id="event_first", concepts={concept}, delta=0.1)
+        second_event = Event(event_id="event_second", concepts={concept}, delta=0.2)
+        first.add_event(first_event)
+        second.add_event(second_event)
+
+        # The concept lists the events of both hypergraphs, while each hypergraph only sees its own
+        self.assertEqual(set(concept.events), {first_event, second_event})
+        self.assertIn(second_event, concept.events)
+        self.assertEqual(first.get_events_by_concept("concept_shared"), [first_event])
+        self.assertEqual(second.get_events_by_concept("concept_shared"), [second_event])
+
+    def test_retrieve_knowledge_names(self):
+        hypergraph = Hypergraph()
+        concept1 = Concept(concept_id="concept_1", name="apple", initial_state=1.0)
+        concept2 = Concept(concept_id="concept_2", name="banana", initial_state=1.0)
+        hypergraph.add_concept(concept1)
+        hypergraph.add_concept(concept2)
+
+        event1 = Event(event_id="event_1", timestamp=datetime.now() - timedelta(days=1), concepts={concept1}, delta=0.1)
+        event2 = Event(event_id="event_2", timestamp=datetime.now(), concepts={concept1, concept2}, delta=0.2)
+        hypergraph.add_event(event1)
+        hypergraph.add_event(event2)
+
+        names, descriptions = hypergraph.retrieve_knowledge_names("bananas and apples")
+
+        # Names are sorted, descriptions are ordered most recent first
+        self.assertEqual(names, ["apple", "banana"])
+        self.assertEqual(descriptions, [event2.description_cached, event1.description_cached])
+
+        # Names survive a serialization round trip
+        restored = Hypergraph.from_dict(hypergraph.to_dict())
+        self.assertEqual(restored.retrieve_knowledge_names("bananas")[0], ["banana"])
+    def test_get_lemma_runs_spacy_once_per_text(self):
+        hypergraph = Hypergraph()
+        calls = []
+        nlp = hypergraph._nlp
+        hypergraph._nlp = lambda text: calls.append(text) or nlp(text)
+
+        self.assertEqual(hypergraph._get_lemma("apples"), "apple")
+        self.assertEqual(hypergraph._get_lemma("apples"), "apple")
+        self.assertEqual(calls, ["apples"])
+
+    def test_lemma_cache_round_trip(self):
+        import os
+        import tempfile
+        hypergraph = Hypergraph()
+        hypergraph._get_lemma("bananas")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "lemmas.json")
+            hypergraph.save_lemma_cache(path)
+            restored = Hypergraph(lemma_cache_path=path)
+        self.assertEqual(restored._lemma_cache, {"bananas": "banana"})
+    def test_unused_pipeline_components_are_not_loaded(self):
+        hypergraph = Hypergraph()
+        self.assertNotIn("parser", hypergraph._nlp.pipe_names)
+        self.assertNotIn("ner", hypergraph._nlp.pipe_names)
+    def test_retrieve_knowledge_batch_matches_single_queries(self):
+        hypergraph = Hypergraph()
+        apple = Concept(concept_id="concept_1", name="apple", initial_state=1.0)
+        banana = Concept(concept_id="concept_2", name="banana", initial_state=1.0)
+        hypergraph.add_concept(apple)
+        hypergraph.add_concept(banana)
+        event = Event(event_id="event_1", timestamp=datetime.now(), concepts={apple, banana}, delta=0.1)
+        hypergraph.add_event(event)
+
+        queries = ["apples", "bananas and apples", "cherries"]
+        results = hypergraph.retrieve_knowledge_batch(queries, batch_size=2)
+
+        self.assertEqual(len(results), 3)
+        for query, (concepts, events) in zip(queries, results):
+            expected_concepts, expected_events = hypergraph.retrieve_knowledge(query)
+            self.assertEqual(set(concepts), set(expected_concepts))
+            self.assertEqual(events, expected_events)
+        self.assertEqual(results[2], ([], []))
+    def test_keys_are_interned(self):
+        import json
+        import sys
+        hypergraph = Hypergraph()
+        concept = Concept(concept_id="concept_1", name="apples", initial_state=1.0)
+        hypergraph.add_concept(concept)
+        hypergraph.add_event(Event(event_id="event_1", timestamp=datetime.now(), concepts={concept}, delta=0.1))
+        self.assertIs(hypergraph._get_lemma("apples"), sys.intern("apple"))
+
+        # Keys parsed from JSON are fresh strings; the restored dicts use the interned IDs
+        restored = Hypergraph.from_dict(json.loads(json.dumps(hypergraph.to_dict(), default=str)))
+        concept_key, = restored.concepts
+        event_key, = restored.events
+        self.assertIs(concept_key, sys.intern("concept_1"))
+        self.assertIs(event_key, sys.intern("event_1"))
+    def test_get_events_by_concept_set_matches_exact_sets(self):
+        hypergraph = Hypergraph()
+        apple = Concept(concept_id="concept_1", name="apple", initial_state=1.0)
+        banana = Concept(concept_id="concept_2", name="banana", initial_state=1.0)
+        cherry = Concept(concept_id="concept_3", name="cherry", initial_state=1.0)
+        for concept in (apple, banana, cherry):
+            hypergraph.add_concept(concept)
+        pair_1 = Event(event_id="event_1", timestamp=datetime.now(), concepts={apple, banana}, delta=0.1)
+        apple_only = Event(event_id="event_2", timestamp=datetime.now(), concepts={apple}, delta=0.1)
+        triple = Event(event_id="event_3", timestamp=datetime.now(), concepts={apple, banana, cherry}, delta=0.1)
+        pair_2 = Event(event_id="event_4", timestamp=datetime.now(), concepts={banana, apple}, delta=0.1)
+        for event in (pair_1, apple_only, triple, pair_2):
+            hypergraph.add_event(event)
+
+        self.assertEqual(hypergraph.get_events_by_concept_set({"concept_1", "concept_2"}), [pair_1, pair_2])
+        self.assertEqual(hypergraph.get_events_by_concept_set({"concept_1"}), [apple_only])
+        self.assertEqual(hypergraph.get_events_by_concept_set({"concept_3"}), [])
+        self.assertEqual(hypergraph.get_events_by_concept_set({"concept_1", "missing"}), [])
+    def test_get_recent_events_most_recent_first(self):
+        hypergraph = Hypergraph()
+        concept = Concept(concept_id="concept_1", name="apple", initial_state=1.0)
+        hypergraph.add_concept(concept)
+        now = datetime.now()
+        old = Event(event_id="event_old", timestamp=now - timedelta(days=3), concepts={concept}, delta=0.1)
+        recent = Event(event_id="event_recent", timestamp=now - timedelta(minutes=5), concepts={concept}, delta=0.1)
+        tie_1 = Event(event_id="event_tie_1", timestamp=now - timedelta(hours=1), concepts={concept}, delta=0.1)
+        tie_2 = Event(event_id="event_tie_2", timestamp=now - timedelta(hours=1), concepts={concept}, delta=0.1)
+        # Added out of time order
+        for event in (recent, old, tie_1, tie_2):
+            hypergraph.add_event(event)
+
+        self.assertEqual(hypergraph.get_recent_events(timedelta(days=1)), [recent, tie_1, tie_2])
+        self.assertEqual(hypergraph.get_recent_events(timedelta(days=7)), [recent, tie_1, tie_2, old])
+        self.assertEqual(hypergraph.get_recent_events(timedelta(minutes=1)), [])
+    def test_recurring_values_are_interned_on_load(self):
+        import json
+        import sys
+        hypergraph = Hypergraph()
+        concept = Concept(concept_id="concept_1", name="apple", initial_state=1.0)
+        hypergraph.add_concept(concept)
+        hypergraph.add_event(Event(event_id="event_1", timestamp=datetime.now(), concepts={concept}, delta=0.1, event_type="relationship"))
+
+        restored = Hypergraph.from_dict(json.loads(json.dumps(hypergraph.to_dict(), default=str)))
+        self.assertIs(restored.get_event("event_1").event_type, sys.intern("relationship"))
+        reason = restored.get_concept("concept_1").get_history()[0]["reason"]
+        self.assertIs(reason, sys.intern(reason))
+
+    def test_json_round_trip(self):
+        hypergraph = Hypergraph()
+        concept = Concept(concept_id="concept_1", name="apple", initial_state=1.0, metadata={"seen": datetime(2024, 1, 1)})
+        hypergraph.add_concept(concept)
+        hypergraph.add_event(Event(event_id="event_1", timestamp=datetime.now(), concepts={concept}, delta=0.1))
+
+        data = hypergraph.to_json()
+        self.assertIsInstance(data, bytes)
+        restored = Hypergraph.from_json(data)
+        self.assertEqual(restored.get_event("event_1").to_dict(), hypergraph.get_event("event_1").to_dict())
+        self.assertEqual(restored.get_concept("concept_1").get_history(), concept.get_history())
+
+    @unittest.skipUnless(importlib.util.find_spec("orjson"), "orjson is not installed")
+    def test_json_fallback_matches_orjson(self):
+        import numpy as np
+        from eventual.core.hypergraph import _json_dumps, _stdlib_json_dumps
+
+        document = {
+            "seen": datetime(2024, 1, 1, 12, 0),
+            "values": np.array([0.5, np.nan]),
+            "count": np.int64(3),
+            "delta": float("nan"),
+            "name": "café",
+            "nested": [{"ids": (1, 2)}, None],
+            1: "int key",
+        }
+        self.assertEqual(_stdlib_json_dumps(document), _json_dumps(document))
+        self.assertEqual(_stdlib_json_dumps({"ok": [1.5, "x"]}), b'{"ok":[1.5,"x"]}')
+
+    @unittest.skipUnless(importlib.util.find_spec("msgpack"), "msgpack is not installed")
+    def test_msgpack_round_trip(self):
+        hypergraph = Hypergraph()
+        concept = Concept(concept_id="concept_1", name="apple", initial_state=1.0)
+        hypergraph.add_concept(concept)
+        hypergraph.add_event(Event(event_id="event_1", timestamp=datetime.now(), concepts={concept}, delta=0.1))
+
+        restored = Hypergraph.from_msgpack(hypergraph.to_msgpack())
+        self.assertEqual(restored.to_dict(), hypergraph.to_dict())
+    def test_spacy_pipeline_is_loaded_lazily_and_shared(self):
+        first, second = Hypergraph(), Hypergraph()
+        self.assertIsNone(first._nlp_pipeline)
+        self.assertIs(first._nlp, second._nlp)
+    def test_search_concepts_by_name(self):
+        hypergraph = Hypergraph()
+        self.assertEqual(hypergraph.search_concepts_by_name(""), [])
+        self.assertEqual(hypergraph.search_concepts_by_name("apple"), [])
+
+        for i, name in enumerate(["apple", "pineapple", "banana", "grape"]):
+            hypergraph.add_concept(Concept(concept_id=f"concept_{i}", name=name, initial_state=1.0))
+
+        self.assertEqual([c.name for c in hypergraph.search_concepts_by_name("APPLE")], ["apple", "pineapple"])
+        self.assertEqual([c.name for c in hypergraph.search_concepts_by_name("ape")], ["grape"])
+        self.assertEqual(hypergraph.search_concepts_by_name("eb"), [])
+        self.assertEqual(len(hypergraph.search_concepts_by_name("")), 4)
+
+        # The index is rebuilt after a concept is added
+        hypergraph.add_concept(Concept(concept_id="concept_4", name="grapefruit", initial_state=1.0))
+        self.assertEqual([c.name for c in hypergraph.search_concepts_by_name("grape")], ["grape", "grapefruit"])
+
+    def test_freeze(self):
+        hypergraph = Hypergraph()
+        apple = Concept(concept_id="concept_1", name="apple", initial_state=1.0)
+        hypergraph.add_concept(apple)
+        hypergraph.add_event(Event(event_id="event_1", timestamp=datetime.now(), concepts={apple}, delta=0.1))
+
+        frozen = hypergraph.freeze()
+        self.assertIsInstance(frozen, FrozenHypergraph)
+        self.assertEqual(frozen.retrieve_knowledge_names("apples"), hypergraph.retrieve_knowledge_names("apples"))
+        self.assertIs(frozen.add_concept_if_not_exists(Concept(concept_id="other", name="apple")), apple)
+        with self.assertRaises(TypeError):
+            frozen.add_concept(Concept(concept_id="concept_2", name="banana"))
+        with self.assertRaises(TypeError):
+            frozen.add_event(Event(event_id="event_2", timestamp=datetime.now(), concepts={apple}, delta=0.1))
+        with self.assertRaises(TypeError):
+            frozen.concepts["concept_2"] = apple
+
+        restored = FrozenHypergraph.from_dict(hypergraph.to_dict())
+        self.assertIsInstance(restored, FrozenHypergraph)
+        self.assertEqual(len(restored.events), 1)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
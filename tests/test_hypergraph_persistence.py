@@ -1,4 +1,5 @@
 import pytest
+import json
 import os
 import shutil
 from datetime import datetime
@@ -94,4 +95,75 @@ def test_delete_hypergraph_file(persistence_manager, simple_hypergraph):
     # Try deleting a nonexistent file (should not raise an error)
     persistence_manager.delete_hypergraph_file(os.path.join(TEST_DIR, "another_nonexistent_file.json"))
 
-# Add tests for more complex hypergraphs, different data types in metadata, etc. if needed.
+def test_saved_file_is_the_hypergraph_json_document(persistence_manager, simple_hypergraph):
+    persistence_manager.save_hypergraph(simple_hypergraph, TEST_FILE_PATH)
+
+    with open(TEST_FILE_PATH, "rb") as f:
+        saved = json.loads(f.read())
+
+    assert saved == json.loads(simple_hypergraph.to_json())
+
+def test_load_corrupt_file_returns_none(persistence_manager):
+    corrupt_file = os.path.join(TEST_DIR, "corrupt_hypergraph.json")
+    with open(corrupt_file, "w") as f:
+        f.write("{not json")
+
+    assert persistence_manager.load_hypergraph(corrupt_file) is None
+
+def test_save_and_load_ndjson(persistence_manager, simple_hypergraph):
+    ndjson_path = os.path.join(TEST_DIR, "test_hypergraph_data.ndjson")
+    persistence_manager.save_hypergraph(simple_hypergraph, ndjson_path)
+
+    with open(ndjson_path, "rb") as f:
+        kinds = [json.loads(line)["kind"] for line in f]
+    assert kinds == ["concept", "concept", "event"]
+
+    loaded_hypergraph = persistence_manager.load_hypergraph(ndjson_path)
+    assert loaded_hypergraph.to_dict() == simple_hypergraph.to_dict()
+    assert loaded_hypergraph.get_event("e1") in loaded_hypergraph.get_concept("c1").events
+
+def test_interrupted_save_keeps_previous_file(persistence_manager, simple_hypergraph, monkeypatch):
+    ndjson_path = os.path.join(TEST_DIR, "interrupted_hypergraph.ndjson")
+    persistence_manager.save_hypergraph(simple_hypergraph, ndjson_path)
+    with open(ndjson_path, "rb") as f:
+        previous = f.read()
+
+    def interrupted_records():
+        yield b'{"kind": "concept"}\n'
+        raise IOError("disk full")
+
+    monkeypatch.setattr(simple_hypergraph, "iter_ndjson", interrupted_records)
+    with pytest.raises(IOError):
+        persistence_manager.save_hypergraph(simple_hypergraph, ndjson_path)
+
+    with open(ndjson_path, "rb") as f:
+        assert f.read() == previous
+    assert [name for name in os.listdir(TEST_DIR) if name.endswith(".tmp")] == []
+
+@pytest.mark.parametrize("file_name", ["compressed_hypergraph.json.zst", "compressed_hypergraph.ndjson.zst"])
+def test_save_and_load_zstd(persistence_manager, simple_hypergraph, file_name):
+    zstandard = pytest.importorskip("zstandard")
+    zst_path = os.path.join(TEST_DIR, file_name)
+    persistence_manager.save_hypergraph(simple_hypergraph, zst_path)
+
+    with open(zst_path, "rb") as f:
+        assert f.read(4) == zstandard.FRAME_HEADER
+
+    loaded_hypergraph = persistence_manager.load_hypergraph(zst_path)
+    assert loaded_hypergraph.to_dict() == simple_hypergraph.to_dict()
+
+def test_saved_file_permissions(persistence_manager, simple_hypergraph):
+    new_file = os.path.join(TEST_DIR, "permissions_hypergraph.json")
+    umask = os.umask(0o022)
+    try:
+        persistence_manager.save_hypergraph(simple_hypergraph, new_file)
+    finally:
+        os.umask(umask)
+    assert os.stat(new_file).st_mode & 0o777 == 0o644
+
+    # Saving over an existing file keeps its mode
+    os.chmod(new_file, 0o640)
+    persistence_manager.save_hypergraph(simple_hypergraph, new_file)
+    assert os.stat(new_file).st_mode & 0o777 == 0o640
+
+# Add tests for more complex hypergraphs, different data types in metadata, etc. if needed.
\ No newline at end of file
@@ -0,0 +1,21 @@
+from eventual.core import Concept, Event
+from eventual.core.identifiers import generate_id, use_uuid4_ids
+
+def test_generate_id_is_unique_and_prefixed():
+    ids = {generate_id("concept") for _ in range(1000)}
+    assert len(ids) == 1000
+    assert all(i.startswith("concept_") for i in ids)
+
+def test_concept_and_event_use_generated_ids():
+    concept = Concept(name="light")
+    event = Event(concepts={concept}, delta=0.1)
+    assert concept.concept_id.startswith("concept_")
+    assert event.event_id.startswith("event_")
+
+def test_use_uuid4_ids():
+    use_uuid4_ids(True)
+    try:
+        generated = generate_id("event")
+    finally:
+        use_uuid4_ids(False)
+    assert len(generated) == len("event_") + 32
@@ -0,0 +1,31 @@
+import numpy as np
+
+from eventual.processors import ConceptGraph
+from eventual.processors.processor_output import ProcessorOutput, ExtractedConcept, ExtractedEvent
+
+
+def test_concept_graph_indexes_concepts_and_edges():
+    output = ProcessorOutput(
+        extracted_concepts=[ExtractedConcept(name="light"), ExtractedConcept(name="room")],
+        extracted_events=[
+            ExtractedEvent(concept_identifiers=["light", "room"], event_type="relationship"),
+            ExtractedEvent(concept_identifiers=["room", "lamp"], event_type="relationship"),
+            ExtractedEvent(concept_identifiers=["light"], event_type="phase_shift"),
+        ],
+    )
+    graph = output.to_concept_graph()
+
+    assert graph.concepts == ["light", "room", "lamp"]
+    assert graph.edges.dtype == np.int32
+    assert graph.edges.tolist() == [[0, 1], [1, 2]]
+
+    adjacency = graph.to_scipy_csr()
+    assert adjacency.shape == (3, 3)
+    assert adjacency[0, 1] == 1 and adjacency[1, 0] == 0
+
+
+def test_concept_graph_of_empty_output():
+    graph = ConceptGraph.from_processor_output(ProcessorOutput())
+    assert graph.concepts == []
+    assert graph.edges.shape == (0, 2)
+    assert graph.to_scipy_csr().shape == (0, 0)
@@ -1,14 +1,29 @@
 import pytest
 from datetime import datetime
 from eventual.core.sensor import TextSensor, NumericalSensor, CompositeSensor
+from eventual.processors.text_processor import TextProcessor
 
 def test_text_sensor():
     sensor = TextSensor("text_sensor_1")
     reading = sensor.read_data("The light is too bright.")
     assert "light" in [concept.name for concept in reading.extracted_concepts]
+    assert sensor.get_last_reading() is reading
     assert sensor.last_reading_timestamp is not None
 
 
+def test_text_sensor_read_batch_matches_read_data():
+    texts = ["The light is too bright.", "", "The sound is loud and the light is dim.", "Nothing relevant here."]
+    sensor = TextSensor("text_sensor_1")
+    sensor.read_data(texts[0])  # Cached before the batch
+    outputs = sensor.read_batch(texts)
+    expected = [TextProcessor().extract_concepts(text) for text in texts]
+    assert [{c.name: c.initial_state for c in o.extracted_concepts} for o in outputs] == \
+        [{c.name: c.initial_state for c in o.extracted_concepts} for o in expected]
+    assert sensor.get_last_reading() is outputs[-1]
+    # Batch results are cached too
+    assert sensor.read_data(texts[2]) is outputs[2]
+
+
 def test_numerical_sensor():
     sensor = NumericalSensor("light_sensor_1", "light", units="lux")
     reading = sensor.read_data(0.7)
@@ -17,6 +32,14 @@ def test_numerical_sensor():
     assert sensor.last_reading_timestamp is not None
 
 
+def test_numerical_sensor_read_batch():
+    sensor = NumericalSensor("light_sensor_1", "light", units="lux")
+    values = [0.7, 0.2, 1.5]
+    reading = sensor.read_batch(values)
+    assert reading["values"].tolist() == [sensor.read_data(v)["value"] for v in values]
+    assert reading["units"] == "lux"
+
+
 def test_composite_sensor():
     text_sensor = TextSensor("text_sensor_1")
     light_sensor = NumericalSensor("light_sensor_1", "light", units="lux")
@@ -30,4 +53,192 @@ def test_composite_sensor():
     assert "readings" in reading
     assert "text" in reading["readings"]
     assert "light" in reading["readings"]
-    assert composite_sensor.last_reading_timestamp is not None
\ No newline at end of file
+    assert composite_sensor.last_reading_timestamp is not None
+
+
+def test_text_sensor_caches_repeated_text():
+    text_processor = TextProcessor()
+    sensor = TextSensor("text_sensor_1", text_processor=text_processor)
+    calls = []
+    extract_concepts = text_processor.extract_concepts
+    text_processor.extract_concepts = lambda text: calls.append(text) or extract_concepts(text)
+
+    first = sensor.read_data("The light is too bright.")
+    assert sensor.read_data("The light is too bright.") is first
+    assert calls == ["The light is too bright."]
+
+    # Changing the concept map invalidates cached results
+    text_processor.update_concept_map("light", ["glow"])
+    sensor.read_data("The light is too bright.")
+    assert len(calls) == 2
+
+    sensor.clear_cache()
+    sensor.read_data("The light is too bright.")
+    assert len(calls) == 3
+
+
+def test_text_sensor_read_batch_cache_handling():
+    text_processor = TextProcessor()
+    batches = []
+    extract_concepts_batch = text_processor.extract_concepts_batch
+    text_processor.extract_concepts_batch = lambda texts: batches.append(list(texts)) or extract_concepts_batch(texts)
+    sensor = TextSensor("text_sensor_1", text_processor=text_processor, cache_size=2)
+
+    # A text repeated within the batch is extracted once
+    outputs = sensor.read_batch(["a light", "a sound", "a light"])
+    assert batches == [["a light", "a sound"]]
+    assert outputs[0] is outputs[2]
+
+    # Re-reading "a light" makes it the most recently used entry, so "a sound" is evicted first
+    sensor.read_batch(["a light"])
+    sensor.read_data("a door")
+    assert [text for text, _ in sensor._cache] == ["a light", "a door"]
+
+    # A negative cache size disables caching, as for read_data
+    uncached = TextSensor("text_sensor_2", text_processor=text_processor, cache_size=-1)
+    assert len(uncached.read_batch(["a light", "a sound"])) == 2
+    assert len(uncached._cache) == 0
+
+
+class _SlowSensor(NumericalSensor):
+    def __init__(self, sensor_id, delay, fail=False):
+        super().__init__(sensor_id, sensor_id)
+        self.delay = delay
+        self.fail = fail
+
+    def read_data(self):
+        import time
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("sensor offline")
+        return super().read_data(0.5)
+
+
+class _BarrierSensor(NumericalSensor):
+    def __init__(self, sensor_id, barrier):
+        super().__init__(sensor_id, sensor_id)
+        self.barrier = barrier
+
+    def read_data(self):
+        # Only returns once every child is being read at the same time; read one after another,
+        # the barrier times out and the child reports an error
+        self.barrier.wait()
+        return super().read_data(0.5)
+
+
+def test_composite_sensor_reads_children_concurrently():
+    import threading
+    barrier = threading.Barrier(4, timeout=5)
+    with CompositeSensor("composite", {
+        f"child_{i}": _BarrierSensor(f"child_{i}", barrier) for i in range(4)
+    }) as composite_sensor:
+        reading = composite_sensor.read_data()
+    assert list(reading["readings"]) == [f"child_{i}" for i in range(4)]
+    assert all(child["value"] == 0.5 for child in reading["readings"].values())
+
+
+def test_composite_sensor_shuts_down_its_pool():
+    import gc
+    with CompositeSensor("composite", {"probe": _ProbeSensor("probe", "light")}) as composite_sensor:
+        composite_sensor.read_data()
+        pool = composite_sensor._pool
+    assert pool._shutdown and composite_sensor._pool is None
+
+    # A sensor that is never closed stops its pool when it is garbage collected
+    composite_sensor = CompositeSensor("composite", {"probe": _ProbeSensor("probe", "light")})
+    composite_sensor.read_data()
+    pool = composite_sensor._pool
+    del composite_sensor
+    gc.collect()
+    assert pool._shutdown
+
+
+def test_composite_sensor_read_data_async_reports_errors():
+    import asyncio
+    composite_sensor = CompositeSensor("composite", {
+        "ok": _SlowSensor("ok", 0.0),
+        "broken": _SlowSensor("broken", 0.0, fail=True),
+    })
+    reading = asyncio.run(composite_sensor.read_data_async())
+    composite_sensor.close()
+    assert reading["readings"]["ok"]["value"] == 0.5
+    assert reading["readings"]["broken"] == {"error": "sensor offline"}
+
+
+class _ProbeSensor(NumericalSensor):
+    def read_data(self, timestamp=None):
+        return super().read_data(0.5, timestamp=timestamp)
+
+
+def test_composite_sensor_shares_one_timestamp():
+    composite_sensor = CompositeSensor("composite", {
+        "a": _ProbeSensor("a", "light"),
+        "b": _ProbeSensor("b", "sound"),
+        "slow": _SlowSensor("slow", 0.0),
+    })
+    reading = composite_sensor.read_data()
+    composite_sensor.close()
+    timestamp = reading["timestamp"]
+    assert composite_sensor.last_reading_timestamp is timestamp
+    assert reading["readings"]["a"]["timestamp"] is timestamp
+    assert reading["readings"]["b"]["timestamp"] is timestamp
+    # Sensors whose read_data takes no timestamp are still read and stamp their own time
+    assert reading["readings"]["slow"]["timestamp"] is not timestamp
+
+
+def test_text_sensor_read_data_async():
+    import asyncio
+    sensor = TextSensor("text_sensor_1")
+    reading = asyncio.run(sensor.read_data_async("The light is too bright."))
+    assert "light" in [concept.name for concept in reading.extracted_concepts]
+    # A cached result is returned without going through the executor
+    assert asyncio.run(sensor.read_data_async("The light is too bright.")) is reading
+
+
+def test_composite_sensor_read_data_async_nested():
+    import asyncio
+    inner = CompositeSensor("inner", {"probe": _ProbeSensor("probe", "light")})
+    outer = CompositeSensor("outer", {"inner": inner, "slow": _SlowSensor("slow", 0.0)})
+    reading = asyncio.run(outer.read_data_async())
+    assert reading["readings"]["inner"]["readings"]["probe"]["value"] == 0.5
+    assert reading["readings"]["slow"]["value"] == 0.5
+
+
+def test_sensor_last_reading_shims():
+    sensor = NumericalSensor("light_sensor_1", "light", units="lux")
+    assert sensor.last_reading is None and sensor.last_reading_timestamp is None
+    reading = sensor.read_data(0.7)
+    assert sensor.last_reading is reading
+    assert sensor.last_reading_timestamp is reading["timestamp"]
+    # Assigning one attribute keeps the other
+    sensor.last_reading = {"value": 0.1}
+    assert sensor.last_reading_timestamp is reading["timestamp"]
+    assert sensor.get_last_reading() == {"value": 0.1}
+
+
+def test_composite_sensor_child_sensors_mapping():
+    probe = _ProbeSensor("probe", "light")
+    composite_sensor = CompositeSensor("composite", {"probe": probe})
+    assert dict(composite_sensor.child_sensors) == {"probe": probe}
+    with pytest.raises(TypeError):
+        composite_sensor.child_sensors["other"] = probe
+    composite_sensor.read_data()
+    composite_sensor.child_sensors = {"a": probe, "b": _ProbeSensor("b", "sound")}
+    assert list(composite_sensor.read_data()["readings"]) == ["a", "b"]
+    composite_sensor.close()
+
+
+def test_sensor_subclass_must_override_read_data():
+    from eventual.core.sensor import Sensor
+    with pytest.raises(TypeError):
+        class _Incomplete(Sensor):
+            pass
+    with pytest.raises(TypeError):
+        Sensor("sensor_1", "generic")
+
+
+def test_text_sensors_share_default_processor():
+    first, second = TextSensor("text_sensor_1"), TextSensor("text_sensor_2")
+    assert first._text_processor is second._text_processor
+    own = TextProcessor()
+    assert TextSensor("text_sensor_3", text_processor=own)._text_processor is own
@@ -112,3 +112,59 @@ def test_generate_context_only_recent_time_window(hypergraph_with_history):
 # - Cases with no concepts or events in hypergraph
 # - Edge cases with time windows (e.g., very small or large window)
 # - Interaction with future summarization logic
+
+def test_generate_context_uses_cache_until_hypergraph_changes(hypergraph_with_history):
+    adapter = SituationalAwarenessAdapter(hypergraph=hypergraph_with_history)
+    query = "tell me about apples"
+    first = adapter.generate_context(query)
+    assert len(adapter._cache) == 1
+    assert adapter.generate_context(query) is first
+
+    # Adding an event bumps the hypergraph version, so the cached context is not reused
+    apple = hypergraph_with_history.get_concept("concept_1")
+    hypergraph_with_history.add_event(Event(event_id="event_5_new", concepts={apple}, delta=0.5))
+    updated = adapter.generate_context(query)
+    assert "Event event_5_new:" in updated
+    assert "event_5_new" not in first
+
+    adapter.clear_cache()
+    assert len(adapter._cache) == 0
+
+def test_generate_context_cache_expires_with_time_window(hypergraph_with_history):
+    adapter = SituationalAwarenessAdapter(hypergraph=hypergraph_with_history)
+    window = timedelta(minutes=10)
+    adapter.generate_context("", recent_time_window=window)
+    key = ("", window, hypergraph_with_history._version)
+    context, expires_at = adapter._cache[key]
+    # The oldest recent event is 5 minutes old, so the entry expires in roughly 5 minutes
+    assert expires_at is not None
+    assert timedelta(minutes=4) < expires_at - datetime.now() <= timedelta(minutes=5)
+
+def test_generate_context_cache_is_bounded(hypergraph_with_history):
+    adapter = SituationalAwarenessAdapter(hypergraph=hypergraph_with_history, cache_size=2)
+    for query in ("apples", "bananas", "oranges"):
+        adapter.generate_context(query)
+    assert len(adapter._cache) == 2
+    assert ("apples", None, hypergraph_with_history._version) not in adapter._cache
+
+def test_generate_context_orders_events_most_recent_first(hypergraph_with_history):
+    adapter = SituationalAwarenessAdapter(hypergraph=hypergraph_with_history)
+    context = adapter.generate_context("tell me about bananas", recent_time_window=timedelta(minutes=10))
+    event_lines = [line for line in context.splitlines() if line.startswith("Event ")]
+    # event_1_old matches the query and event_4_recent is both recent and query-relevant: each appears once
+    assert len(event_lines) == 3
+    assert event_lines[-1].startswith("Event event_1_old:")
+
+def test_adapter_accepts_hypergraph_like_objects():
+    class FakeHypergraph:
+        def retrieve_knowledge(self, query):
+            return [], []
+
+        def retrieve_knowledge_names(self, query):
+            return ["apple"], []
+
+        def get_recent_events(self, time_window):
+            return []
+
+    adapter = SituationalAwarenessAdapter(hypergraph=FakeHypergraph())
+    assert adapter.generate_context("apples") == "Concepts related to the query: apple."
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from eventual.core import Concept, TemporalBoundary, TemporalBoundaryConfig, Event
 
@@ -40,4 +41,54 @@ def test_exponential_decay():
 
     # Check that the threshold has increased
     event = detector.detect_event(concept, 0.3)
-    assert event is not None
\ No newline at end of file
+    assert event is not None
+
+
+def test_dynamic_threshold_matches_full_history():
+    config = TemporalBoundaryConfig(threshold=0.1, decay_factor=0.9)
+    detector = TemporalBoundary(config)
+    deltas = [0.3, 0.1, 0.5, 0.2, 0.4, 0.05, 0.25]
+    for n, delta in enumerate(deltas, start=1):
+        threshold = detector._calculate_dynamic_threshold("light_1", delta)
+        expected = sum(d * config.decay_factor ** i for i, d in enumerate(reversed(deltas[:n]))) / n
+        assert threshold == pytest.approx(config.threshold * (1 + expected))
+
+
+def test_detect_events_batch_matches_detect_event():
+    config = TemporalBoundaryConfig(threshold=0.1, decay_factor=0.5)
+    batch_detector = TemporalBoundary(config)
+    single_detector = TemporalBoundary(config)
+    concepts = [Concept(concept_id=f"c{i}", name=f"c{i}", initial_state=1.0) for i in range(5)]
+    # c0 appears twice, so its second change must see the first
+    batch = concepts + [concepts[0]]
+    for new_states in ([0.95, 0.8, 0.5, 1.0, 0.7, 0.6], [0.9, 0.7, 0.2, 0.85, 0.65, 0.1]):
+        expected = [single_detector.detect_event(c, s) for c, s in zip(batch, new_states)]
+        events = batch_detector.detect_events_batch(batch, np.array(new_states))
+        assert [e is None for e in events] == [e is None for e in expected]
+        for event, expected_event in zip(events, expected):
+            if event is not None:
+                assert event.event_id == expected_event.event_id
+                assert event.delta == expected_event.delta
+
+
+def test_detect_events_batch_rejects_mismatched_lengths():
+    detector = TemporalBoundary()
+    concept = Concept(concept_id="light_1", name="light", initial_state=1.0)
+    with pytest.raises(ValueError):
+        detector.detect_events_batch([concept], [0.5, 0.4])
+    assert detector.detect_events_batch([], []) == []
+
+
+def test_threshold_kernels_agree():
+    from eventual.core._boundary_kernels import _update_thresholds_loop, _update_thresholds_numpy
+    rng = np.random.default_rng(0)
+    for rows in (np.array([0, 1, 2, 3], dtype=np.intp), np.array([0, 2, 0, 1, 2, 0], dtype=np.intp)):
+        deltas = rng.random(len(rows))
+        outputs = []
+        for kernel in (_update_thresholds_loop, _update_thresholds_numpy):
+            decayed_sum, count = np.full(4, 0.3), np.full(4, 2, dtype=np.int64)
+            thresholds, event_numbers = np.empty(len(rows)), np.empty(len(rows), dtype=np.int64)
+            kernel(decayed_sum, count, rows, deltas, 0.9, 0.1, thresholds, event_numbers)
+            outputs.append((decayed_sum, count, thresholds, event_numbers))
+        for expected, actual in zip(*outputs):
+            np.testing.assert_array_equal(expected, actual)